@@ -0,0 +1,5 @@
+"""
+Benchmark throughput & konvergensi GA.
+
+Jalankan:  python -m benchmarks --scales 1 2 5 --out bench.json
+"""
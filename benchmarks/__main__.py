@@ -0,0 +1,209 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import random
+import contextlib
+import io
+import tempfile
+
+import numpy as np
+
+from ga_core.data_loader import load_all_data, BACKEND_PANDAS, BACKEND_CSV
+from ga_core.class_table import ClassTable
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.incremental import IncrementalEvaluator
+from ga_core.room_decoder import RoomDecoder
+import ga_core.operators as ops
+from benchmarks.instances import scale_instance, random_individuals
+from benchmarks.synthetic import write_synthetic_inputs
+
+# ===============================
+# KONFIGURASI DEFAULT
+# ===============================
+DEFAULT_PARAMS = {
+    'pop_size': 30,
+    'max_generations': 200,
+    'crossover_rate': 0.8,
+    'mutation_rate': 0.05,
+    'elitism': 2,
+}
+
+def _timeit(fn, repeat, setup=None):
+    """Jalankan fn sebanyak repeat kali, return statistik detik per panggilan."""
+    times = []
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        fn(arg) if setup else fn()
+        times.append(time.perf_counter() - start)
+    return {
+        "calls": repeat,
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "mean_s": statistics.fmean(times),
+    }
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+def bench_components(data, params, seed, repeat):
+    """Waktu per panggilan untuk fitness, operator, local search & 1 generasi."""
+    engine = GeneticAlgorithm(data, dict(params, seed=seed))
+    table, calc, ls = engine.table, engine.fitness_calc, engine.ls_engine
+    pool = random_individuals(table, params['pop_size'], seed)
+    rng = random.Random(seed)
+    pick = lambda: rng.choice(pool).copy()
+    decoder = RoomDecoder(table, calc)
+
+    results = {
+        "fitness.calculate": _timeit(lambda ind: calc.calculate(ind), repeat, pick),
+        "fitness.calculate_batch": _timeit(lambda: calc.calculate_batch(pool), repeat),
+        "operators.crossover": _timeit(
+            lambda pair: ops.crossover(pair[0], pair[1], params['crossover_rate'], rng=rng),
+            repeat, lambda: (pick(), pick())),
+        "operators.mutation": _timeit(
+            lambda ind: ops.mutation(ind, params['mutation_rate'], rng=rng),
+            repeat, pick),
+        "local_search.resolve_conflicts": _timeit(
+            lambda ind: ls.resolve_conflicts(ind, rng=rng), repeat, pick),
+        "repair_engine.repair": _timeit(
+            lambda ind: engine.repair_engine.repair(ind, rng=rng), repeat, pick),
+        "local_search.apply_load_balancing": _timeit(
+            lambda ind: ls.apply_load_balancing(ind, rng=rng), repeat, pick),
+        "room_decoder.decode": _timeit(
+            lambda ind: decoder.decode(ind.slot_ids), repeat, pick),
+        "incremental.delta": _timeit(
+            lambda ev: ev.delta(rng.randrange(table.n_classes), slot=rng.choice(table.slot_ids)),
+            repeat, lambda: IncrementalEvaluator(calc, pick())),
+    }
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.initialize_population()
+    results["ga.evolve_generation"] = _timeit(engine.evolve_generation, max(1, repeat // 5))
+    results["local_search.optimal_assignment"] = _timeit(
+        lambda ind: ls.optimal_assignment(ind, rng=rng), max(1, repeat // 5), lambda: engine.population[0].clone())
+    engine.executor.close()
+    return results
+
+def bench_convergence(data, params, seed):
+    """Waktu & generasi sampai jadwal bebas konflik (time-to-zero-conflicts)."""
+    engine = GeneticAlgorithm(data, dict(params, seed=seed))
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.initialize_population()
+    generation = 0
+    while engine.population[0].n_conflicts > 0 and generation < params['max_generations']:
+        engine.evolve_generation()
+        generation += 1
+    elapsed = time.perf_counter() - start
+    engine.executor.close()
+    best = engine.population[0]
+    return {
+        "seconds": elapsed,
+        "generations": generation,
+        "reached_zero": best.n_conflicts == 0,
+        "best_conflicts": best.n_conflicts,
+        "best_fitness": best.fitness,
+    }
+
+def bench_loader(factor, seed, repeat):
+    """Waktu load_all_data pada input CSV sintetis factor x (tiap backend + cache)."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = write_synthetic_inputs(os.path.join(tmp, "data"), factor)
+        cache_dir = os.path.join(tmp, "cache")
+        quiet = contextlib.redirect_stdout(io.StringIO())
+        with quiet:
+            for backend in (BACKEND_PANDAS, BACKEND_CSV):
+                try:
+                    results[f"load.{backend}"] = _timeit(
+                        lambda: load_all_data(seed, use_cache=False, data_dir=data_dir, backend=backend), repeat)
+                except ImportError:
+                    continue
+            load_all_data(seed, cache_dir=cache_dir, data_dir=data_dir)  # isi cache
+            results["load.cached"] = _timeit(
+                lambda: load_all_data(seed, cache_dir=cache_dir, data_dir=data_dir), repeat)
+            data = load_all_data(seed, cache_dir=cache_dir, data_dir=data_dir)
+        results["class_table.from_data"] = _timeit(lambda: ClassTable.from_data(data), repeat)
+        size = {"n_classes": len(data['classes']), "n_pref_rows": len(data['pref_info'])}
+    return size, results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark throughput & konvergensi GA")
+    parser.add_argument("--scales", type=int, nargs="*", default=[1, 2, 5], help="Faktor skala instance (1 = data asli)")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2], help="Seed untuk uji konvergensi")
+    parser.add_argument("--repeat", type=int, default=20, help="Jumlah ulangan per mikro-benchmark")
+    parser.add_argument("--pop-size", type=int, default=DEFAULT_PARAMS['pop_size'])
+    parser.add_argument("--max-generations", type=int, default=DEFAULT_PARAMS['max_generations'])
+    parser.add_argument("--seed-ratio", type=float, default=0.0, help="Porsi populasi awal dari seeding konstruktif")
+    parser.add_argument("--repair-engine", default="fihc", choices=["fihc", "tabu", "annealing"],
+                        help="Engine repair konflik yang diukur")
+    parser.add_argument("--loader-scales", type=int, nargs="*", default=[],
+                        help="Faktor input CSV sintetis untuk benchmark loader (mis. 1 10 100)")
+    parser.add_argument("--skip-convergence", action="store_true")
+    parser.add_argument("--out", default="bench_results.json", help="File output JSON")
+    args = parser.parse_args(argv)
+
+    params = dict(DEFAULT_PARAMS, pop_size=args.pop_size, max_generations=args.max_generations,
+                  seed_ratio=args.seed_ratio, repair_engine=args.repair_engine)
+    with contextlib.redirect_stdout(io.StringIO()):
+        base = load_all_data(seed=args.seeds[0])
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "params": params,
+            "seeds": args.seeds,
+        },
+        "instances": [],
+        "loader": [],
+    }
+
+    for factor in args.loader_scales:
+        size, stats = bench_loader(factor, args.seeds[0], max(1, args.repeat // 5))
+        print(f"[Bench] loader {factor}x: {size['n_classes']} kelas, {size['n_pref_rows']} preferensi")
+        for name, stat in stats.items():
+            print(f"    {name:<36} {stat['median_s'] * 1000:10.3f} ms")
+        report["loader"].append(dict(scale=factor, **size, timings=stats))
+
+    for factor in args.scales:
+        data = scale_instance(base, factor)
+        entry = {
+            "scale": factor,
+            "n_classes": len(data['classes']),
+            "n_rooms": len(data['rooms']),
+            "n_slots": len(data['slots']),
+        }
+        print(f"[Bench] skala {factor}x: {entry['n_classes']} kelas, {entry['n_rooms']} ruang, {entry['n_slots']} slot")
+        entry["components"] = bench_components(data, params, args.seeds[0], args.repeat)
+        for name, stat in entry["components"].items():
+            print(f"    {name:<36} {stat['median_s'] * 1000:10.3f} ms")
+
+        if not args.skip_convergence:
+            entry["convergence"] = []
+            for seed in args.seeds:
+                result = dict(bench_convergence(data, params, seed), seed=seed)
+                entry["convergence"].append(result)
+                print(f"    time-to-zero seed={seed}: {result['seconds']:.2f} s, {result['generations']} gen, konflik={result['best_conflicts']}")
+        report["instances"].append(entry)
+
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Hasil benchmark disimpan di: {args.out}")
+
+if __name__ == "__main__":
+    main()
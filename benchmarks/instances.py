@@ -0,0 +1,51 @@
+import random
+
+# ===============================
+# INSTANCE SINTETIS (SKALA N x)
+# ===============================
+def scale_instance(data, factor):
+    """
+    Perbesar problem hasil load_all_data() sebanyak `factor` kali.
+    - slot  : hari di-replikasi (senin, senin_2, ...) -> slot x factor
+    - ruang : ruang di-replikasi (F2.1, F2.1_2, ...)  -> ruang x factor
+    - kelas : kurikulum di-replikasi dengan kode MK & dosen bersufiks,
+              sehingga setiap salinan punya kandidat dosennya sendiri.
+    Rasio kelas : ruang : slot tetap sama dengan data asli.
+    """
+    if factor == 1:
+        return data
+
+    def tag(value, k):
+        return value if k == 0 else f"{value}_{k + 1}"
+
+    slots, rooms, classes = [], [], []
+    candidates, pref_info = {}, {}
+    for k in range(factor):
+        for s in data['slots']:
+            slots.append(dict(s, Hari=tag(s['Hari'], k), slot_id=len(slots)))
+        for r in data['rooms']:
+            rooms.append(dict(r, Ruang=tag(r['Ruang'], k), room_id=len(rooms)))
+        for c in data['classes']:
+            unknown = "Unknown" in c['dosen']
+            classes.append(dict(
+                c, class_id=len(classes),
+                kode_mk=tag(c['kode_mk'], k),
+                dosen=c['dosen'] if unknown else tag(c['dosen'], k),
+            ))
+        for kode, dosen_list in data['candidates'].items():
+            candidates[tag(kode, k)] = [tag(d, k) for d in dosen_list]
+        for (dosen, kode), info in data['pref_info'].items():
+            pref_info[(tag(dosen, k), tag(kode, k))] = info
+
+    return {"slots": slots, "rooms": rooms, "classes": classes,
+            "candidates": candidates, "pref_info": pref_info}
+
+def random_individuals(table, n, seed):
+    from ga_core.individual import Individual
+    rng = random.Random(seed)
+    population = []
+    for _ in range(n):
+        ind = Individual(table)
+        ind.initialize_random(rng)
+        population.append(ind)
+    return population
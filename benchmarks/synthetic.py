@@ -0,0 +1,42 @@
+import csv
+import os
+from ga_core.data_loader import DATA_PATH, DATA_FILES
+
+# ===============================
+# INPUT CSV SINTETIS (SKALA N x)
+# ===============================
+# Untuk benchmark loader: file di data/ direplikasi `factor` kali dengan kode MK,
+# nama dosen, ruang & hari bersufiks, sehingga tiap salinan adalah "prodi" baru
+# yang berdiri sendiri (mirip memuat seluruh fakultas).
+
+# Kolom yang diberi sufiks per salinan, per file
+_TAGGED_COLUMNS = {
+    "slots": ["hari"],
+    "rooms": ["Ruang Kelas"],
+    "preferences": ["Kode MK", "Nama Dosen"],
+    "mk_wajib": ["Kode MK", "Nama MK"],
+    "mk_pilihan": ["Kode MK", "Nama MK"],
+}
+
+def write_synthetic_inputs(out_dir, factor, src_dir=None):
+    """Tulis 6 CSV input berukuran `factor` x data asli ke out_dir. Return out_dir."""
+    src_dir = src_dir or DATA_PATH
+    os.makedirs(out_dir, exist_ok=True)
+    for name, filename in DATA_FILES.items():
+        with open(os.path.join(src_dir, filename), newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            fields, rows = reader.fieldnames, list(reader)
+        tagged = _TAGGED_COLUMNS.get(name)
+        with open(os.path.join(out_dir, filename), "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            if tagged is None:
+                # Jumlah mahasiswa per angkatan tidak ikut direplikasi
+                writer.writerows(rows)
+                continue
+            for k in range(factor):
+                for row in rows:
+                    if k:
+                        row = dict(row, **{col: f"{row[col]}_{k + 1}" for col in tagged})
+                    writer.writerow(row)
+    return out_dir
@@ -0,0 +1,313 @@
+import heapq
+
+# ===============================
+# ASSIGNMENT DOSEN (MIN-COST FLOW + PEMOLESAN)
+# ===============================
+# Untuk jadwal (slot) yang sudah tetap, pilih dosen tiap kelas sekaligus:
+#   S -> kelas (kap 1) -> [dosen, klik waktu] (kap 1) -> dosen -> T
+# - Biaya kelas -> dosen   : penalti prioritas (1 = 0, 2 = kecil, lain = besar)
+# - Biaya dosen -> T       : busur konveks, kelas ke-k berbiaya marginal kuadrat
+#                            beban (k*s)^2 - ((k-1)*s)^2, s = rata2 SKS kelas
+#                            kandidat dosen tsb -> meratakan beban (SD).
+#                            Eksak jika SKS kelas seorang dosen sama; selain itu
+#                            relaksasi -> hasil dipoles dgn biaya eksak (_polish).
+# - Klik waktu             : slot dipartisi jadi klik (semua saling beririsan);
+#                            kap 1 per (dosen, klik) mencegah bentrok di klik sama.
+#   Bentrok antar klik berbeda (irisan sebagian) ditangani lazy: pasangan yang
+#   bentrok dilarang lalu flow diselesaikan ulang (maks max_rounds).
+# Modul ini murni Python (tanpa numpy) agar bisa dipakai data_loader.
+
+# Sama dengan bobot prioritas di FitnessCalculator
+PRIO_COSTS = {1: 0, 2: 2}
+PRIO_COST_OTHER = 50
+EPS = 1e-9
+
+def prio_cost(priority):
+    return PRIO_COSTS.get(priority, PRIO_COST_OTHER)
+
+class MinCostFlow:
+    """
+    Successive shortest path + potensial (Dijkstra). Biaya awal harus >= 0.
+    Busur konveks (biaya unit ke-k = costs[k], tidak turun) disimpan sebagai
+    satu busur dinamis, bukan k busur paralel; tujuannya harus sink, sehingga
+    busur baliknya tidak pernah dipakai jalur terpendek.
+    """
+    def __init__(self, n_nodes):
+        self.graph = [[] for _ in range(n_nodes)]
+        self.convex = {}
+
+    def add_edge(self, u, v, cap, cost):
+        """Tambah busur u->v; return (u, index) untuk membaca flow-nya nanti."""
+        self.graph[u].append([v, cap, cost, len(self.graph[v])])
+        self.graph[v].append([u, 0, -cost, len(self.graph[u]) - 1])
+        return u, len(self.graph[u]) - 1
+
+    def add_convex_edge(self, u, sink, costs):
+        """Busur u->sink berkapasitas len(costs) dengan biaya marginal naik."""
+        self.convex[u] = [sink, costs, 0]
+
+    def flow_on(self, edge):
+        u, k = edge
+        v, _, _, rev = self.graph[u][k]
+        return self.graph[v][rev][1]
+
+    def solve(self, source, sink, max_flow):
+        """Alirkan max_flow unit dengan biaya minimum. Return (flow, biaya)."""
+        graph, convex = self.graph, self.convex
+        n = len(graph)
+        inf = float('inf')
+        potential = [0.0] * n
+        flow, cost = 0, 0.0
+        while flow < max_flow:
+            dist = [inf] * n
+            prev = [None] * n
+            dist[source] = 0.0
+            heap = [(0.0, source)]
+            while heap:
+                d, u = heapq.heappop(heap)
+                if d > dist[u]: continue
+                if u == sink: break  # Cukup sampai sink (sisa node: potensial += dist sink)
+                base = d + potential[u]
+                for k, (v, cap, c, _) in enumerate(graph[u]):
+                    if cap <= 0: continue
+                    nd = base + c - potential[v]
+                    if nd < dist[v] - EPS:
+                        dist[v] = nd
+                        prev[v] = (u, k)
+                        heapq.heappush(heap, (nd, v))
+                arc = convex.get(u)
+                if arc is not None and arc[2] < len(arc[1]):
+                    v = arc[0]
+                    nd = base + arc[1][arc[2]] - potential[v]
+                    if nd < dist[v] - EPS:
+                        dist[v] = nd
+                        prev[v] = (u, -1)
+                        heapq.heappush(heap, (nd, v))
+            if prev[sink] is None: break
+            reach = dist[sink]
+            for v in range(n):
+                potential[v] += min(dist[v], reach)
+
+            # Semua busur kap 1 (konveks: per unit) -> tiap jalur membawa 1 unit
+            v = sink
+            while v != source:
+                u, k = prev[v]
+                if k < 0:
+                    arc = convex[u]
+                    cost += arc[1][arc[2]]
+                    arc[2] += 1
+                else:
+                    edge = graph[u][k]
+                    edge[1] -= 1
+                    graph[v][edge[3]][1] += 1
+                    cost += edge[2]
+                v = u
+            flow += 1
+        return flow, cost
+
+def time_cliques(slot_ids, overlap):
+    """Partisi slot -> klik (greedy, urutan slot_id): slot -> index klik."""
+    cliques, clique_of = [], {}
+    for s in sorted(set(slot_ids)):
+        for q, members in enumerate(cliques):
+            if all(overlap[s][m] for m in members):
+                members.append(s)
+                clique_of[s] = q
+                break
+        else:
+            clique_of[s] = len(cliques)
+            cliques.append([s])
+    return clique_of
+
+def assign_lecturers(sks, candidates, cost_of, fair_weight=1.0, slot_ids=None, overlap=None, max_rounds=20, start=None):
+    """
+    Assignment dosen optimal untuk kelas 0..n-1.
+    - sks        : list SKS per kelas
+    - candidates : list kandidat dosen (id hashable) per kelas
+    - cost_of    : fungsi (kelas, dosen) -> biaya prioritas
+    - fair_weight: bobot kuadrat beban (SKS) relatif terhadap biaya prioritas
+    - slot_ids & overlap (matriks bool slot x slot): aktifkan larangan bentrok
+    - max_rounds : batas ronde lazy (tiap ronde = 1 solve flow penuh)
+    - start      : assignment saat ini (opsional); ikut dipoles dan dipakai jika
+                   biayanya lebih rendah dari hasil flow
+    Hasil flow dipoles dgn biaya eksak (lihat _polish). Return list dosen per
+    kelas (None = tidak ada kandidat yang bisa dipakai tanpa bentrok).
+    """
+    n = len(sks)
+    dosen_list = sorted({d for cands in candidates for d in cands}, key=str)
+    forbidden = set()
+    clique_of = time_cliques(slot_ids, overlap) if slot_ids is not None else None
+
+    # SKS kelas-kelas yang bisa diambil tiap dosen
+    pool = {d: [] for d in dosen_list}
+    for i, cands in enumerate(candidates):
+        for d in set(cands):
+            pool[d].append(sks[i])
+    marginal = {}
+    for d, pool_sks in pool.items():
+        s = sum(pool_sks) / len(pool_sks)
+        marginal[d] = [fair_weight * ((k * s) ** 2 - ((k - 1) * s) ** 2) for k in range(1, len(pool_sks) + 1)]
+    # Biaya kelas yang tidak ter-assign: lebih mahal dari jalur mana pun
+    unassigned_cost = (
+        PRIO_COST_OTHER + max((cost_of(i, d) for i, cands in enumerate(candidates) for d in cands), default=0)
+        + max((m[-1] for m in marginal.values()), default=0) + 1
+    )
+
+    losers = set()
+    for _ in range(max_rounds):
+        dosen_node = {d: n + 1 + k for k, d in enumerate(dosen_list)}
+        sink = n + 1 + len(dosen_list)
+        slot_nodes = {}
+        edges = []
+        arcs = []  # (kelas, dosen, node tujuan, biaya)
+        allowed = [[d for d in dict.fromkeys(cands) if (i, d) not in forbidden] for i, cands in enumerate(candidates)]
+        if clique_of is not None:
+            # Node (dosen, klik) hanya perlu jika >1 kelas kandidat dosen tsb ada di klik itu
+            share = {}
+            for i, cands in enumerate(allowed):
+                for d in cands:
+                    key = (d, clique_of[slot_ids[i]])
+                    share[key] = share.get(key, 0) + 1
+        for i, cands in enumerate(allowed):
+            for d in cands:
+                target = dosen_node[d]
+                if clique_of is not None:
+                    key = (d, clique_of[slot_ids[i]])
+                    if share[key] > 1:
+                        if key not in slot_nodes:
+                            slot_nodes[key] = sink + 1 + len(slot_nodes)
+                        target = slot_nodes[key]
+                arcs.append((i, d, target, cost_of(i, d)))
+
+        mcf = MinCostFlow(sink + 1 + len(slot_nodes))
+        source = n
+        for i in range(n):
+            mcf.add_edge(source, i, 1, 0)
+            mcf.add_edge(i, sink, 1, unassigned_cost)
+        for i, d, target, cost in arcs:
+            edges.append((i, d, mcf.add_edge(i, target, 1, cost)))
+        for (d, _), node in slot_nodes.items():
+            mcf.add_edge(node, dosen_node[d], 1, 0)
+        for d in dosen_list:
+            mcf.add_convex_edge(dosen_node[d], sink, marginal[d])
+        mcf.solve(source, sink, n)
+
+        assigned = [None] * n
+        for i, d, edge in edges:
+            if mcf.flow_on(edge):
+                assigned[i] = d
+        if clique_of is None:
+            break
+
+        # Bentrok antar klik: larang kelas dgn biaya lebih mahal, ulangi
+        clashes = _clashing_pairs(assigned, slot_ids, overlap)
+        losers = set()
+        if not clashes: break
+        for i, j in clashes:
+            d = assigned[i]
+            loser = max((i, j), key=lambda g: (cost_of(g, d), len(candidates[g]), g))
+            forbidden.add((loser, d))
+            losers.add(loser)
+    # Batas ronde habis: kelas yang masih bentrok diisi ulang saat pemolesan
+    for i in losers:
+        assigned[i] = None
+    result = _polish(assigned, sks, candidates, cost_of, fair_weight, slot_ids, overlap)
+    if start is not None:
+        if slot_ids is not None and _clashing_pairs(start, slot_ids, overlap):
+            return result
+        alt = _polish(list(start), sks, candidates, cost_of, fair_weight, slot_ids, overlap)
+        if _objective(alt, sks, cost_of, fair_weight) < _objective(result, sks, cost_of, fair_weight):
+            return alt
+    return result
+
+def _objective(assigned, sks, cost_of, fair_weight):
+    load, cost = {}, 0.0
+    for i, d in enumerate(assigned):
+        if d is None: continue
+        load[d] = load.get(d, 0) + sks[i]
+        cost += cost_of(i, d)
+    return cost + fair_weight * sum(w * w for w in load.values())
+
+def _polish(assigned, sks, candidates, cost_of, fair_weight, slot_ids, overlap):
+    """
+    Perbaikan dgn biaya eksak (kuadrat beban SKS + prioritas), karena flow di
+    atas hanya relaksasi jika SKS kelas berbeda-beda:
+    1. kelas tanpa dosen (None) diisi kandidat termurah yang tidak bentrok
+    2. turun-bukit: pindah 1 kelas / tukar 2 kelas antar dosen selama biaya turun
+    """
+    # Iterasi kandidat mengikuti urutan list (bukan urutan set): seri antar
+    # langkah berbiaya sama diputus sama di setiap proses, apa pun PYTHONHASHSEED
+    cand_lists = [list(dict.fromkeys(c)) for c in candidates]
+    cand_sets = [set(c) for c in cand_lists]
+    load, genes_of = {}, {}
+
+    def place(i, d):
+        assigned[i] = d
+        load[d] = load.get(d, 0) + sks[i]
+        genes_of.setdefault(d, set()).add(i)
+
+    def remove(i):
+        d = assigned[i]
+        load[d] -= sks[i]
+        genes_of[d].discard(i)
+
+    def free(d, i, exclude=None):
+        if slot_ids is None: return True
+        row = overlap[slot_ids[i]]
+        return not any(row[slot_ids[j]] for j in genes_of.get(d, ()) if j != i and j != exclude)
+
+    def sq(d, change):
+        w = load.get(d, 0)
+        return fair_weight * ((w + change) ** 2 - w ** 2)
+
+    empty = [i for i, d in enumerate(assigned) if d is None]
+    for i, d in enumerate(assigned):
+        if d is not None: place(i, d)
+    for i in empty:
+        options = [d for d in cand_lists[i] if free(d, i)]
+        if options:
+            place(i, min(options, key=lambda d: (cost_of(i, d) + sq(d, sks[i]), str(d))))
+
+    improved = True
+    while improved:
+        improved = False
+        for i, d in enumerate(assigned):
+            if d is None: continue
+            s_i = sks[i]
+            best, best_delta = None, -EPS
+            for d2 in cand_lists[i]:
+                if d2 == d: continue
+                # Pindah i: d -> d2
+                delta = cost_of(i, d2) - cost_of(i, d) + sq(d, -s_i) + sq(d2, s_i)
+                if delta < best_delta and free(d2, i):
+                    best, best_delta = (d2, None), delta
+                # Tukar i <-> j (j milik d2 & bisa diajar d)
+                for j in genes_of.get(d2, ()):
+                    if d not in cand_sets[j]: continue
+                    diff = sks[j] - s_i
+                    delta = (cost_of(i, d2) - cost_of(i, d) + cost_of(j, d) - cost_of(j, d2)
+                             + sq(d, diff) + sq(d2, -diff))
+                    if delta < best_delta and free(d2, i, exclude=j) and free(d, j, exclude=i):
+                        best, best_delta = (d2, j), delta
+            if best is None: continue
+            d2, j = best
+            remove(i)
+            if j is not None:
+                remove(j)
+                place(j, d)
+            place(i, d2)
+            improved = True
+    return assigned
+
+def _clashing_pairs(assigned, slot_ids, overlap):
+    by_dosen = {}
+    for i, d in enumerate(assigned):
+        if d is not None:
+            by_dosen.setdefault(d, []).append(i)
+    pairs = []
+    for genes in by_dosen.values():
+        for a, i in enumerate(genes):
+            for j in genes[a + 1:]:
+                if overlap[slot_ids[i]][slot_ids[j]]:
+                    pairs.append((i, j))
+    return pairs
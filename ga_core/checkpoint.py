@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import random
+import numpy as np
+from ga_core.individual import Individual
+
+# ===============================
+# CHECKPOINT (NPZ)
+# ===============================
+# Snapshot state engine dalam satu file .npz terkompresi:
+# - pop_slot / pop_room / pop_dosen : matriks [pop x kelas] int32
+# - best_slot / best_room / best_dosen : individu terbaik
+# - meta : JSON (generasi, state RNG, history, params, pengaturan loader, sidik jari data)
+# Tidak ada pickle: file aman dibuka ulang dengan allow_pickle=False.
+
+FORMAT_VERSION = 1
+
+def problem_fingerprint(table):
+    """Hash isi problem (kelas, SKS, peserta, domain slot & ruang) untuk cek kecocokan data."""
+    h = hashlib.sha1()
+    for arr in (table.class_ids, table.sks, table.jumlah_mhs, table.slot_ids, table.room_ids):
+        h.update(np.ascontiguousarray(arr).tobytes())
+    h.update("\n".join(table.kode_mk).encode())
+    h.update("\n".join(table.dosen_names).encode())
+    return h.hexdigest()
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Tidak bisa diserialisasi: {type(value).__name__}")
+
+def _stack(individuals, attr):
+    return np.stack([getattr(ind, attr) for ind in individuals]).astype(np.int32)
+
+def save_checkpoint(engine, path):
+    """Tulis state engine ke path (.npz) secara atomik (tulis tmp lalu rename)."""
+    seq = engine.seed_seq
+    meta = {
+        "version": FORMAT_VERSION,
+        "fingerprint": problem_fingerprint(engine.table),
+        "class_keys": engine.table.class_keys,
+        "dosen_names": engine.table.dosen_names,
+        "generation": engine.generation,
+        "mutation_rate": engine.mutation_rate,
+        "stagnant_generations": engine.stagnant_generations,
+        "restarts": engine.restarts,
+        "params": engine.params,
+        "loader": engine.data.get("loader"),
+        "history": engine.history,
+        "seed_seq": {
+            "entropy": seq.entropy,
+            "spawn_key": list(seq.spawn_key),
+            "pool_size": seq.pool_size,
+            "n_children_spawned": seq.n_children_spawned,
+        },
+        "py_rng": engine.rng.getstate(),
+        "np_rng": engine.np_rng.bit_generator.state,
+    }
+    best = engine.best_individual
+    arrays = {
+        "pop_slot": _stack(engine.population, "slot_ids"),
+        "pop_room": _stack(engine.population, "room_ids"),
+        "pop_dosen": _stack(engine.population, "dosen_ids"),
+        "best_slot": best.slot_ids,
+        "best_room": best.room_ids,
+        "best_dosen": best.dosen_ids,
+        "meta": np.array(json.dumps(meta, default=_json_default)),
+    }
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez_compressed(f, **arrays)
+    os.replace(tmp, path)
+
+def read_checkpoint(path):
+    """Return (meta dict, dict array) dari file checkpoint."""
+    with np.load(path, allow_pickle=False) as npz:
+        arrays = {key: npz[key] for key in npz.files}
+    meta = json.loads(str(arrays.pop("meta")))
+    if meta.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Versi checkpoint tidak didukung: {meta.get('version')}")
+    return meta, arrays
+
+def loader_settings(meta):
+    """Argumen load_all_data untuk memuat ulang data problem checkpoint."""
+    loader = meta.get("loader") or {}
+    return {
+        "seed": loader.get("seed", meta["params"].get("seed")),
+        "semester": loader.get("semester"),
+        "data_dir": loader.get("data_dir"),
+        "assignment": loader.get("assignment"),
+    }
+
+def _check_fingerprint(meta, table):
+    if meta["fingerprint"] != problem_fingerprint(table):
+        raise ValueError("Checkpoint dibuat dari data problem yang berbeda")
+
+def _individual(table, slot_ids, room_ids, dosen_ids):
+    ind = Individual(table)
+    ind.slot_ids, ind.room_ids, ind.dosen_ids = slot_ids, room_ids, dosen_ids
+    return ind
+
+def restore_engine(engine, meta, arrays):
+    """Kembalikan populasi, best, counter & state RNG ke engine yang baru dibuat."""
+    table = engine.table
+    _check_fingerprint(meta, table)
+
+    engine.population = [
+        _individual(table, s, r, d)
+        for s, r, d in zip(arrays["pop_slot"], arrays["pop_room"], arrays["pop_dosen"])
+    ]
+    engine.evaluate_population(engine.population)
+    engine.population.sort(key=lambda x: x.fitness, reverse=True)
+    engine.population[0].compute_fitness(engine.fitness_calc)
+    best = _individual(table, arrays["best_slot"], arrays["best_room"], arrays["best_dosen"])
+    best.compute_fitness(engine.fitness_calc)
+    engine.best_individual = best
+
+    engine.generation = meta["generation"]
+    engine.mutation_rate = meta["mutation_rate"]
+    engine.stagnant_generations = meta["stagnant_generations"]
+    engine.restarts = meta["restarts"]
+    engine.history = meta["history"]
+
+    seq = meta["seed_seq"]
+    engine.seed_seq = np.random.SeedSequence(
+        seq["entropy"], spawn_key=tuple(seq["spawn_key"]),
+        pool_size=seq["pool_size"], n_children_spawned=seq["n_children_spawned"],
+    )
+    engine.seed = engine.seed_seq.entropy
+    version, state, gauss = meta["py_rng"]
+    engine.rng.setstate((version, tuple(state), gauss))
+    engine.np_rng.bit_generator.state = meta["np_rng"]
+    return engine
+
+def load_best(path, table, rng=random):
+    """
+    Individu terbaik dari checkpoint (untuk warm start run berikutnya).
+    Jika data sama persis, array dipakai langsung; jika tidak (mis. urutan kelas
+    beda karena seed lain), gen dipetakan lewat table.class_keys & nama dosen.
+    Kelas yang tidak ada di checkpoint diisi acak dari domainnya.
+    """
+    meta, arrays = read_checkpoint(path)
+    if meta["fingerprint"] == problem_fingerprint(table):
+        return _individual(table, arrays["best_slot"], arrays["best_room"], arrays["best_dosen"])
+
+    ind = Individual(table)
+    ind.initialize_random(rng)
+    slot_ids, room_ids, dosen_ids = ind.slot_ids.copy(), ind.room_ids.copy(), ind.dosen_ids.copy()
+    old_pos = {tuple(key): k for k, key in enumerate(meta["class_keys"])}
+    valid_rooms = set(table.room_ids.tolist())
+    for i, key in enumerate(table.class_keys):
+        k = old_pos.get(key)
+        if k is None: continue
+        slot, room = int(arrays["best_slot"][k]), int(arrays["best_room"][k])
+        if slot < table.slot_domain_mask.shape[1] and table.slot_domain_mask[i, slot]:
+            slot_ids[i] = slot
+        if room in valid_rooms: room_ids[i] = room
+        dosen = table.dosen_index.get(meta["dosen_names"][int(arrays["best_dosen"][k])])
+        if dosen is not None: dosen_ids[i] = dosen
+    return _individual(table, slot_ids, room_ids, dosen_ids)
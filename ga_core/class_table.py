@@ -0,0 +1,181 @@
+import copy
+import numpy as np
+from ga_core.data_loader import encode_instance
+
+# ===============================
+# TABEL KELAS (SHARED, READ-ONLY)
+# ===============================
+class ClassTable:
+    """
+    Data statis semua kelas dalam bentuk array NumPy.
+    Dibangun SEKALI dari data['classes'] lalu dibagi ke semua individu,
+    sehingga kromosom cukup menyimpan 3 array integer (slot, ruang, dosen).
+    """
+    def __init__(self, classes, slots, rooms, candidates, pref_info, encoded=None):
+        self.classes = classes
+        self.n_classes = len(classes)
+        # Array ber-kode integer dari data loader (dibuat di sini jika data dirakit manual)
+        if encoded is None:
+            encoded = encode_instance(classes, candidates, pref_info)
+
+        # --- ATRIBUT PER KELAS ---
+        self.class_ids = self._frozen(encoded['class_ids'])
+        self.sks = self._frozen(encoded['sks'])
+        self.jumlah_mhs = self._frozen(encoded['jumlah_mhs'])
+        self.kode_mk = [c['kode_mk'] for c in classes]
+        self.nama_mk = [c['nama_mk'] for c in classes]
+        self.semester = [c.get('semester', 0) for c in classes]
+        self.parallel = [c.get('parallel', '-') for c in classes]
+        # Kunci stabil per kelas (tidak bergantung urutan acak data loader)
+        self.class_keys = list(zip(self.kode_mk, self.nama_mk, self.parallel))
+
+        # --- DOMAIN SLOT & RUANG ---
+        self.slot_ids = self._frozen([s['slot_id'] for s in slots])
+        self.room_ids = self._frozen([r['room_id'] for r in rooms])
+
+        # Indeks domain feasible: SKS -> slot dengan panjang sama,
+        # kebutuhan kursi -> ruang dengan kapasitas cukup.
+        # Kelas tanpa slot/ruang yang cocok jatuh ke semua slot/ruang.
+        self.slots_by_sks = {}
+        for s in slots:
+            self.slots_by_sks.setdefault(s.get('sks_val'), []).append(s['slot_id'])
+        self.slots_by_sks = {k: self._frozen(v) for k, v in self.slots_by_sks.items()}
+        self.rooms_by_need = {}
+        for need in sorted(set(c['jumlah_mhs'] for c in classes)):
+            fit = [r['room_id'] for r in rooms if r['Kapasitas'] >= need]
+            self.rooms_by_need[need] = self._frozen(fit) if fit else self.room_ids
+        self.slot_domain = [self.slots_by_sks.get(c['sks'], self.slot_ids) for c in classes]
+        self.room_domain = [self.rooms_by_need[c['jumlah_mhs']] for c in classes]
+        # Versi mask [kelas x slot] untuk cek "slot s boleh untuk kelas i" O(1)
+        # (dibangun per nilai SKS unik lalu di-broadcast ke semua kelas)
+        n_slot_ids = int(self.slot_ids.max()) + 1 if len(self.slot_ids) else 0
+        sks_values = np.unique(self.sks)
+        rows = np.zeros((len(sks_values), n_slot_ids), dtype=bool)
+        for k, sks in enumerate(sks_values):
+            rows[k, self.slots_by_sks.get(int(sks), self.slot_ids)] = True
+        mask = rows[np.searchsorted(sks_values, self.sks)]
+        mask.setflags(write=False)
+        self.slot_domain_mask = mask
+
+        # --- INDEKS HARI SLOT ---
+        # slot_day[s] = index hari; slot_shift[k, s] = slot berjam sama k hari
+        # setelahnya (siklik, -1 jika tidak ada) untuk langkah geser hari.
+        day_names = list(dict.fromkeys(s['Hari'] for s in slots))
+        self.n_days = len(day_names)
+        by_time = {(day_names.index(s['Hari']), s['Mulai'], s['Selesai']): s['slot_id'] for s in slots}
+        slot_day = np.full(n_slot_ids, -1, dtype=np.int32)
+        slot_shift = np.full((max(self.n_days, 1), n_slot_ids), -1, dtype=np.int32)
+        for (day, mulai, selesai), s_id in by_time.items():
+            slot_day[s_id] = day
+            for k in range(self.n_days):
+                slot_shift[k, s_id] = by_time.get(((day + k) % self.n_days, mulai, selesai), -1)
+        slot_day.setflags(write=False)
+        slot_shift.setflags(write=False)
+        self.slot_day, self.slot_shift = slot_day, slot_shift
+
+        # --- INDEKS GRUP KELAS ---
+        # Sesi   : potongan satu MK-kelas yang dipecah (is_split), urut class_id
+        # Paralel: MK & nomor sesi yang sama di kelas paralel berbeda (A-G)
+        # Grup beranggota 1 diabaikan (group_of = -1).
+        split_key = [
+            (c['kode_mk'], c.get('semester'), c.get('parallel')) if c.get('is_split') else None
+            for c in classes
+        ]
+        self.session_groups, self.session_group_of = self._group_index(split_key, self.class_ids)
+        session_no = np.zeros(self.n_classes, dtype=np.int32)
+        for members in self.session_groups:
+            session_no[members] = np.arange(len(members))
+        self.parallel_groups, self.parallel_group_of = self._group_index(
+            [(c['kode_mk'], c.get('semester'), int(n)) for c, n in zip(classes, session_no)], self.class_ids
+        )
+        # Wakil sesi per kelas (anggota pertama grup sesi, atau dirinya sendiri)
+        leader = np.arange(self.n_classes, dtype=np.int32)
+        for members in self.session_groups:
+            leader[members] = members[0]
+        leader.setflags(write=False)
+        self.section_leader = leader
+        self.has_group = self._frozen((self.session_group_of >= 0) | (self.parallel_group_of >= 0), dtype=bool)
+
+        # --- INDEKS KODE MK & DOSEN ---
+        self.kode_list = encoded['kode_list']
+        self.kode_index = self._frozen(encoded['kode_index'])
+        self.dosen_names = encoded['dosen_names']
+        self.dosen_index = {d: i for i, d in enumerate(self.dosen_names)}
+        # Dosen "Unknown" tidak dihitung beban & tabrakannya
+        self.dosen_known = self._frozen(["Unknown" not in d for d in self.dosen_names], dtype=bool)
+        self.n_dosen = len(self.dosen_names)
+        self.initial_dosen = self._frozen(encoded['initial_dosen'])
+
+        # Kandidat dosen per kelas (index dosen; array dibagi per kode MK)
+        by_kode = [self._frozen(idx) for idx in encoded['candidates']]
+        self.candidates = [by_kode[k] for k in self.kode_index]
+
+        # --- MATRIKS PRIORITAS [kode_mk x dosen] ---
+        # Default 99 (bukan prioritas / salah dosen)
+        self.priority = self._frozen(encoded['priority'])
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(data['classes'], data['slots'], data['rooms'], data['candidates'], data['pref_info'],
+                   encoded=data.get('encoded'))
+
+    @staticmethod
+    def _group_index(keys, order):
+        """Kunci per kelas (None = tanpa grup) -> (list anggota per grup, array grup per kelas)."""
+        members = {}
+        for i, key in enumerate(keys):
+            if key is not None:
+                members.setdefault(key, []).append(i)
+        groups = []
+        group_of = np.full(len(keys), -1, dtype=np.int32)
+        for key in sorted(members, key=str):
+            if len(members[key]) < 2: continue
+            idx = sorted(members[key], key=lambda i: order[i])
+            group_of[idx] = len(groups)
+            groups.append(ClassTable._frozen(idx))
+        group_of.setflags(write=False)
+        return groups, group_of
+
+    def pinned(self, ind, free):
+        """
+        Salinan tabel dengan domain kelas yang tidak bebas (free False) dikunci
+        ke nilai slot/ruang/dosen di `ind`. Semua operator mengambil nilai dari
+        domain, jadi GA di atas tabel ini hanya bisa memindah kelas bebas.
+        """
+        table = copy.copy(self)
+        fixed = np.flatnonzero(~np.asarray(free, dtype=bool))
+        table.slot_domain = list(self.slot_domain)
+        table.room_domain = list(self.room_domain)
+        table.candidates = list(self.candidates)
+        for i in fixed:
+            table.slot_domain[i] = self._frozen([ind.slot_ids[i]])
+            table.room_domain[i] = self._frozen([ind.room_ids[i]])
+            table.candidates[i] = self._frozen([ind.dosen_ids[i]])
+        mask = self.slot_domain_mask.copy()
+        mask[fixed] = False
+        mask[fixed, ind.slot_ids[fixed]] = True
+        mask.setflags(write=False)
+        table.slot_domain_mask = mask
+        initial = self.initial_dosen.copy()
+        initial[fixed] = ind.dosen_ids[fixed]
+        initial.setflags(write=False)
+        table.initial_dosen = initial
+        return table
+
+    def section(self, i):
+        """Semua sesi dari MK-kelas milik kelas i (urut nomor sesi)."""
+        g = self.session_group_of[i]
+        return self.session_groups[g] if g >= 0 else (i,)
+
+    @staticmethod
+    def _frozen(values, dtype=np.int32):
+        arr = np.array(values, dtype=dtype)
+        arr.setflags(write=False)
+        return arr
+
+    def priorities(self, dosen_ids):
+        """Prioritas dosen untuk setiap kelas (vektor)."""
+        return self.priority[self.kode_index, dosen_ids]
+
+    def priority_of(self, class_idx, dosen_idx):
+        return int(self.priority[self.kode_index[class_idx], dosen_idx])
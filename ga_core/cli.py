@@ -0,0 +1,219 @@
+import argparse
+import sys
+import time
+
+# ===============================
+# CLI (python -m ga_core.cli <perintah>)
+# ===============================
+# Perintah: solve, reschedule, export, diagnose, bench.
+# Modul berat (numpy, pandas, engine GA) baru di-import di dalam handler
+# perintah yang membutuhkannya, sehingga start perintah non-solve tetap ringan.
+
+def _data(args, settings):
+    from ga_core.data_loader import load_all_data
+    return load_all_data(
+        seed=settings['seed'], data_dir=settings.get('data_dir'), semester=settings.get('semester'),
+        assignment=settings.get('assignment'), backend=getattr(args, 'loader_backend', None) or 'auto',
+        use_cache=settings['use_cache'],
+    )
+
+def _config(args, **overrides):
+    from ga_core.config import load_config
+    from ga_core.rng import resolve_seed
+    params, data_settings = load_config(args.config, dict(
+        overrides, seed=args.seed, semester=args.semester, data_dir=args.data_dir,
+        assignment=args.assignment,
+    ))
+    # Seed acak (tidak diisi) tetap satu angka untuk GA & data, tapi tidak di-cache
+    use_cache = params['seed'] is not None
+    params['seed'] = resolve_seed(params['seed'])
+    return params, dict(data_settings, seed=params['seed'], use_cache=use_cache)
+
+# ---------- SOLVE ----------
+def cmd_solve(args):
+    params, settings = _config(
+        args, pop_size=args.pop_size, max_generations=args.max_generations,
+        time_budget=args.time_budget, target_conflicts=args.target_conflicts,
+        repair_engine=args.repair_engine, islands=args.islands, seed_ratio=args.seed_ratio,
+        assignment_interval=args.assignment_interval, room_decoder=args.room_decoder,
+        checkpoint_path=args.checkpoint, resume=args.resume or None,
+    )
+
+    import os
+    from ga_core.ga_engine import GeneticAlgorithm
+    from ga_core.csv_export import export_schedule_to_csv
+    from ga_core.report import print_result_summary, print_statistical_report
+
+    ckpt = params['checkpoint_path']
+    if params['resume'] and ckpt and os.path.exists(ckpt):
+        # Data & seed mengikuti checkpoint (urutan kelas harus sama persis)
+        engine = GeneticAlgorithm.resume(ckpt, params={k: v for k, v in params.items() if k != 'seed'})
+        data = engine.data
+    else:
+        data = _data(args, settings)
+        engine = GeneticAlgorithm(data, params)
+
+    start_time = time.time()
+    best = engine.run()
+    print_result_summary(best, time.time() - start_time)
+    print("\n=== MENYIMPAN HASIL JADWAL ===")
+    export_schedule_to_csv(best, data, filename=args.out)
+    if args.report:
+        print_statistical_report(best)
+    return 0 if best.n_conflicts == 0 else 1
+
+# ---------- RESCHEDULE ----------
+def _parse_block(text):
+    """'Senin,07:00,08:40' -> tuple (hari, mulai, selesai); angka -> slot_id."""
+    parts = [p.strip() for p in text.split(',')]
+    if len(parts) == 1:
+        return int(parts[0])
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError(f"Format slot tidak valid: {text!r} (hari,HH:MM,HH:MM)")
+    return tuple(parts)
+
+def _parse_reassign(text):
+    """'KODE,Mata Kuliah,Kelas=Nama Dosen' -> ((kode, mata_kuliah, kelas), dosen)."""
+    key, sep, name = text.partition('=')
+    # Nama MK boleh berisi koma: kode = sebelum koma pertama, kelas = setelah koma terakhir
+    kode, _, rest = key.partition(',')
+    mata_kuliah, _, kelas = rest.rpartition(',')
+    if not sep or not name.strip() or not mata_kuliah.strip():
+        raise argparse.ArgumentTypeError(f"Format reassign tidak valid: {text!r} (kode,mata kuliah,kelas=dosen)")
+    return (kode.strip(), mata_kuliah.strip(), kelas.strip()), name.strip()
+
+def cmd_reschedule(args):
+    params, settings = _config(
+        args, repair_iters=args.repair_iters, time_budget=args.time_budget,
+    )
+    data = _data(args, settings)
+
+    from ga_core.reschedule import ChangeSet, reschedule
+    from ga_core.csv_export import export_schedule_to_csv
+
+    changes = ChangeSet(
+        removed_rooms=args.remove_room, blocked_slots=args.block_slot,
+        unavailable_dosen=args.unavailable, reassign=dict(args.reassign),
+    )
+    result, summary = reschedule(data, args.schedule, changes, params)
+    print("\n=== RINGKASAN RESCHEDULE ===")
+    for key, value in summary.items():
+        print(f"  {key:<18}: {value:.5f}" if isinstance(value, float) else f"  {key:<18}: {value}")
+    export_schedule_to_csv(result, data, filename=args.out)
+    return 0 if summary["conflicts"] == 0 else 1
+
+# ---------- EXPORT ----------
+def cmd_export(args):
+    from ga_core.checkpoint import read_checkpoint, load_best, loader_settings
+    meta, _ = read_checkpoint(args.checkpoint)
+    # Urutan kelas ikut seed & pengaturan loader saat checkpoint dibuat -> pakai yang sama
+    for key, value in loader_settings(meta).items():
+        if getattr(args, key) is None:
+            setattr(args, key, value)
+    params, settings = _config(args)
+    data = _data(args, settings)
+
+    from ga_core.ga_engine import GeneticAlgorithm
+    from ga_core.csv_export import export_schedule_to_csv
+
+    engine = GeneticAlgorithm(data, params)
+    best = load_best(args.checkpoint, engine.table, engine.rng)
+    best.compute_fitness(engine.fitness_calc)
+    print(f"Checkpoint generasi {meta['generation']}: fitness {best.fitness:.5f}, konflik {best.n_conflicts}")
+    export_schedule_to_csv(best, data, filename=args.out)
+    return 0
+
+# ---------- DIAGNOSE ----------
+def cmd_diagnose(args):
+    params, settings = _config(args)
+    data = _data(args, settings)
+
+    from ga_core import diagnose
+
+    if args.check in ("all", "flexibility"):
+        diagnose.flexibility_report(data['candidates'])
+    if args.check in ("all", "bottleneck"):
+        if args.check == "all": print()
+        if args.schedule:
+            workload = diagnose.workload_from_schedule(args.schedule)
+        else:
+            workload = diagnose.workload_from_classes(data['classes'])
+        over, under = args.overload_dosen, args.underload_dosen
+        if not (over and under):
+            auto_over, auto_under = diagnose.split_by_load(workload, args.overload, args.underload)
+            over, under = over or auto_over, under or auto_under
+        diagnose.bottleneck_report(data['candidates'], over, under)
+    return 0
+
+# ---------- BENCH ----------
+def cmd_bench(args):
+    from benchmarks.__main__ import main as bench_main
+    return bench_main(args.bench_args)
+
+# ===============================
+# PARSER
+# ===============================
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m ga_core.cli", description="Penjadwalan kuliah berbasis GA")
+    parser.add_argument("--config", help="File JSON berisi parameter GA / semester / data_dir / assignment")
+    parser.add_argument("--semester", help="Semester aktif (Ganjil/Genap), default dari config")
+    parser.add_argument("--data-dir", help="Folder CSV input (default: data/)")
+    parser.add_argument("--seed", type=int, help="Seed run & urutan data")
+    parser.add_argument("--assignment", choices=("greedy", "flow"), help="Pemilihan dosen awal saat load data")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("solve", help="Jalankan GA dan export jadwal")
+    p.add_argument("--pop-size", type=int)
+    p.add_argument("--max-generations", type=int)
+    p.add_argument("--time-budget", type=float)
+    p.add_argument("--target-conflicts", type=int)
+    p.add_argument("--repair-engine", choices=("fihc", "tabu", "annealing"))
+    p.add_argument("--islands", type=int)
+    p.add_argument("--seed-ratio", type=float, help="Porsi populasi awal dari DSatur/greedy (0-1)")
+    p.add_argument("--assignment-interval", type=int, help="Assignment dosen min-cost flow tiap N generasi")
+    p.add_argument("--room-decoder", action="store_true", default=None, help="Ruang dihitung dari slot, bukan gen GA")
+    p.add_argument("--checkpoint", help="Path checkpoint .npz")
+    p.add_argument("--resume", action="store_true", help="Lanjutkan dari --checkpoint jika ada")
+    p.add_argument("--loader-backend", choices=("auto", "pandas", "csv"),
+                   help="Backend pembaca CSV (beda dengan params['backend'] produksi anak)")
+    p.add_argument("--out", default="Jadwal_Final_Skripsi.csv")
+    p.add_argument("--report", action="store_true", help="Cetak laporan statistik beban dosen")
+    p.set_defaults(func=cmd_solve)
+
+    p = sub.add_parser("reschedule", help="Perbaiki jadwal hasil export setelah ada perubahan")
+    p.add_argument("--schedule", required=True, help="CSV jadwal berjalan")
+    p.add_argument("--remove-room", action="append", default=[], metavar="RUANG")
+    p.add_argument("--block-slot", action="append", default=[], type=_parse_block, metavar="HARI,MULAI,SELESAI")
+    p.add_argument("--unavailable", action="append", default=[], metavar="DOSEN")
+    p.add_argument("--reassign", action="append", default=[], type=_parse_reassign,
+                   metavar="KODE,MATA KULIAH,KELAS=DOSEN", help="Ganti dosen satu kelas")
+    p.add_argument("--repair-iters", type=int)
+    p.add_argument("--time-budget", type=float)
+    p.add_argument("--out", default="Jadwal_Reschedule.csv")
+    p.set_defaults(func=cmd_reschedule)
+
+    p = sub.add_parser("export", help="Export jadwal terbaik dari checkpoint ke CSV")
+    p.add_argument("--checkpoint", required=True)
+    p.add_argument("--out", default="Jadwal_Final_Skripsi.csv")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("diagnose", help="Cek fleksibilitas data & kebuntuan fairness")
+    p.add_argument("check", nargs="?", default="all", choices=("all", "flexibility", "bottleneck"))
+    p.add_argument("--schedule", help="CSV jadwal untuk menghitung beban (default: assignment awal)")
+    p.add_argument("--overload", type=int, default=15, help="Batas SKS overload")
+    p.add_argument("--underload", type=int, default=10, help="Batas SKS underload")
+    p.add_argument("--overload-dosen", action="append", default=[], metavar="DOSEN")
+    p.add_argument("--underload-dosen", action="append", default=[], metavar="DOSEN")
+    p.set_defaults(func=cmd_diagnose)
+
+    p = sub.add_parser("bench", help="Benchmark (argumen diteruskan ke python -m benchmarks)")
+    p.add_argument("bench_args", nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_bench)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args) or 0
+
+if __name__ == "__main__":
+    sys.exit(main())
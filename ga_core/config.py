@@ -0,0 +1,55 @@
+import json
+
+# ===============================
+# KONFIGURASI RUN (PARAMETER GA + DATA)
+# ===============================
+# Dipakai main_ga.py & CLI. File config (JSON) cukup berisi kunci yang ingin
+# diubah; sisanya memakai default di bawah.
+
+DEFAULT_PARAMS = {
+    'seed': None,            # Seed tunggal (None = acak, seed dicetak saat run)
+    'pop_size': 30,          # Jumlah penduduk (makin banyak makin lambat tapi variatif)
+    'max_generations': 200,  # Berapa kali evolusi
+    'crossover_rate': 0.8,   # Peluang kawin silang
+    'mutation_rate': 0.05,   # Peluang mutasi (kecil saja)
+    'time_budget': None,     # Batas waktu solve (detik, None = tanpa batas); lunak, lihat GeneticAlgorithm.run
+    'target_conflicts': None,# Berhenti begitu konflik <= target (mis. 0)
+    'stagnation_window': None, # Tanpa perbaikan N gen -> aksi stagnasi (None = mati, mis. 20)
+    'stagnation_action': 'mutation', # 'mutation' (naikkan mutasi) atau 'restart'
+    'elitism': 2,            # Simpan 2 terbaik agar tidak hilang
+    'seed_ratio': 0.0,       # Porsi populasi awal dari heuristik konstruktif (opt-in, mis. 0.2)
+    'seed_method': 'mixed',  # 'dsatur', 'greedy', atau 'mixed'
+    'repair_engine': 'fihc', # Repair konflik: 'fihc', 'tabu', atau 'annealing'
+    'repair_iters': 200,     # Batas iterasi repair per anak (tabu/annealing)
+    'repair_time': None,     # Batas waktu repair per anak (detik, None = tanpa batas)
+    'group_move_weight': 0.0,# Bobot langkah majemuk sesi/paralel di tabu/annealing (0 = mati)
+    'islands': 1,            # >1 = Island Model paralel (1 proses per pulau)
+    'migration_interval': 10,# Tukar elite antar pulau tiap N generasi
+    'topology': 'ring',      # 'ring' atau 'full'
+    'backend': 'serial',     # Produksi anak: 'serial', 'thread', atau 'process'
+    'workers': None,         # Jumlah worker (None = jumlah CPU)
+    'telemetry_path': None,  # Mis. 'telemetry.jsonl' / 'telemetry.csv' (None = mati)
+    'checkpoint_path': None, # Mis. 'ga_checkpoint.npz' -> snapshot berkala (None = mati)
+    'checkpoint_interval': 10, # Simpan checkpoint tiap N generasi
+    'resume': False,         # True = lanjutkan dari checkpoint_path jika ada
+    'warm_start': None,      # Checkpoint run sebelumnya sebagai individu awal
+    'assignment_interval': None, # Assignment dosen via min-cost flow utk best tiap N gen (None = mati)
+    'room_decoder': False,   # True = ruang dihitung dari slot (bukan gen GA), lihat room_decoder.py
+    'constraints': [],       # Constraint tambahan (opt-in), mis. ['cohort_clash', 'split_session_day']
+}
+
+# Pengaturan data problem (bukan parameter GA)
+DATA_KEYS = ('semester', 'data_dir', 'assignment')
+
+def load_config(path=None, overrides=None):
+    """
+    Gabungkan DEFAULT_PARAMS + isi file JSON (opsional) + overrides (opsional).
+    Return (params GA, pengaturan data {'semester', 'data_dir', 'assignment'}).
+    """
+    merged = dict(DEFAULT_PARAMS)
+    if path:
+        with open(path, encoding="utf-8") as f:
+            merged.update(json.load(f))
+    merged.update({k: v for k, v in (overrides or {}).items() if v is not None})
+    data_settings = {key: merged.pop(key, None) for key in DATA_KEYS}
+    return merged, data_settings
@@ -0,0 +1,244 @@
+import abc
+import numpy as np
+from ga_core.fitness import Conflict
+
+# ===============================
+# REGISTRY CONSTRAINT (PLUGGABLE)
+# ===============================
+# Constraint inti (kapasitas, tabrakan ruang/dosen, prioritas, fairness) tetap
+# ditanam di FitnessCalculator & IncrementalEvaluator karena matriks okupansinya
+# dipakai juga oleh load balancing & decoder ruang. Aturan tambahan didaftarkan
+# di sini lewat @register dan diaktifkan dari params['constraints'], mis.
+#   ['cohort_clash', {'name': 'split_session_day', 'weight': 20}]
+# (nama saja = hard; 'weight' = soft dengan penalti per pelanggaran).
+#
+# Tiap constraint menyatakan gen yang dibaca (`reads`: 'slot'/'room'/'dosen')
+# dan menyediakan kernel:
+# - compile(table, fitness_calc)  : indeks statis, dibangun sekali per run
+# - batch(slot_mat, room_mat, dosen_mat) : pelanggaran per baris populasi (vektor)
+# - records(slot_ids, room_ids, dosen_ids) : list Conflict (rincian, jalur skalar)
+# - init_state(ind) / count / delta / apply : kernel inkremental (IncrementalEvaluator)
+# - gene_counts(state, ind)       : pelanggaran per gen (untuk hard_genes)
+# Langkah yang tidak menyentuh gen di `reads` dilewati evaluator tanpa memanggil kernel.
+
+KIND_COHORT = "Tabrakan Kohort"
+KIND_SPLIT_DAY = "Sesi Split Sehari"
+KIND_UNAVAILABLE = "Dosen Berhalangan"
+
+REGISTRY = {}
+# Opt-in: default kosong agar objektif (dan angka fitness) run lama tidak berubah
+DEFAULT_CONSTRAINTS = ()
+
+def register(cls):
+    REGISTRY[cls.name] = cls
+    return cls
+
+def build_constraints(specs, table, fitness_calc):
+    """Spec (nama / dict dengan 'name' + argumen konstruktor) -> constraint ter-compile."""
+    compiled = []
+    for spec in specs or ():
+        kwargs = dict(spec) if isinstance(spec, dict) else {'name': spec}
+        name = kwargs.pop('name')
+        if name not in REGISTRY:
+            raise ValueError(f"Constraint tidak dikenal: {name}")
+        constraint = REGISTRY[name](**kwargs)
+        constraint.compile(table, fitness_calc)
+        compiled.append(constraint)
+    return tuple(compiled)
+
+
+class Constraint(abc.ABC):
+    """Basis constraint; weight None = hard (bobot WEIGHT_HARD, dihitung sebagai konflik)."""
+    name = None
+    kind = None
+    reads = ()
+
+    def __init__(self, weight=None):
+        self.hard = weight is None
+        self.weight = weight
+
+    def compile(self, table, fitness_calc):
+        if self.hard:
+            self.weight = fitness_calc.WEIGHT_HARD
+
+    @abc.abstractmethod
+    def batch(self, slot_mat, room_mat, dosen_mat):
+        """Jumlah pelanggaran per baris populasi (matriks [pop x kelas])."""
+
+    @abc.abstractmethod
+    def records(self, slot_ids, room_ids, dosen_ids):
+        """List record Conflict untuk tiap pelanggaran (laporan konflik)."""
+
+    def init_state(self, ind):
+        return None
+
+    def count(self, state, ind):
+        """Total pelanggaran individu (default: kernel batch untuk 1 baris)."""
+        return int(self.batch(ind.slot_ids[None, :], ind.room_ids[None, :], ind.dosen_ids[None, :])[0])
+
+    @abc.abstractmethod
+    def delta(self, state, i, s, r, d, s2, r2, d2):
+        """Perubahan jumlah pelanggaran bila gen i pindah (s, r, d) -> (s2, r2, d2)."""
+
+    def apply(self, state, i, s, r, d, s2, r2, d2):
+        pass
+
+    @abc.abstractmethod
+    def gene_counts(self, state, ind):
+        """Jumlah pelanggaran yang melibatkan tiap gen (vektor per kelas)."""
+
+
+class GroupClash(Constraint):
+    """
+    Pasangan kelas dalam grup statis yang sama dilarang berelasi waktu
+    (relation[s, s2] True, diagonal True). Subclass mengisi group_keys() & relasi.
+    State inkremental: load[g, s] = jumlah anggota grup g yang berelasi dengan slot s.
+    """
+    reads = ('slot',)
+
+    @abc.abstractmethod
+    def group_keys(self, table):
+        """List kunci grup per kelas (None = tidak ikut grup mana pun)."""
+
+    def relation_matrix(self, fitness_calc):
+        return fitness_calc.slot_overlap
+
+    def compile(self, table, fitness_calc):
+        super().compile(table, fitness_calc)
+        self.calc = fitness_calc
+        keys = self.group_keys(table)
+        index = {k: g for g, k in enumerate(sorted({k for k in keys if k is not None}, key=str))}
+        self.group = np.array([index[k] if k is not None else -1 for k in keys], dtype=np.int32)
+        self.n_groups = len(index)
+        self.member = self.group >= 0
+        self.members = [np.flatnonzero(self.group == g).tolist() for g in range(self.n_groups)]
+
+        relation = self.relation_matrix(fitness_calc)
+        self._relation_rows = relation.tolist()
+        self._relation_int = relation.astype(np.int32)
+        self._relation_float = relation.astype(float)
+
+    def batch(self, slot_mat, room_mat, dosen_mat):
+        n_rows = slot_mat.shape[0]
+        if self.n_groups == 0: return np.zeros(n_rows, dtype=np.int64)
+        row = np.arange(n_rows)[:, None]
+        group = np.maximum(self.group, 0)[None, :]
+        index = (row * self.n_groups + group) * self.calc.n_slots + slot_mat
+        weights = np.broadcast_to(self.member, slot_mat.shape).ravel().astype(float)
+        return self.calc._pair_clashes(index.ravel(), weights, n_rows, self.n_groups, self._relation_float)
+
+    def records(self, slot_ids, room_ids, dosen_ids):
+        slots = slot_ids.tolist()
+        return [
+            Conflict(self.kind, pair, g, self.weight)
+            for g, members in enumerate(self.members)
+            for pair in self.calc._overlapping_pairs(members, slots, self._relation_rows)
+        ]
+
+    def init_state(self, ind):
+        n_slots = self.calc.n_slots
+        index = self.group[self.member] * n_slots + ind.slot_ids[self.member]
+        occ = np.bincount(index, minlength=self.n_groups * n_slots).reshape(self.n_groups, n_slots)
+        return (occ @ self._relation_float).astype(np.int32)
+
+    def count(self, load, ind):
+        pairs = load[self.group[self.member], ind.slot_ids[self.member]].sum() - self.member.sum()
+        return int(pairs) // 2
+
+    def delta(self, load, i, s, r, d, s2, r2, d2):
+        g = self.group[i]
+        if g < 0 or s2 == s: return 0
+        return int(load[g, s2]) - int(self._relation_int[s, s2]) - (int(load[g, s]) - 1)
+
+    def apply(self, load, i, s, r, d, s2, r2, d2):
+        g = self.group[i]
+        if g < 0 or s2 == s: return
+        load[g] -= self._relation_int[s]
+        load[g] += self._relation_int[s2]
+
+    def gene_counts(self, load, ind):
+        counts = load[np.maximum(self.group, 0), ind.slot_ids] - 1
+        return np.where(self.member, counts, 0)
+
+
+@register
+class CohortClash(GroupClash):
+    """Kelas wajib satu angkatan & kelas paralel yang sama (semester, paralel) tidak boleh overlap."""
+    name = "cohort_clash"
+    kind = KIND_COHORT
+
+    def group_keys(self, table):
+        return [
+            None if isinstance(sem, str) or not sem else (int(sem), par)  # MK Pilihan lintas angkatan
+            for sem, par in zip(table.semester, table.parallel)
+        ]
+
+
+@register
+class SplitSessionDay(GroupClash):
+    """Sesi-sesi MK yang dipecah (is_split) untuk kelas yang sama harus di hari berbeda."""
+    name = "split_session_day"
+    kind = KIND_SPLIT_DAY
+
+    def group_keys(self, table):
+        return [int(g) if g >= 0 else None for g in table.session_group_of]
+
+    def relation_matrix(self, fitness_calc):
+        day = np.full(fitness_calc.n_slots, -1)
+        for s_id, d in fitness_calc.slot_details.items():
+            day[s_id] = fitness_calc.day_names.index(d['hari'])
+        return (day[:, None] == day[None, :]) & (day[:, None] >= 0)
+
+
+@register
+class DosenUnavailable(Constraint):
+    """
+    Dosen berhalangan di waktu tertentu. slots: {nama dosen: [slot_id atau
+    "hari,HH:MM,HH:MM" / [hari, mulai, selesai]]}; semua slot yang beririsan diblok.
+    """
+    name = "dosen_unavailable"
+    kind = KIND_UNAVAILABLE
+    reads = ('slot', 'dosen')
+
+    def __init__(self, slots=None, weight=None):
+        super().__init__(weight)
+        self.slots = slots or {}
+
+    def compile(self, table, fitness_calc):
+        super().compile(table, fitness_calc)
+        dosen_pos = {name: k for k, name in enumerate(table.dosen_names)}
+        self.blocked = np.zeros((table.n_dosen, fitness_calc.n_slots), dtype=bool)
+        for name, specs in self.slots.items():
+            if name not in dosen_pos:
+                raise ValueError(f"Dosen tidak dikenal di constraint {self.name}: {name}")
+            for spec in specs:
+                self.blocked[dosen_pos[name], self._slot_mask(spec, fitness_calc)] = True
+        self.blocked &= table.dosen_known[:, None]
+        self.blocked.setflags(write=False)
+
+    @staticmethod
+    def _slot_mask(spec, fitness_calc):
+        mask = np.zeros(fitness_calc.n_slots, dtype=bool)
+        if isinstance(spec, int):
+            mask[spec] = True
+            return mask
+        hari, mulai, selesai = spec.split(',') if isinstance(spec, str) else spec
+        start = fitness_calc._time_to_minutes(mulai.strip())
+        end = fitness_calc._time_to_minutes(selesai.strip())
+        for s_id, d in fitness_calc.slot_details.items():
+            if d['hari'].lower() == hari.strip().lower() and d['start'] < end and start < d['end']:
+                mask[s_id] = True
+        return mask
+
+    def batch(self, slot_mat, room_mat, dosen_mat):
+        return self.blocked[dosen_mat, slot_mat].sum(axis=1)
+
+    def records(self, slot_ids, room_ids, dosen_ids):
+        genes = np.flatnonzero(self.blocked[dosen_ids, slot_ids])
+        return [Conflict(self.kind, (int(i),), int(dosen_ids[i]), self.weight) for i in genes]
+
+    def delta(self, state, i, s, r, d, s2, r2, d2):
+        return int(self.blocked[d2, s2]) - int(self.blocked[d, s])
+
+    def gene_counts(self, state, ind):
+        return self.blocked[ind.dosen_ids, ind.slot_ids].astype(np.int32)
@@ -1,38 +1,40 @@
-import pandas as pd
+import csv
 import os
 
 def export_schedule_to_csv(individual, data, filename="hasil_jadwal_terbaik.csv"):
     slots_lookup = {s['slot_id']: s for s in data['slots']}
     rooms_lookup = {r['room_id']: r for r in data['rooms']}
     
+    table = individual.table
     formatted_data = []
     
-    for gene in individual.chromosome:
-        slot_data = slots_lookup[gene['slot_id']]
-        room_data = rooms_lookup[gene['room_id']]
+    for i in range(table.n_classes):
+        slot_data = slots_lookup[int(individual.slot_ids[i])]
+        room_data = rooms_lookup[int(individual.room_ids[i])]
+        dosen_idx = int(individual.dosen_ids[i])
         
         row = {
-            "ID Kelas": gene['class_id'],
-            "Kode MK": gene['kode_mk'],
-            "Mata Kuliah": gene['nama_mk'], # Nama sudah bersih dari suffix kelas
-            "SKS": gene['sks'],
-            "Kelas": gene.get('parallel', '-'), # A, B, C...
-            "Dosen": gene['dosen'],
+            "ID Kelas": int(table.class_ids[i]),
+            "Kode MK": table.kode_mk[i],
+            "Mata Kuliah": table.nama_mk[i], # Nama sudah bersih dari suffix kelas
+            "SKS": int(table.sks[i]),
+            "Kelas": table.parallel[i], # A, B, C...
+            "Dosen": table.dosen_names[dosen_idx],
             "Hari": slot_data['Hari'],
             "Jam Mulai": slot_data['Mulai'],
             "Jam Selesai": slot_data['Selesai'],
             "Ruangan": room_data['Ruang'],
-            "Prioritas Dosen": gene.get('dosen_priority', '?')
+            "Prioritas Dosen": table.priority_of(i, dosen_idx)
         }
         formatted_data.append(row)
         
-    df = pd.DataFrame(formatted_data)
-    
     # Sorting: Hari -> Jam -> Ruang
     hari_map = {'senin': 1, 'selasa': 2, 'rabu': 3, 'kamis': 4, 'jumat': 5, 'sabtu': 6}
-    df['hari_num'] = df['Hari'].str.lower().map(hari_map).fillna(99)
-    df = df.sort_values(by=['hari_num', 'Jam Mulai', 'Ruangan']).drop(columns=['hari_num'])
+    formatted_data.sort(key=lambda row: (hari_map.get(str(row['Hari']).lower(), 99), row['Jam Mulai'], row['Ruangan']))
     
     path = os.path.join(os.getcwd(), filename)
-    df.to_csv(path, index=False)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(formatted_data[0]) if formatted_data else [], lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(formatted_data)
     print(f"\n📄 Jadwal Updated diexport ke: {path}")
\ No newline at end of file
@@ -0,0 +1,61 @@
+import gzip
+import hashlib
+import json
+import os
+
+# ===============================
+# CACHE DATA PROBLEM (HASIL PARSING)
+# ===============================
+# Hasil load_all_data (slots, rooms, classes, candidates, pref_info) disimpan
+# sebagai JSON ter-gzip. Kunci = hash isi semua file input + pengaturan loader
+# (semester, kapasitas default, seed), sehingga file CSV yang berubah otomatis
+# membuat entry baru. Membaca cache tidak membutuhkan pandas sama sekali.
+
+CACHE_VERSION = 2
+
+def cache_key(paths, settings):
+    """Hash isi file input + pengaturan (dict JSON-able)."""
+    h = hashlib.sha256()
+    h.update(json.dumps({"version": CACHE_VERSION, **settings}, sort_keys=True).encode())
+    for path in paths:
+        h.update(os.path.basename(path).encode())
+        with open(path, "rb") as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()[:32]
+
+def _plain(value):
+    """Nilai numpy (hasil pandas) -> tipe Python biasa."""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Tidak bisa diserialisasi: {type(value).__name__}")
+
+def _cache_path(cache_dir, key):
+    return os.path.join(cache_dir, f"problem_{key}.json.gz")
+
+def load_cached(cache_dir, key):
+    """Data problem dari cache, atau None jika belum ada / rusak."""
+    path = _cache_path(cache_dir, key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    data = payload["data"]
+    # Kunci pref_info berupa tuple (dosen, kode_mk) -> disimpan sebagai list
+    data["pref_info"] = {(dosen, kode): info for dosen, kode, info in data["pref_info"]}
+    return data
+
+def save_cached(cache_dir, key, data):
+    """Tulis data problem ke cache secara atomik."""
+    os.makedirs(cache_dir, exist_ok=True)
+    payload = {
+        "version": CACHE_VERSION,
+        "data": dict(data, pref_info=[[dosen, kode, info] for (dosen, kode), info in data["pref_info"].items()]),
+    }
+    path = _cache_path(cache_dir, key)
+    tmp = f"{path}.tmp"
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        json.dump(payload, f, default=_plain, separators=(",", ":"))
+    os.replace(tmp, path)
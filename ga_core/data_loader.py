@@ -1,7 +1,10 @@
-import pandas as pd
 import os
 import math
 import random
+import csv
+import numpy as np
+from ga_core.data_cache import cache_key, load_cached, save_cached
+from ga_core.assignment import assign_lecturers, prio_cost
 
 # ===============================
 # KONFIGURASI
@@ -11,28 +14,83 @@ DATA_PATH = os.path.join(CURRENT_DIR, '..', 'data')
 SEMESTER_ACTIVE = "Ganjil" 
 ROOM_CAPACITY_DEFAULT = 40 
 
+# Pemilihan dosen awal: "greedy" (threshold 12 SKS) atau "flow" (min-cost flow)
+ASSIGN_GREEDY = "greedy"
+ASSIGN_FLOW = "flow"
+
+# File input (relatif ke DATA_PATH); isinya ikut menentukan kunci cache
+DATA_FILES = {
+    "slots": "Time_Slots v2.csv",
+    "rooms": "Ruang Kelas.csv",
+    "students": "Jumlah Mahasiswa TIF.csv",
+    "preferences": "Preferensi MK dosen TIFv2.csv",
+    "mk_wajib": "MK Wajib TIF_All Semester.csv",
+    "mk_pilihan": "MK Pilihan TIF_All Semester.csv",
+}
+
+# ===============================
+# 0. PEMBACA CSV (PANDAS OPSIONAL)
+# ===============================
+# backend "pandas": kolom diproses vektor (filter, dedup, groupby).
+# backend "csv"   : streaming modul csv (stdlib), dipakai jika pandas tidak ada.
+# Keduanya menghasilkan data problem yang identik.
+BACKEND_AUTO = "auto"
+BACKEND_PANDAS = "pandas"
+BACKEND_CSV = "csv"
+
+def _pandas(backend):
+    """Modul pandas sesuai backend, atau None untuk jalur modul csv."""
+    if backend == BACKEND_CSV: return None
+    try:
+        import pandas as pd  # lazy: tidak dimuat jika data diambil dari cache
+    except ImportError:
+        if backend == BACKEND_PANDAS: raise
+        return None
+    return pd
+
+def _coerce(value):
+    """Tebak tipe nilai CSV seperti pandas: int, lalu float, selain itu string."""
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+def _read_records(path, backend, rename=None):
+    """List dict per baris (kolom di-rename); tipe diinfer oleh pandas / _coerce."""
+    rename = rename or {}
+    pd = _pandas(backend)
+    if pd is not None:
+        return pd.read_csv(path).rename(columns=rename).to_dict(orient="records")
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [rename.get(k, k) for k in next(reader)]
+        return [dict(zip(header, map(_coerce, row))) for row in reader]
+
 # ===============================
 # 1. LOAD DATA DASAR
 # ===============================
-def load_time_slots(path):
-    df = pd.read_csv(path)
-    df = df.rename(columns={"hari": "Hari", "jam_mulai": "Mulai", "jam_selesai": "Selesai", "sks": "sks_val"})
-    if 'Sesi' in df.columns: df = df.drop(columns=['Sesi'])
-    df["slot_id"] = df.index
-    return df.to_dict(orient="records")
-
-def load_rooms(path):
-    df = pd.read_csv(path)
-    df = df.rename(columns={"Ruang Kelas": "Ruang", "Kapasitas Max (Mahasiswa)": "Kapasitas"})
-    df["room_id"] = df.index
-    return df.to_dict(orient="records")
-
-def load_student_counts(path):
-    df = pd.read_csv(path)
-    df = df[df['Angkatan'] != 'Total']
+def load_time_slots(path, backend=BACKEND_AUTO):
+    rename = {"hari": "Hari", "jam_mulai": "Mulai", "jam_selesai": "Selesai", "sks": "sks_val"}
+    slots = _read_records(path, backend, rename)
+    for slot_id, s in enumerate(slots):
+        s.pop('Sesi', None)
+        s["slot_id"] = slot_id
+    return slots
+
+def load_rooms(path, backend=BACKEND_AUTO):
+    rename = {"Ruang Kelas": "Ruang", "Kapasitas Max (Mahasiswa)": "Kapasitas"}
+    rooms = _read_records(path, backend, rename)
+    for room_id, r in enumerate(rooms):
+        r["room_id"] = room_id
+    return rooms
+
+def load_student_counts(path, backend=BACKEND_AUTO):
     current_year = 2025
     mapping = {}
-    for _, row in df.iterrows():
+    for row in _read_records(path, backend):
+        if str(row['Angkatan']) == 'Total': continue
         try:
             angkatan = int(row['Angkatan'])
             sem = (current_year - angkatan) * 2 + 1
@@ -43,25 +101,43 @@ def load_student_counts(path):
 # ===============================
 # 2. LOAD PREFERENSI (DATA FLEXIBILITY)
 # ===============================
-def load_preference_data(path):
-    df = pd.read_csv(path)
-    candidates_dict = {}
-    pref_info = {}
-    
-    for _, row in df.iterrows():
-        dosen = str(row['Nama Dosen']).strip()
-        kode_mk = str(row['Kode MK']).strip()
-        prioritas = int(row['Prioritas'])
-        role = str(row['Berminat'])
-        
-        if kode_mk not in candidates_dict:
-            candidates_dict[kode_mk] = []
-        # Hindari duplikasi nama di list kandidat
-        if dosen not in candidates_dict[kode_mk]:
-            candidates_dict[kode_mk].append(dosen)
-            
-        pref_info[(dosen, kode_mk)] = {'prioritas': prioritas, 'role': role}
-        
+def load_preference_data(path, backend=BACKEND_AUTO):
+    """
+    candidates_dict : kode_mk -> list dosen unik (urutan kemunculan pertama)
+    pref_info       : (dosen, kode_mk) -> {'prioritas', 'role'} (baris terakhir menang)
+    """
+    pd = _pandas(backend)
+    if pd is not None:
+        df = pd.read_csv(path)
+        dosen = df['Nama Dosen'].astype(str).str.strip()
+        kode = df['Kode MK'].astype(str).str.strip()
+        prioritas = df['Prioritas'].astype(int)
+        role = df['Berminat'].astype(str)
+        pairs = pd.DataFrame({"kode": kode, "dosen": dosen})
+
+        # Dedup + groupby vektor: kandidat unik per MK, urutan kemunculan dipertahankan
+        unique = pairs.drop_duplicates()
+        candidates_dict = {k: list(v) for k, v in unique.groupby("kode", sort=False)["dosen"]}
+        pref_info = {
+            (d, k): {'prioritas': p, 'role': r}
+            for d, k, p, r in zip(dosen.tolist(), kode.tolist(), prioritas.tolist(), role.tolist())
+        }
+        return candidates_dict, pref_info
+
+    # Streaming csv: pref_info sekaligus jadi indeks (dosen, MK) untuk cek duplikasi O(1)
+    candidates_dict, seen, pref_info = {}, {}, {}
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        i_dosen, i_kode = header.index('Nama Dosen'), header.index('Kode MK')
+        i_prio, i_role = header.index('Prioritas'), header.index('Berminat')
+        for row in reader:
+            dosen = row[i_dosen].strip()
+            kode_mk = row[i_kode].strip()
+            pair = (dosen, kode_mk)
+            if pair not in pref_info:
+                candidates_dict.setdefault(kode_mk, []).append(dosen)
+            pref_info[pair] = {'prioritas': int(row[i_prio]), 'role': row[i_role] or 'nan'}
     return candidates_dict, pref_info
 
 # ===============================
@@ -107,110 +183,89 @@ def create_class_objects(kode, nama_mk_clean, sks_total, sem, parallel, assigned
 # ===============================
 # 4. GENERATOR KELAS (DENGAN SKS THRESHOLD)
 # ===============================
-def load_mk_active(path_wajib, path_pilihan, candidates_dict, pref_info, student_counts):
+def load_mk_active(path_wajib, path_pilihan, candidates_dict, pref_info, student_counts, rng=random,
+                   backend=BACKEND_AUTO, semester=None, assignment=ASSIGN_GREEDY):
+    semester = semester or SEMESTER_ACTIVE
     classes = []
     counter = 0
     dosen_workload_tracker = {} 
 
+    # --- INDEKS KANDIDAT PER MK (dibangun sekali) ---
+    # kode_mk -> tier prioritas naik, tiap tier = tuple dosen (urutan kemunculan)
+    candidate_index = {}
+    for kode_mk, dosen_list in candidates_dict.items():
+        by_prio = {}
+        for d in dosen_list:
+            by_prio.setdefault(pref_info.get((d, kode_mk), {'prioritas': 99})['prioritas'], []).append(d)
+        candidate_index[kode_mk] = [tuple(by_prio[p]) for p in sorted(by_prio)]
+
     # --- FUNGSI PINTAR PEMILIHAN DOSEN ---
     def get_best_dosen(kode_mk, sks_mk):
-        candidates = candidates_dict.get(kode_mk, [])
-        if not candidates: return "Unknown Dosen"
-        
-        # 1. Shuffle kandidat untuk fairness acak
-        random.shuffle(candidates)
-        
-        # 2. CARI KANDIDAT YANG BELUM "KENYANG" (< 12 SKS)
-        # Prioritaskan mereka dulu tanpa peduli "Prioritas Preferensi"
-        underloaded_candidates = []
-        for d in candidates:
-            load = dosen_workload_tracker.get(d, 0)
-            if load + sks_mk <= 12: # Batas aman
-                # Simpan kandidat + skor prioritasnya
-                prio = pref_info.get((d, kode_mk), {'prioritas': 99})['prioritas']
-                underloaded_candidates.append((d, prio))
-        
-        # Jika ada kandidat yang masih kosong/sedikit beban, PILIH MEREKA DULU!
-        if underloaded_candidates:
-            # Urutkan berdasarkan prioritas (1 terbaik), tapi hanya di antara yang underloaded
-            underloaded_candidates.sort(key=lambda x: x[1]) 
-            chosen = underloaded_candidates[0][0]
-            dosen_workload_tracker[chosen] = dosen_workload_tracker.get(chosen, 0) + sks_mk
-            return chosen
-
-        # 3. JIKA SEMUA SUDAH > 12 SKS (Overload Massal)
-        # Baru kita cari yang "Paling Sedikit Overload-nya"
-        best_candidate = candidates[0]
-        min_load = float('inf')
-        
-        for d in candidates:
-            current_load = dosen_workload_tracker.get(d, 0)
-            if current_load < min_load:
-                min_load = current_load
-                best_candidate = d
-                
-        dosen_workload_tracker[best_candidate] = dosen_workload_tracker.get(best_candidate, 0) + sks_mk
-        return best_candidate
+        tiers = candidate_index.get(kode_mk)
+        if not tiers: return "Unknown Dosen"
+
+        # 1. CARI KANDIDAT YANG BELUM "KENYANG" (<= 12 SKS, batas aman)
+        # Tier prioritas terbaik dulu; seri di tier yang sama diundi (fairness acak)
+        for tier in tiers:
+            underloaded = [d for d in tier if dosen_workload_tracker.get(d, 0) + sks_mk <= 12]
+            if underloaded:
+                chosen = rng.choice(underloaded)
+                break
+        else:
+            # 2. JIKA SEMUA SUDAH > 12 SKS (Overload Massal)
+            # Pilih yang "Paling Sedikit Overload-nya" (seri diundi)
+            everyone = [d for tier in tiers for d in tier]
+            min_load = min(dosen_workload_tracker.get(d, 0) for d in everyone)
+            chosen = rng.choice([d for d in everyone if dosen_workload_tracker.get(d, 0) == min_load])
+
+        dosen_workload_tracker[chosen] = dosen_workload_tracker.get(chosen, 0) + sks_mk
+        return chosen
     # -------------------------------------
 
-    # 1. LOAD SEMUA DATA DULU
-    df_w = pd.read_csv(path_wajib)
-    df_w.columns = [c.lower() for c in df_w.columns]
-    
-    df_p = pd.read_csv(path_pilihan)
-    df_p.columns = [c.lower() for c in df_p.columns]
+    # 1. LOAD SEMUA DATA DULU (kolom di-lowercase)
+    def read_lower(path):
+        return [{k.lower(): v for k, v in row.items()} for row in _read_records(path, backend)]
 
     # 2. GABUNGKAN MK WAJIB & PILIHAN AGAR BISA DIACAK TOTAL
-    # Kita butuh list of dictionary untuk diproses
+    # Item: (kode, nama, sks, label semester, suffix kelas paralel)
     all_mk_to_process = []
+    target_mod = 1 if semester == "Ganjil" else 0
 
-    # Prepare Wajib
-    for _, row in df_w.iterrows():
+    # Prepare Wajib: semester <= 7 dan sesuai ganjil/genap
+    for row in read_lower(path_wajib):
         sem = row['semester']
-        if sem > 7: continue
-        target_mod = 1 if SEMESTER_ACTIVE == "Ganjil" else 0
-        if sem % 2 != target_mod: continue
-        
+        if sem > 7 or sem % 2 != target_mod: continue
         total_mhs = student_counts.get(sem, 0)
-        num_classes = math.ceil(total_mhs / ROOM_CAPACITY_DEFAULT)
-        if num_classes == 0: num_classes = 1
-        
+        num_classes = max(math.ceil(total_mhs / ROOM_CAPACITY_DEFAULT), 1)
         for i in range(num_classes):
-            all_mk_to_process.append({
-                'type': 'Wajib',
-                'row': row,
-                'suffix': chr(65 + i),
-                'sem_label': sem
-            })
+            all_mk_to_process.append((row['kode mk'], row['nama mk'], row['sks'], sem, chr(65 + i)))
 
     # Prepare Pilihan
-    for _, row in df_p.iterrows():
-        sem_str = row['semester']
-        valid = (SEMESTER_ACTIVE == "Ganjil" and "Ganjil" in sem_str) or \
-                (SEMESTER_ACTIVE == "Genap" and "Genap" in sem_str)
-        if valid:
-            all_mk_to_process.append({
-                'type': 'Pilihan',
-                'row': row,
-                'suffix': 'A',
-                'sem_label': 'Pilihan'
-            })
+    for row in read_lower(path_pilihan):
+        if semester in str(row['semester']):
+            all_mk_to_process.append((row['kode mk'], row['nama mk'], row['sks'], 'Pilihan', 'A'))
 
     # 3. ACAK URUTAN (SHUFFLE) - KUNCI FAIRNESS
     # Agar dosen 'A' tidak selalu dapat jatah duluan
-    random.shuffle(all_mk_to_process)
+    rng.shuffle(all_mk_to_process)
 
     # 4. PROSES PEMBENTUKAN KELAS
-    for item in all_mk_to_process:
-        row = item['row']
-        kode = row['kode mk']
-        sks = row['sks']
-        nama = row['nama mk']
-        suffix = item['suffix']
-        sem_label = item['sem_label']
-        
+    if assignment == ASSIGN_FLOW:
+        # Semua MK sekaligus: minim penalti prioritas + kuadrat beban (lihat assignment.py)
+        flow_choice = assign_lecturers(
+            [item[2] for item in all_mk_to_process],
+            [candidates_dict.get(item[0], []) for item in all_mk_to_process],
+            lambda k, d: prio_cost(pref_info.get((d, all_mk_to_process[k][0]), {'prioritas': 99})['prioritas']),
+        )
+    elif assignment != ASSIGN_GREEDY:
+        raise ValueError(f"Metode assignment tidak dikenal: {assignment}")
+
+    for k, (kode, nama, sks, sem_label, suffix) in enumerate(all_mk_to_process):
         # Pilih Dosen (Smart Load Balancing)
-        assigned_dosen = get_best_dosen(kode, sks)
+        if assignment == ASSIGN_FLOW:
+            assigned_dosen = flow_choice[k] or "Unknown Dosen"
+        else:
+            assigned_dosen = get_best_dosen(kode, sks)
         
         new_objs, counter = create_class_objects(
             kode, nama, sks, sem_label, suffix, assigned_dosen, pref_info, counter
@@ -219,32 +274,119 @@ def load_mk_active(path_wajib, path_pilihan, candidates_dict, pref_info, student
 
     return classes
 
-def load_all_data():
-    print(f"\n[Data Loader] Loading Semester: {SEMESTER_ACTIVE} (Smart SKS Thresholding)")
-    slots = load_time_slots(os.path.join(DATA_PATH, "Time_Slots v2.csv"))
-    rooms = load_rooms(os.path.join(DATA_PATH, "Ruang Kelas.csv"))
-    mhs_counts = load_student_counts(os.path.join(DATA_PATH, "Jumlah Mahasiswa TIF.csv"))
-    candidates, pref_info = load_preference_data(os.path.join(DATA_PATH, "Preferensi MK dosen TIFv2.csv"))
+# ===============================
+# 5. INSTANCE BER-KODE INTEGER
+# ===============================
+def encode_instance(classes, candidates_dict, pref_info):
+    """
+    Array yang dipakai ClassTable: atribut numerik kelas, kode MK & dosen -> index,
+    kandidat dosen per kode MK (array index) dan matriks prioritas [kode_mk x dosen]
+    (default 99; prioritas hasil validasi loader untuk dosen awal menimpa preferensi).
+    """
+    kode_mk = [c['kode_mk'] for c in classes]
+    kode_list = sorted(set(kode_mk) | set(candidates_dict))
+    kode_pos = {k: i for i, k in enumerate(kode_list)}
+
+    names = {c['dosen'] for c in classes}
+    for dosen_list in candidates_dict.values():
+        names.update(dosen_list)
+    dosen_names = sorted(names)
+    dosen_pos = {d: i for i, d in enumerate(dosen_names)}
+
+    kode_index = np.array([kode_pos[k] for k in kode_mk], dtype=np.int32)
+    initial_dosen = np.array([dosen_pos[c['dosen']] for c in classes], dtype=np.int32)
+    candidates = [
+        np.array([dosen_pos[d] for d in candidates_dict.get(k, [])], dtype=np.int32) for k in kode_list
+    ]
+
+    priority = np.full((len(kode_list), len(dosen_names)), 99, dtype=np.int32)
+    entries = [
+        (kode_pos[kode], dosen_pos[dosen], info['prioritas'])
+        for (dosen, kode), info in pref_info.items()
+        if kode in kode_pos and dosen in dosen_pos
+    ]
+    if entries:
+        rows, cols, values = np.array(entries, dtype=np.int64).T
+        priority[rows, cols] = values
+    for i, c in enumerate(classes):
+        priority[kode_index[i], initial_dosen[i]] = c.get('dosen_priority', 99)
+
+    return {
+        "class_ids": np.array([c['class_id'] for c in classes], dtype=np.int32),
+        "sks": np.array([c['sks'] for c in classes], dtype=np.int32),
+        "jumlah_mhs": np.array([c['jumlah_mhs'] for c in classes], dtype=np.int32),
+        "kode_list": kode_list,
+        "kode_index": kode_index,
+        "dosen_names": dosen_names,
+        "initial_dosen": initial_dosen,
+        "candidates": candidates,
+        "priority": priority,
+    }
+
+def load_all_data(seed=None, use_cache=True, cache_dir=None, data_dir=None, backend=BACKEND_AUTO, semester=None,
+                  assignment=None):
+    """
+    seed: agar pengacakan urutan MK & kandidat dosen bisa diulang persis.
+    Dengan seed tetap, hasil parsing di-cache (lihat data_cache) dan start
+    berikutnya tidak perlu pandas. seed=None (acak) tidak pernah di-cache.
+    data_dir: folder CSV input (default DATA_PATH); backend: "auto", "pandas", "csv".
+    semester: "Ganjil" / "Genap" (default SEMESTER_ACTIVE).
+    assignment: dosen awal "greedy" (default) atau "flow" (min-cost flow).
+    """
+    semester = semester or SEMESTER_ACTIVE
+    assignment = assignment or ASSIGN_GREEDY
+    data_dir = data_dir or DATA_PATH
+    # Pengaturan loader ikut disimpan di data (checkpoint memakainya untuk memuat ulang)
+    loader = {"seed": seed, "semester": semester, "data_dir": os.path.abspath(data_dir), "assignment": assignment}
+    paths = {name: os.path.join(data_dir, filename) for name, filename in DATA_FILES.items()}
+    cache_dir = cache_dir or os.path.join(data_dir, '.cache')
+    key = None
+    if use_cache and seed is not None:
+        settings = {"semester": semester, "room_capacity": ROOM_CAPACITY_DEFAULT, "seed": seed, "assignment": assignment}
+        key = cache_key(paths.values(), settings)
+        data = load_cached(cache_dir, key)
+        if data is not None:
+            print(f"\n[Data Loader] Semester: {semester} (cache {key[:8]})")
+            print(f"✅ Data Loaded: {len(data['classes'])} Sesi Kelas terbentuk.")
+            data["loader"] = loader
+            data["encoded"] = encode_instance(data['classes'], data['candidates'], data['pref_info'])
+            return data
+
+    rng = random.Random(seed)
+    print(f"\n[Data Loader] Loading Semester: {semester} (Smart SKS Thresholding)")
+    slots = load_time_slots(paths["slots"], backend)
+    rooms = load_rooms(paths["rooms"], backend)
+    mhs_counts = load_student_counts(paths["students"], backend)
+    candidates, pref_info = load_preference_data(paths["preferences"], backend)
     
     classes = load_mk_active(
-        os.path.join(DATA_PATH, "MK Wajib TIF_All Semester.csv"),
-        os.path.join(DATA_PATH, "MK Pilihan TIF_All Semester.csv"),
-        candidates, pref_info, mhs_counts
+        paths["mk_wajib"], paths["mk_pilihan"],
+        candidates, pref_info, mhs_counts, rng=rng, backend=backend, semester=semester,
+        assignment=assignment,
     )
 
     print(f"✅ Data Loaded: {len(classes)} Sesi Kelas terbentuk.")
-    return {
+    data = {
         "slots": slots, "rooms": rooms, "classes": classes,
         "candidates": candidates, "pref_info": pref_info
     }
+    if key is not None:
+        try:
+            save_cached(cache_dir, key, data)
+        except OSError as e:
+            print(f"⚠️ Cache data tidak bisa ditulis: {e}")
+    data["loader"] = loader
+    data["encoded"] = encode_instance(classes, candidates, pref_info)
+    return data
 
 
 # Untuk debugging hasil data loader nya
 
 # ===============================
-# 5. EXPORT KE CSV (TAMBAHAN)
+# 6. EXPORT KE CSV (TAMBAHAN)
 # ===============================
 def save_results_to_csv(data_result, output_folder="hasil_output"):
+    import pandas as pd
     # Buat folder jika belum ada
     output_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), output_folder)
     if not os.path.exists(output_path):
@@ -0,0 +1,96 @@
+# ===============================
+# DIAGNOSA DATA (FLEKSIBILITAS & BOTTLENECK FAIRNESS)
+# ===============================
+# Pengganti check_data_flexibility.py & check_fairness_bottleneck.py.
+# Bekerja di atas data hasil load_all_data (bisa dari cache, tanpa pandas).
+
+def flexibility_report(candidates):
+    """Berapa MK yang hanya punya 1 kandidat dosen (tidak bisa di-balance)."""
+    print("=== DIAGNOSA FLEKSIBILITAS JADWAL ===")
+    total_mk = len(candidates)
+    if total_mk == 0:
+        print("Data preferensi kosong.")
+        return {"total_mk": 0, "locked": []}
+    print(f"\nTotal Mata Kuliah Terdaftar di Preferensi: {total_mk}")
+
+    print("\n--- DAFTAR MK YANG 'TERKUNCI' (Hanya 1 Dosen) ---")
+    print("GA tidak bisa menyeimbangkan beban untuk MK ini:")
+    locked = []
+    for kode, dosen_list in candidates.items():
+        if len(set(dosen_list)) == 1:
+            locked.append(kode)
+            print(f"  🔒 {kode}: {dosen_list[0]}")
+    mk_single, mk_multi = len(locked), total_mk - len(locked)
+
+    print("\n--- STATISTIK ---")
+    print(f"MK Terkunci (1 Dosen)  : {mk_single} ({mk_single/total_mk*100:.1f}%)")
+    print(f"MK Fleksibel (>1 Dosen): {mk_multi} ({mk_multi/total_mk*100:.1f}%)")
+
+    if mk_single > mk_multi:
+        print("\n⚠️ KESIMPULAN: Masalah Data.")
+        print("Sebagian besar MK hanya punya 1 kandidat.")
+        print("Fairness (SD) TIDAK AKAN BISA BAGUS karena tidak ada opsi tukar dosen.")
+    else:
+        print("\n✅ KESIMPULAN: Data Bagus.")
+        print("Banyak opsi tukar dosen. Masalah ada di codingan Load Balancing.")
+    return {"total_mk": total_mk, "locked": locked}
+
+def workload_from_classes(classes):
+    """Beban SKS per dosen (known) dari assignment awal data loader."""
+    workload = {}
+    for c in classes:
+        if "Unknown" in c['dosen']: continue
+        workload[c['dosen']] = workload.get(c['dosen'], 0) + c['sks']
+    return workload
+
+def workload_from_schedule(path):
+    """Beban SKS per dosen dari CSV hasil export_schedule_to_csv."""
+    import csv
+    workload = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            dosen = row['Dosen']
+            if "Unknown" in dosen or "Belum" in dosen: continue
+            workload[dosen] = workload.get(dosen, 0) + int(row['SKS'])
+    return workload
+
+def split_by_load(workload, overload=15, underload=10):
+    """Kelompok dosen overload (> overload SKS) & underload (< underload SKS)."""
+    over = sorted((d for d, w in workload.items() if w > overload), key=lambda d: -workload[d])
+    under = sorted((d for d, w in workload.items() if w < underload), key=lambda d: workload[d])
+    return over, under
+
+def bottleneck_report(candidates, overload_group, underload_group):
+    """Adakah MK dosen overload yang bisa dipindah ke dosen underload?"""
+    print("=== DIAGNOSA KEBUNTUAN FAIRNESS ===")
+    # Mapping: Siapa bisa ngajar apa
+    dosen_skills = {}
+    for kode, dosen_list in candidates.items():
+        for dosen in dosen_list:
+            dosen_skills.setdefault(dosen, set()).add(kode)
+    underload = set(underload_group)
+
+    print(f"\nAnalisis Transfer SKS dari {overload_group} ke {underload_group}")
+    print("-" * 60)
+
+    transfers = {}
+    for dosen_kaya in overload_group:
+        print(f"\n🔍 Cek Mata Kuliah milik {dosen_kaya}:")
+        found_transfer = False
+        for mk in sorted(dosen_skills.get(dosen_kaya, ())):
+            # Siapa lagi yang bisa ngajar MK ini (dan sedang underload)?
+            irisan = [d for d in candidates.get(mk, []) if d in underload]
+            if irisan:
+                print(f"  ✅ BISA DITRANSFER: MK {mk} -> Bisa diambil oleh {irisan}")
+                transfers.setdefault(dosen_kaya, {})[mk] = irisan
+                found_transfer = True
+        if not found_transfer:
+            print("  ❌ TIDAK ADA SATUPUN MK DOSEN INI YANG BISA DIAMBIL DOSEN UNDERLOAD.")
+
+    print("-" * 60)
+    if not transfers:
+        print("KESIMPULAN: Masalah Data! Dosen Underload tidak punya kompetensi (di CSV) untuk mengambil MK milik Dosen Overload.")
+        print("SOLUSI: Edit CSV Preferensi, tambahkan nama Dosen Underload ke MK tersebut (Prio 2).")
+    else:
+        print("KESIMPULAN: Data Aman! Masalah ada di Algoritma Mutasi GA yang kurang pintar.")
+    return transfers
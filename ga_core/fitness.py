@@ -1,4 +1,41 @@
 import numpy as np
+from collections import namedtuple
+
+# ===============================
+# RECORD KONFLIK (TERSTRUKTUR)
+# ===============================
+KIND_CAPACITY = "Kapasitas"
+KIND_ROOM = "Tabrakan Ruang"
+KIND_DOSEN = "Tabrakan Dosen"
+
+# kind: jenis konflik | genes: tuple index gen | resource: room_id / index dosen | penalty: kontribusi
+Conflict = namedtuple("Conflict", ["kind", "genes", "resource", "penalty"])
+
+class ConflictList(list):
+    """List of Conflict + indeks per gen yang dibangun saat pertama dibutuhkan."""
+    _index = None
+
+    def gene_index(self):
+        """dict: index gen -> list Conflict yang melibatkan gen tersebut."""
+        if self._index is None:
+            index = {}
+            for record in self:
+                for g in record.genes:
+                    index.setdefault(g, []).append(record)
+            self._index = index
+        return self._index
+
+    def problem_genes(self):
+        return sorted(self.gene_index())
+
+def describe_conflict(record, table):
+    """Teks konflik untuk laporan (hanya dibuat saat dibutuhkan)."""
+    names = [table.nama_mk[g] for g in record.genes]
+    if record.kind == KIND_CAPACITY:
+        return f"[{KIND_CAPACITY}] {names[0]} excess"
+    if record.kind == KIND_DOSEN:
+        return f"[{KIND_DOSEN}] {table.dosen_names[record.resource]}: {names[0]} vs {names[1]}"
+    return f"[{record.kind}] {' vs '.join(names)}"
 
 class FitnessCalculator:
     def __init__(self, slots, rooms):
@@ -19,32 +56,102 @@ class FitnessCalculator:
         self.WEIGHT_SOFT_UNKNOWN = 50  # Prioritas 99 (Penalti Besar/Salah Dosen)
         self.WEIGHT_SOFT_FAIR = 100     # Fairness
 
+        # --- TABEL UNTUK EVALUASI BATCH (VEKTOR) ---
+        self.n_slots = max(self.slot_details) + 1
+        self.n_rooms = max(self.rooms) + 1
+        self.room_capacity = np.zeros(self.n_rooms)  # Kapasitas per room_id
+        for r_id, r in self.rooms.items():
+            self.room_capacity[r_id] = r['Kapasitas']
+
+        # --- INDEKS WAKTU (dihitung sekali, dipakai bersama) ---
+        self._build_timeline()
+        self.slot_overlap = self._build_overlap_matrix()
+        # Versi float agar bisa dipakai matmul BLAS
+        self._overlap = self.slot_overlap.astype(float)
+        # Versi list untuk loop berpasangan di calculate()
+        self._overlap_rows = self.slot_overlap.tolist()
+
+        # Constraint tambahan ter-compile (lihat constraints.build_constraints)
+        self.constraints = ()
+
     def _time_to_minutes(self, time_str):
         h, m = map(int, time_str.split(':')[:2])
         return h * 60 + m
 
+    def _build_timeline(self):
+        """
+        Timeline per hari: batas jam mulai/selesai semua slot di hari itu
+        memecah hari menjadi sel waktu diskrit. Setiap slot menempati
+        rentang sel yang berurutan, sehingga dua slot overlap <=> berbagi sel.
+        - slot_cells[s]    : array id sel global yang ditempati slot s
+        - slot_cell_bits[s]: bitmask (int) dari sel yang sama
+        - slot_cell_mask   : matriks boolean [slot x sel]
+        """
+        boundaries = {}
+        for d in self.slot_details.values():
+            boundaries.setdefault(d['hari'], set()).update((d['start'], d['end']))
+
+        self.day_names = sorted(boundaries)
+        self.cell_day = []      # hari dari tiap sel
+        self.cell_bounds = []   # (mulai, selesai) menit tiap sel
+        day_offset = {}
+        for hari in self.day_names:
+            points = sorted(boundaries[hari])
+            day_offset[hari] = (len(self.cell_bounds), points)
+            for start, end in zip(points[:-1], points[1:]):
+                self.cell_day.append(hari)
+                self.cell_bounds.append((start, end))
+        self.n_cells = len(self.cell_bounds)
+
+        self.slot_cells = {}
+        self.slot_cell_bits = {}
+        self.slot_cell_mask = np.zeros((self.n_slots, self.n_cells), dtype=bool)
+        for s_id, d in self.slot_details.items():
+            offset, points = day_offset[d['hari']]
+            first = offset + points.index(d['start'])
+            last = offset + points.index(d['end'])
+            cells = np.arange(first, last, dtype=np.int32)
+            self.slot_cells[s_id] = cells
+            self.slot_cell_bits[s_id] = ((1 << (last - first)) - 1) << first
+            self.slot_cell_mask[s_id, first:last] = True
+
+    def _build_overlap_matrix(self):
+        """Matriks boolean [slot x slot]: True jika dua slot beririsan waktunya."""
+        mask = self.slot_cell_mask.astype(np.int32)
+        overlap = (mask @ mask.T) > 0
+        overlap[np.diag_indices(self.n_slots)] = True
+        overlap.setflags(write=False)
+        return overlap
+
     def check_overlap(self, slot1_id, slot2_id):
-        if slot1_id == slot2_id: return True
-        s1, s2 = self.slot_details[slot1_id], self.slot_details[slot2_id]
-        if s1['hari'] != s2['hari']: return False
-        return (s1['start'] < s2['end']) and (s2['start'] < s1['end'])
+        return bool(self.slot_overlap[slot1_id, slot2_id])
 
-    def calculate(self, chromosome):
-        conflicts = []
+    def calculate(self, individual):
+        table = individual.table
+        slot_ids = individual.slot_ids
+        room_ids = individual.room_ids
+        dosen_ids = individual.dosen_ids
+
+        conflicts = ConflictList()
         penalty_score = 0
         
         genes_by_room = {}
         genes_by_dosen = {}
         dosen_workload = {} 
         
-        for gene in chromosome:
+        priorities = table.priorities(dosen_ids)
+        
+        for i in range(table.n_classes):
+            r_id = int(room_ids[i])
+            d_idx = int(dosen_ids[i])
+            
             # 1. Cek Kapasitas
-            if gene['jumlah_mhs'] > self.rooms[gene['room_id']]['Kapasitas']:
+            if table.jumlah_mhs[i] > self.rooms[r_id]['Kapasitas']:
                 penalty_score += self.WEIGHT_HARD
-                conflicts.append(f"[Kapasitas] {gene['nama_mk']} excess")
+                conflicts.append(Conflict(KIND_CAPACITY, (i,), r_id, self.WEIGHT_HARD))
 
             # 2. Preferensi Dosen (Soft Constraint)
-            prio = gene.get('dosen_priority', 99)
+            prio = priorities[i]
             
             if prio == 1:
                 pass # Sempurna, 0 Penalty
@@ -54,47 +161,151 @@ class FitnessCalculator:
                 # Prio 99 atau lainnya (Bukan prioritas/Salah Dosen)
                 penalty_score += self.WEIGHT_SOFT_UNKNOWN
             
-            # Grouping
-            r_id = gene['room_id']
+            # Grouping (simpan index gen)
             if r_id not in genes_by_room: genes_by_room[r_id] = []
-            genes_by_room[r_id].append(gene)
+            genes_by_room[r_id].append(i)
             
-            d_name = gene['dosen']
-            if d_name not in genes_by_dosen: genes_by_dosen[d_name] = []
-            genes_by_dosen[d_name].append(gene)
+            if d_idx not in genes_by_dosen: genes_by_dosen[d_idx] = []
+            genes_by_dosen[d_idx].append(i)
             
             # Hitung Workload (SKS)
-            if "Unknown" not in d_name:
-                dosen_workload[d_name] = dosen_workload.get(d_name, 0) + gene['sks']
+            if table.dosen_known[d_idx]:
+                dosen_workload[d_idx] = dosen_workload.get(d_idx, 0) + int(table.sks[i])
 
         # 3. Cek Tabrakan Ruang
+        slots = slot_ids.tolist()
         for r_id, class_list in genes_by_room.items():
-            for i in range(len(class_list)):
-                for j in range(i + 1, len(class_list)):
-                    if self.check_overlap(class_list[i]['slot_id'], class_list[j]['slot_id']):
-                        penalty_score += self.WEIGHT_HARD
-                        conflicts.append(f"[Tabrakan Ruang] {class_list[i]['nama_mk']} vs {class_list[j]['nama_mk']}")
+            for i, j in self._overlapping_pairs(class_list, slots):
+                penalty_score += self.WEIGHT_HARD
+                conflicts.append(Conflict(KIND_ROOM, (i, j), r_id, self.WEIGHT_HARD))
 
         # 4. Cek Tabrakan Dosen
-        for d_name, class_list in genes_by_dosen.items():
-            if "Unknown" in d_name: continue
-            for i in range(len(class_list)):
-                for j in range(i + 1, len(class_list)):
-                    if self.check_overlap(class_list[i]['slot_id'], class_list[j]['slot_id']):
-                        penalty_score += self.WEIGHT_HARD
-                        conflicts.append(f"[Tabrakan Dosen] {d_name}: {class_list[i]['nama_mk']} vs {class_list[j]['nama_mk']}")
+        for d_idx, class_list in genes_by_dosen.items():
+            if not table.dosen_known[d_idx]: continue
+            for i, j in self._overlapping_pairs(class_list, slots):
+                penalty_score += self.WEIGHT_HARD
+                conflicts.append(Conflict(KIND_DOSEN, (i, j), d_idx, self.WEIGHT_HARD))
         
-        # 5. FAIRNESS
+        # 5. Constraint tambahan (registry); soft hanya menambah penalti
+        for constraint in self.constraints:
+            records = constraint.records(slot_ids, room_ids, dosen_ids)
+            penalty_score += constraint.weight * len(records)
+            if constraint.hard:
+                conflicts.extend(records)
+
+        # 6. FAIRNESS
         if dosen_workload:
-            loads = list(dosen_workload.values())
-            std_dev = np.std(loads)
-            
-            # AMBANG BATAS TOLERANSI: SD 2.5
-            # Jika SD > 2.5, hukuman naik drastis (Eksponensial)
-            if std_dev > 2.5:
-                penalty_score += (std_dev ** 3) * 100
-            else:
-                penalty_score += (std_dev * 50)
+            loads = np.zeros((1, table.n_dosen))
+            for d_idx, load in dosen_workload.items():
+                loads[0, d_idx] = load
+            active = loads > 0
+            penalty_score += self._fairness_penalty(loads, active)[0]
 
         fitness = 1.0 / (1.0 + penalty_score)
-        return fitness, conflicts
\ No newline at end of file
+        return fitness, conflicts
+
+    def _overlapping_pairs(self, class_list, slots, rows=None):
+        """
+        Pasangan (i, j) dalam satu grup (ruang/dosen) yang slotnya beririsan,
+        urutan a < b. Memakai baris overlap berbentuk list (tanpa indexing
+        numpy per pasangan) sehingga grup besar (ruang padat mode decoder) tetap murah.
+        rows: relasi slot lain (list of list bool), default overlap waktu.
+        """
+        rows = self._overlap_rows if rows is None else rows
+        pairs = []
+        for a in range(len(class_list)):
+            i = class_list[a]
+            row = rows[slots[i]]
+            for j in class_list[a + 1:]:
+                if row[slots[j]]:
+                    pairs.append((i, j))
+        return pairs
+
+    def _fairness_penalty(self, loads, active):
+        """
+        Penalty fairness per baris dari matriks beban SKS [pop x dosen].
+        Hanya dosen aktif (punya kelas & bukan Unknown) yang dihitung.
+        Dipakai oleh jalur skalar dan batch agar hasilnya identik.
+        """
+        n_active = active.sum(axis=1)
+        safe_n = np.maximum(n_active, 1)
+        mean = loads.sum(axis=1) / safe_n
+        dev = np.where(active, loads - mean[:, None], 0.0)
+        std_dev = np.sqrt((dev * dev).sum(axis=1) / safe_n)
+
+        # AMBANG BATAS TOLERANSI: SD 2.5
+        # Jika SD > 2.5, hukuman naik drastis (Eksponensial)
+        penalty = np.where(std_dev > 2.5, (std_dev ** 3) * 100, std_dev * 50)
+        return np.where(n_active > 0, penalty, 0.0)
+
+    def _pair_clashes(self, flat_index, weights, n_rows, n_resources, relation=None):
+        """
+        Jumlah pasangan kelas yang tabrakan per baris populasi.
+        occupancy[p, r, s] = banyak kelas di resource r pada slot s.
+        Pasangan overlap = (sum_s occ * (occ @ overlap) - n) / 2,
+        identik dengan cek berpasangan O(n^2) di calculate().
+        relation: matriks float [slot x slot] pengganti overlap (diagonal 1).
+        """
+        size = n_rows * n_resources * self.n_slots
+        occupancy = np.bincount(flat_index, weights=weights, minlength=size)
+        occupancy = occupancy.reshape(n_rows, n_resources, self.n_slots)
+        relation = self._overlap if relation is None else relation
+        ordered = (occupancy * (occupancy @ relation)).sum(axis=(1, 2))
+        return np.rint((ordered - occupancy.sum(axis=(1, 2))) / 2).astype(np.int64)
+
+    def score_matrices(self, table, slot_mat, room_mat, dosen_mat):
+        """
+        Evaluasi vektor untuk matriks [pop_size x n_classes].
+        Return: (penalty per individu, jumlah pelanggaran hard per individu)
+        """
+        n_rows = slot_mat.shape[0]
+        row = np.arange(n_rows)[:, None]
+
+        # 1. Kapasitas
+        over_capacity = (table.jumlah_mhs[None, :] > self.room_capacity[room_mat]).sum(axis=1)
+
+        # 2. Preferensi Dosen
+        prio = table.priority[table.kode_index[None, :], dosen_mat]
+        prio_penalty = np.where(prio == 1, 0, np.where(prio == 2, self.WEIGHT_SOFT_PRIO_2, self.WEIGHT_SOFT_UNKNOWN)).sum(axis=1)
+
+        # 3. Tabrakan Ruang
+        room_index = (row * self.n_rooms + room_mat) * self.n_slots + slot_mat
+        room_clash = self._pair_clashes(room_index.ravel(), None, n_rows, self.n_rooms)
+
+        # 4. Tabrakan Dosen (dosen Unknown diabaikan)
+        known = table.dosen_known[dosen_mat]
+        dosen_index = (row * table.n_dosen + dosen_mat) * self.n_slots + slot_mat
+        dosen_clash = self._pair_clashes(dosen_index.ravel(), known.ravel().astype(float), n_rows, table.n_dosen)
+
+        # 5. Fairness
+        load_index = (row * table.n_dosen + dosen_mat).ravel()
+        size = n_rows * table.n_dosen
+        loads = np.bincount(load_index, weights=(table.sks[None, :] * known).ravel(), minlength=size)
+        taught = np.bincount(load_index, weights=known.ravel().astype(float), minlength=size)
+        loads = loads.reshape(n_rows, table.n_dosen)
+        active = taught.reshape(n_rows, table.n_dosen) > 0
+
+        hard = over_capacity + room_clash + dosen_clash
+        penalty = (hard * self.WEIGHT_HARD + prio_penalty).astype(float)
+
+        # 6. Constraint tambahan (registry)
+        for constraint in self.constraints:
+            count = constraint.batch(slot_mat, room_mat, dosen_mat)
+            penalty += constraint.weight * count
+            if constraint.hard:
+                hard = hard + count
+        penalty += self._fairness_penalty(loads, active)
+        return penalty, hard
+
+    def calculate_batch(self, population):
+        """
+        Skor seluruh populasi sekaligus.
+        Return: (fitness array, penalty array, jumlah konflik array)
+        """
+        table = population[0].table
+        slot_mat = np.stack([ind.slot_ids for ind in population])
+        room_mat = np.stack([ind.room_ids for ind in population])
+        dosen_mat = np.stack([ind.dosen_ids for ind in population])
+        penalty, hard = self.score_matrices(table, slot_mat, room_mat, dosen_mat)
+        fitness = 1.0 / (1.0 + penalty)
+        return fitness, penalty, hard
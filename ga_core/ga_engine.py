@@ -1,102 +1,382 @@
-import copy
+from ga_core.class_table import ClassTable
 from ga_core.individual import Individual
 from ga_core.fitness import FitnessCalculator
 import ga_core.operators as ops
 from ga_core.local_search import LocalSearch
+from ga_core.repair import make_repair_engine
+from ga_core.room_decoder import RoomDecoder
+from ga_core.constraints import build_constraints, DEFAULT_CONSTRAINTS
+from ga_core.parallel import OffspringExecutor, BACKEND_SERIAL
+from ga_core.seeding import ConstructiveSeeder, seeded_individuals, METHOD_MIXED
+from ga_core.rng import seed_sequence, spawn_seeds, make_rngs
+from ga_core.telemetry import PhaseTimer, NULL_TIMER, generation_record, recorder_for_path
+from ga_core import checkpoint
+import time
+
+STAGNATION_MUTATION = "mutation"
+STAGNATION_RESTART = "restart"
 
 class GeneticAlgorithm:
-    def __init__(self, data, params):
+    def __init__(self, data, params, observers=None):
         self.data = data
         self.params = params
         
+        # RNG: satu seed di params -> stream eksplisit untuk semua komponen
+        self.seed_seq = seed_sequence(params.get('seed'))
+        self.seed = self.seed_seq.entropy
+        self.rng, self.np_rng = make_rngs(self.seed_seq)
+        
         self.classes = data['classes']
         self.slots = data['slots']
         self.rooms = data['rooms']
         self.candidates = data['candidates']
         self.pref_info = data['pref_info']
         
+        # Tabel kelas dibangun sekali, dibagi ke semua individu
+        self.table = ClassTable.from_data(data)
+        
         self.fitness_calc = FitnessCalculator(self.slots, self.rooms)
+        # Constraint tambahan (kohort, sesi split, ...) di-compile sekali per run
+        self.fitness_calc.constraints = build_constraints(
+            params.get('constraints', DEFAULT_CONSTRAINTS), self.table, self.fitness_calc
+        )
+        
+        # Mode decoder: ruang dihitung dari slot per hari (interval coloring best-fit)
+        self.room_decoder = RoomDecoder(self.table, self.fitness_calc) if params.get('room_decoder') else None
         
         # Inisialisasi Local Search
-        self.ls_engine = LocalSearch(self.fitness_calc, self.candidates, self.pref_info)
+        self.ls_engine = LocalSearch(self.fitness_calc, self.candidates, self.pref_info, self.room_decoder)
+        # Engine repair konflik: 'fihc' (default), 'tabu', atau 'annealing'
+        self.repair_engine = make_repair_engine(params, self.fitness_calc, self.ls_engine, self.room_decoder)
+        
+        # Backend produksi anak: serial / thread / process
+        self.executor = OffspringExecutor(
+            self,
+            backend=params.get('backend', BACKEND_SERIAL),
+            workers=params.get('workers'),
+            chunk_size=params.get('chunk_size'),
+        )
+        
+        # Telemetry: aktif hanya jika ada observer (biaya ~0 jika mati)
+        self.observers = list(observers or [])
+        if params.get('telemetry_path'):
+            self.observers.append(recorder_for_path(params['telemetry_path']))
+        
+        # Kontrol stagnasi: naikkan mutasi atau restart jika best tidak membaik K generasi
+        self.base_mutation_rate = params['mutation_rate']
+        self.mutation_rate = self.base_mutation_rate
+        self.stagnation_window = params.get('stagnation_window')
+        self.stagnation_action = params.get('stagnation_action', STAGNATION_MUTATION)
+        if self.stagnation_action not in (STAGNATION_MUTATION, STAGNATION_RESTART):
+            raise ValueError(f"Aksi stagnasi tidak dikenal: {self.stagnation_action}")
+        self.stagnant_generations = 0
+        self.restarts = 0
         
         self.population = []
         self.best_individual = None
         self.history = []
+        self.generation = 0
+        self.stop_reason = None
+        self._stop_requested = False
+
+    def add_observer(self, observer):
+        self.observers.append(observer)
+
+    @classmethod
+    def resume(cls, path, data=None, params=None, observers=None):
+        """
+        Lanjutkan run dari checkpoint. data=None -> dimuat ulang dengan pengaturan
+        loader tersimpan (seed, semester, data_dir, assignment).
+        params (opsional) menimpa params tersimpan, mis. max_generations baru.
+        """
+        meta, arrays = checkpoint.read_checkpoint(path)
+        run_params = dict(meta["params"], **(params or {}))
+        if data is None:
+            from ga_core.data_loader import load_all_data
+            data = load_all_data(**checkpoint.loader_settings(meta))
+        engine = cls(data, run_params, observers)
+        checkpoint.restore_engine(engine, meta, arrays)
+        print(f">>> Resume dari {path} (generasi {engine.generation})")
+        return engine
+
+    def save_checkpoint(self, path=None):
+        """Simpan snapshot state ke path (default params['checkpoint_path'])."""
+        checkpoint.save_checkpoint(self, path or self.params['checkpoint_path'])
+
+    def request_stop(self):
+        """Minta run() berhenti setelah generasi berjalan selesai (aman dari thread lain)."""
+        self._stop_requested = True
+
+    def current_best(self):
+        """Solusi terbaik sejauh ini (anytime), lengkap dengan rincian konflik."""
+        best = self.best_individual
+        if best is not None and best.conflicts is None:
+            best.compute_fitness(self.fitness_calc)
+        return best
+
+    def _new_individuals(self, count):
+        """Individu baru: sebagian konstruktif (DSatur / greedy), sisanya acak."""
+        n_seeded = min(count, round(count * self.params.get('seed_ratio', 0.0)))
+        individuals = []
+        if n_seeded:
+            seeder = ConstructiveSeeder(self.table, self.fitness_calc)
+            method = self.params.get('seed_method', METHOD_MIXED)
+            individuals.extend(seeded_individuals(seeder, n_seeded, method, self.rng))
+        for _ in range(count - n_seeded):
+            ind = Individual(self.table)
+            ind.initialize_random(self.rng)
+            individuals.append(ind)
+        if self.room_decoder is not None:
+            for ind in individuals:
+                self.room_decoder.apply(ind)
+        return individuals, n_seeded
 
     def initialize_population(self):
-        print(">>> Inisialisasi Populasi Awal...")
-        self.population = []
-        for _ in range(self.params['pop_size']):
-            ind = Individual(self.classes, self.slots, self.rooms)
-            ind.initialize_random()
-            ind.compute_fitness(self.fitness_calc)
-            self.population.append(ind)
+        pop_size = self.params['pop_size']
+        self.population, n_seeded = self._new_individuals(pop_size)
+        print(f">>> Inisialisasi Populasi Awal... ({n_seeded} konstruktif, {pop_size - n_seeded} acak)")
+        # Warm start: jadwal terbaik run sebelumnya menggantikan satu individu acak
+        if self.params.get('warm_start'):
+            self.population[-1] = checkpoint.load_best(self.params['warm_start'], self.table, self.rng)
+            print(f">>> Warm start dari {self.params['warm_start']}")
+        self.evaluate_population(self.population)
         self.population.sort(key=lambda x: x.fitness, reverse=True)
-        self.best_individual = copy.deepcopy(self.population[0])
+        self.population[0].compute_fitness(self.fitness_calc)
+        self.best_individual = self.population[0].clone()
+
+    def evaluate_population(self, individuals):
+        """Hitung fitness banyak individu sekaligus (jalur vektor)."""
+        if not individuals: return
+        fitness, _, n_conflicts = self.fitness_calc.calculate_batch(individuals)
+        for ind, fit, n_conf in zip(individuals, fitness, n_conflicts):
+            ind.set_batch_score(fit, n_conf)
 
     def evolve_generation(self):
+        timer = PhaseTimer() if self.observers else NULL_TIMER
+        wall_start = time.perf_counter()
+        timer.start()
         new_population = []
         
         # Elitism
         elitism_count = self.params.get('elitism', 1)
-        new_population.extend(copy.deepcopy(self.population[:elitism_count]))
-        
-        # Reproduksi
-        while len(new_population) < self.params['pop_size']:
-            parent1 = ops.tournament_selection(self.population)
-            parent2 = ops.tournament_selection(self.population)
-            
-            child1, child2 = ops.crossover(parent1, parent2, self.params['crossover_rate'])
-            
-            # Mutasi Random
-            ops.mutation(child1, self.slots, self.rooms, self.candidates, self.pref_info, self.params['mutation_rate'])
-            ops.mutation(child2, self.slots, self.rooms, self.candidates, self.pref_info, self.params['mutation_rate'])
-            
-            # --- MEMETIC ALGORITHM UPGRADE ---
-            
-            # LANGKAH 1: REPAIR KONFLIK (Hilangkan Tabrakan Ruang/Dosen)
-            # Kita pass all_slots dan all_rooms agar dia bisa pindah-pindah jam
-            self.ls_engine.resolve_conflicts(child1, self.slots, self.rooms)
-            self.ls_engine.resolve_conflicts(child2, self.slots, self.rooms)
-            
-            # LANGKAH 2: LOAD BALANCING (Ratakan SKS dengan Aman)
-            self.ls_engine.apply_load_balancing(child1)
-            self.ls_engine.apply_load_balancing(child2)
-            
-            # Hitung Fitness Akhir
-            child1.compute_fitness(self.fitness_calc)
-            child2.compute_fitness(self.fitness_calc)
-            
-            new_population.append(child1)
-            if len(new_population) < self.params['pop_size']:
-                new_population.append(child2)
+        new_population.extend(ind.clone() for ind in self.population[:elitism_count])
+        timer.lap("elitism")
+        
+        # Reproduksi: seleksi di proses utama, tiap pasangan dapat seed sendiri
+        n_children = self.params['pop_size'] - len(new_population)
+        n_pairs = (n_children + 1) // 2
+        task_seeds = spawn_seeds(self.seed_seq, n_pairs)
+        tasks = []
+        for seed in task_seeds:
+            parent1 = ops.tournament_selection(self.population, rng=self.rng)
+            parent2 = ops.tournament_selection(self.population, rng=self.rng)
+            tasks.append((parent1, parent2, seed))
+        timer.lap("selection")
+        
+        # Crossover, mutasi & repair memetic (lihat parallel.breed_pair)
+        offspring = []
+        for child1, child2 in self.executor.breed(tasks, timer):
+            offspring.extend((child1, child2))
+        offspring = offspring[:max(n_children, 0)]
+        timer.start()
+        
+        # Hitung Fitness Akhir (sekali untuk semua anak)
+        self.evaluate_population(offspring)
+        timer.count("evaluations", len(offspring))
+        new_population.extend(offspring)
                 
         new_population.sort(key=lambda x: x.fitness, reverse=True)
         self.population = new_population
         
+        # Memetic eksak: assignment dosen optimal (min-cost flow) utk individu terbaik
+        interval = self.params.get('assignment_interval')
+        if interval and (self.generation + 1) % interval == 0:
+            self._assignment_step(new_population)
+            timer.lap("assignment")
+        
+        # Rincian konflik hanya dibutuhkan untuk individu terbaik
+        if new_population[0].conflicts is None:
+            new_population[0].compute_fitness(self.fitness_calc)
+        timer.lap("fitness")
+        
         if new_population[0].fitness > self.best_individual.fitness:
-            self.best_individual = copy.deepcopy(new_population[0])
+            self.best_individual = new_population[0].clone()
+            self.stagnant_generations = 0
+            self.mutation_rate = self.base_mutation_rate
+        else:
+            self.stagnant_generations += 1
+        timer.lap("elitism")
+        
+        if self.stagnation_window and self.stagnant_generations >= self.stagnation_window:
+            self._on_stagnation()
+        
+        self.generation += 1
+        self._record_generation(timer, time.perf_counter() - wall_start)
+
+    def _assignment_step(self, population):
+        """Pilih ulang semua dosen individu terbaik; hasil menggantikan individu terburuk."""
+        candidate = population[0].clone()
+        self.ls_engine.optimal_assignment(candidate, rng=self.rng)
+        if candidate.fitness > population[0].fitness:
+            population.pop()
+            population.insert(0, candidate)
+
+    def _on_stagnation(self):
+        """
+        Best tidak membaik selama stagnation_window generasi:
+        - "mutation": kalikan laju mutasi dgn mutation_boost (maks max_mutation_rate)
+        - "restart" : pertahankan elite, sisanya diganti individu baru
+        """
+        self.stagnant_generations = 0
+        if self.stagnation_action == STAGNATION_MUTATION:
+            boost = self.params.get('mutation_boost', 2.0)
+            cap = self.params.get('max_mutation_rate', 0.5)
+            self.mutation_rate = min(self.mutation_rate * boost, cap)
+            return
+        
+        elites = self.population[:self.params.get('elitism', 1)]
+        newcomers, _ = self._new_individuals(self.params['pop_size'] - len(elites))
+        self.evaluate_population(newcomers)
+        self.population = sorted(elites + newcomers, key=lambda x: x.fitness, reverse=True)
+        if self.population[0].conflicts is None:
+            self.population[0].compute_fitness(self.fitness_calc)
+        self.mutation_rate = self.base_mutation_rate
+        self.restarts += 1
+
+    def _record_generation(self, timer, wall_time):
+        """Isi history; kirim record lengkap ke observer jika telemetry aktif."""
+        best = self.population[0]
+        if not self.observers:
+            self.history.append({
+                "generation": self.generation,
+                "best_fitness": best.fitness,
+                "best_conflicts": best.n_conflicts,
+                "mutation_rate": self.mutation_rate,
+                "restarts": self.restarts,
+            })
+            return
+        record = generation_record(self.generation, self.population, timer, wall_time)
+        record["mutation_rate"] = self.mutation_rate
+        record["restarts"] = self.restarts
+        self.history.append(record)
+        for observer in self.observers:
+            observer.on_generation(record)
+
+    # ============================
+    # MIGRASI (ISLAND MODEL)
+    # ============================
+    def export_migrants(self, count):
+        """Elite terbaik sebagai array murni (tanpa ClassTable); pipe sudah membuat salinan."""
+        return [
+            (ind.slot_ids, ind.room_ids, ind.dosen_ids)
+            for ind in self.population[:count]
+        ]
+
+    def import_migrants(self, migrants):
+        """Ganti individu terburuk dengan migran dari pulau lain."""
+        if not migrants: return
+        newcomers = []
+        for slot_ids, room_ids, dosen_ids in migrants:
+            ind = Individual(self.table)
+            ind.slot_ids, ind.room_ids, ind.dosen_ids = slot_ids, room_ids, dosen_ids
+            newcomers.append(ind)
+        self.evaluate_population(newcomers)
+        keep = max(len(self.population) - len(newcomers), 0)
+        self.population = self.population[:keep] + newcomers
+        self.population.sort(key=lambda x: x.fitness, reverse=True)
+        if self.population[0].conflicts is None:
+            self.population[0].compute_fitness(self.fitness_calc)
+        if self.population[0].fitness > self.best_individual.fitness:
+            self.best_individual = self.population[0].clone()
+
+    def _should_stop(self, best_now, deadline, last_gen_time):
+        """Alasan berhenti (string) atau None jika evolusi lanjut."""
+        target = self.params.get('target_conflicts')
+        max_gen = self.params.get('max_generations')
+        if self._stop_requested:
+            return "stop_requested"
+        if best_now.fitness >= 0.9999:
+            return "optimal"
+        if target is not None and self.best_individual.n_conflicts <= target:
+            return "target_conflicts"
+        if max_gen is not None and self.generation >= max_gen:
+            return "max_generations"
+        # Berhenti jika generasi berikutnya (perkiraan = durasi generasi terakhir) melewati budget
+        if deadline is not None and time.perf_counter() + last_gen_time > deadline:
+            return "time_budget"
+        return None
 
     def run(self):
-        self.initialize_population()
-        max_gen = self.params['max_generations']
+        """
+        Evolusi sampai salah satu kriteria berhenti terpenuhi (mode anytime):
+        - max_generations   : batas generasi (None = tanpa batas, butuh time_budget)
+        - time_budget       : batas waktu total detik, termasuk inisialisasi. Budget
+                              LUNAK: dicek antar generasi (perkiraan = durasi generasi
+                              terakhir), generasi yang sedang jalan tidak dipotong, jadi
+                              run bisa lewat budget sebesar ~1 generasi (generasi pertama
+                              tanpa perkiraan). Batasi repair_time jika perlu lebih ketat.
+        - target_conflicts  : berhenti begitu konflik best <= target
+        - request_stop() / Ctrl+C : berhenti dan kembalikan best saat itu
+        """
+        # Mode island: beberapa populasi paralel di banyak core
+        if self.params.get('islands', 1) > 1:
+            from ga_core.island import IslandModel
+            model = IslandModel(self.data, self.params)
+            self.best_individual = model.run()
+            self.stop_reason = model.stop_reason
+            return self.best_individual
+
+        max_gen = self.params.get('max_generations')
+        budget = self.params.get('time_budget')
+        if max_gen is None and budget is None:
+            raise ValueError("Isi max_generations dan/atau time_budget")
+        start = time.perf_counter()
+        deadline = None if budget is None else start + budget
+        
+        # Hasil resume() sudah punya populasi -> lanjutkan saja
+        if not self.population:
+            self.initialize_population()
+        for observer in self.observers:
+            observer.on_run_start(self)
+        ckpt_path = self.params.get('checkpoint_path')
+        ckpt_every = self.params.get('checkpoint_interval', 10)
         
-        print(f"\n🚀 Memulai Evolusi MA (Load Balancing Enabled) - {max_gen} Gen")
+        limit = f"{max_gen} Gen" if max_gen is not None else "tanpa batas gen"
+        if budget is not None: limit += f" / {budget:g} s"
+        print(f"\n🚀 Memulai Evolusi MA (Load Balancing Enabled) - {limit} | seed={self.seed}")
         print("-" * 60)
         
-        for generation in range(1, max_gen + 1):
-            self.evolve_generation()
-            
-            best_now = self.population[0]
-            
-            if generation % 10 == 0 or best_now.fitness >= 0.999:
-                conflict_count = len(best_now.conflicts)
-                # Tampilkan info Fitness
-                print(f"Gen {generation:3} | Konflik: {conflict_count:3} | Fit: {best_now.fitness:.5f}")
+        self.stop_reason = None
+        last_gen_time = 0.0
+        try:
+            while True:
+                self.stop_reason = self._should_stop(self.population[0], deadline, last_gen_time)
+                if self.stop_reason: break
                 
-            if best_now.fitness >= 0.9999:
-                print("\n🎉 SOLUSI OPTIMAL DITEMUKAN!")
-                break
+                gen_start = time.perf_counter()
+                self.evolve_generation()
+                last_gen_time = time.perf_counter() - gen_start
                 
-        return self.best_individual
\ No newline at end of file
+                if ckpt_path and ckpt_every and self.generation % ckpt_every == 0:
+                    self.save_checkpoint(ckpt_path)
+                
+                best_now = self.population[0]
+                if self.generation % 10 == 0 or best_now.fitness >= 0.999:
+                    conflict_count = best_now.n_conflicts
+                    # Tampilkan info Fitness
+                    print(f"Gen {self.generation:3} | Konflik: {conflict_count:3} | Fit: {best_now.fitness:.5f} | Mutasi: {self.mutation_rate:.3f}")
+        except KeyboardInterrupt:
+            self.stop_reason = "interrupted"
+        finally:
+            # Snapshot terakhir (termasuk saat Ctrl+C) agar run bisa dilanjutkan
+            if ckpt_path and self.best_individual is not None:
+                self.save_checkpoint(ckpt_path)
+            self.executor.close()
+            for observer in self.observers:
+                observer.on_run_end(self)
+                observer.close()
+        
+        if self.stop_reason == "optimal":
+            print("\n🎉 SOLUSI OPTIMAL DITEMUKAN!")
+        print(f"Berhenti: {self.stop_reason} | {self.generation} gen | {time.perf_counter() - start:.2f} s | restart: {self.restarts}")
+        return self.current_best()
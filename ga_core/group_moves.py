@@ -0,0 +1,56 @@
+# ===============================
+# LANGKAH MAJEMUK PER GRUP KELAS
+# ===============================
+# Sesi MK yang dipecah (Sesi 1, Sesi 2, ...) & kelas paralel (A-G) dipindah
+# bersama agar tidak saling bertabrakan / jatuh di hari yang sama
+# (indeks grup dari ClassTable). Semua langkah berbentuk list
+# (gen, kwargs commit) seperti langkah RepairEngine; None jika tidak valid.
+
+def day_shift_move(ind, gene, rng):
+    """Geser semua sesi MK-kelas milik gen sejauh k hari (jam tetap, hari tetap berbeda)."""
+    table = ind.table
+    members = table.section(gene)
+    if len(members) < 2 or table.n_days < 2: return None
+    k = rng.randrange(1, table.n_days)
+    move = []
+    for j in members:
+        s = int(table.slot_shift[k, ind.slot_ids[j]])
+        if s < 0 or not table.slot_domain_mask[j, s]: return None
+        move.append((int(j), {'slot': s}))
+    return move
+
+def parallel_swap_move(ind, gene, rng):
+    """Tukar slot seluruh sesi gen dengan sesi yang sama di kelas paralel lain."""
+    table = ind.table
+    g = table.parallel_group_of[gene]
+    if g < 0: return None
+    other = int(rng.choice(table.parallel_groups[g]))
+    if other == gene: return None
+    mine, theirs = table.section(gene), table.section(other)
+    if len(mine) != len(theirs): return None
+    move = []
+    for a, b in zip(mine, theirs):
+        s_a, s_b = int(ind.slot_ids[a]), int(ind.slot_ids[b])
+        if s_a == s_b: continue
+        if not (table.slot_domain_mask[a, s_b] and table.slot_domain_mask[b, s_a]): return None
+        move.extend(((int(a), {'slot': s_b}), (int(b), {'slot': s_a})))
+    return move or None
+
+def group_move(ind, gene, rng):
+    """Langkah majemuk acak untuk gen ber-grup (geser hari sesi / tukar paralel)."""
+    table = ind.table
+    if table.session_group_of[gene] >= 0 and (table.parallel_group_of[gene] < 0 or rng.random() < 0.5):
+        return day_shift_move(ind, gene, rng)
+    return parallel_swap_move(ind, gene, rng)
+
+def sibling_free_slot(ind, gene, rng, tries=8):
+    """Slot acak di domain gen, di hari yang belum dipakai sesi saudaranya (rejection sampling)."""
+    table = ind.table
+    domain = table.slot_domain[gene]
+    members = table.section(gene)
+    if len(members) < 2: return rng.choice(domain)
+    used = {int(table.slot_day[ind.slot_ids[j]]) for j in members if j != gene}
+    for _ in range(tries):
+        s = rng.choice(domain)
+        if table.slot_day[s] not in used: return s
+    return s
@@ -0,0 +1,276 @@
+import numpy as np
+
+# ===============================
+# EVALUASI INKREMENTAL (DELTA)
+# ===============================
+class IncrementalEvaluator:
+    """
+    Evaluator stateful untuk satu individu.
+    Menyimpan okupansi ruang/dosen per slot, beban SKS dosen dan penalty
+    berjalan, sehingga pertanyaan "berapa delta penalty jika gen i pindah
+    ke slot s / ruang r / dosen d" dijawab dalam O(1) tanpa rescore penuh.
+
+    - room_load[r, s]  : jumlah kelas di ruang r yang beririsan dengan slot s
+    - dosen_load[d, s] : jumlah kelas dosen d (known) yang beririsan dengan slot s
+    - constraint tambahan (fitness_calc.constraints) membawa state & kernel delta sendiri
+    Perubahan diterapkan lewat commit() dan bisa dibatalkan lewat rollback().
+    """
+    def __init__(self, fitness_calc, individual):
+        self.calc = fitness_calc
+        self.ind = individual
+        self.table = individual.table
+        table = self.table
+
+        self._overlap = fitness_calc.slot_overlap.astype(np.int32)
+        self._capacity = fitness_calc.room_capacity
+        self._known = table.dosen_known
+        self._sks = table.sks
+        self._undo = []
+        self.n_deltas = 0
+
+        slot_ids, room_ids, dosen_ids = individual.slot_ids, individual.room_ids, individual.dosen_ids
+        n_slots, n_rooms, n_dosen = fitness_calc.n_slots, fitness_calc.n_rooms, table.n_dosen
+
+        # Okupansi -> jumlah kelas yang overlap per (resource, slot)
+        occ_room = np.zeros((n_rooms, n_slots), dtype=np.int32)
+        np.add.at(occ_room, (room_ids, slot_ids), 1)
+        self.room_load = occ_room @ self._overlap
+
+        known = self._known[dosen_ids]
+        occ_dosen = np.zeros((n_dosen, n_slots), dtype=np.int32)
+        np.add.at(occ_dosen, (dosen_ids[known], slot_ids[known]), 1)
+        self.dosen_load = occ_dosen @ self._overlap
+
+        # Beban SKS & jumlah kelas per dosen (hanya known)
+        self.workload = np.zeros(n_dosen, dtype=np.int64)
+        self.taught = np.zeros(n_dosen, dtype=np.int64)
+        np.add.at(self.workload, dosen_ids[known], self._sks[known])
+        np.add.at(self.taught, dosen_ids[known], 1)
+        self._n_active = int((self.taught > 0).sum())
+        self._sum = float(self.workload.sum())
+        self._sum_sq = float((self.workload.astype(float) ** 2).sum())
+
+        # Hitung pelanggaran hard
+        over_capacity = int((table.jumlah_mhs > self._capacity[room_ids]).sum())
+        room_pairs = int((occ_room * self.room_load).sum() - len(slot_ids)) // 2
+        dosen_pairs = int((occ_dosen * self.dosen_load).sum() - known.sum()) // 2
+        self.hard_count = over_capacity + room_pairs + dosen_pairs
+
+        # Constraint tambahan (registry): state + flag gen yang dibaca
+        self._extra = [
+            (c, c.init_state(individual), 'slot' in c.reads, 'room' in c.reads, 'dosen' in c.reads)
+            for c in fitness_calc.constraints
+        ]
+        self.extra_soft = 0.0
+        # True jika ada constraint tambahan yang membaca gen dosen (cek ekstra saat ganti dosen)
+        self.dosen_constraints = any(reads_dosen for *_, reads_dosen in self._extra)
+        for c, state, *_ in self._extra:
+            count = c.count(state, individual)
+            if c.hard:
+                self.hard_count += count
+            else:
+                self.extra_soft += c.weight * count
+
+        self.prio_penalty = float(sum(self.prio_cost(i, d) for i, d in enumerate(dosen_ids)))
+
+    # ---------- KOMPONEN PENALTY ----------
+    def prio_cost(self, i, d):
+        """Penalti prioritas jika kelas i diajar dosen d."""
+        prio = self.table.priority_of(i, d)
+        if prio == 1: return 0
+        if prio == 2: return self.calc.WEIGHT_SOFT_PRIO_2
+        return self.calc.WEIGHT_SOFT_UNKNOWN
+
+    def _cap_violation(self, i, r):
+        return int(self.table.jumlah_mhs[i] > self._capacity[r])
+
+    @staticmethod
+    def _fairness_from_moments(n_active, total, total_sq):
+        """Fairness dari momen beban (O(1)); sama rumusnya dengan FitnessCalculator."""
+        if n_active <= 0: return 0.0
+        mean = total / n_active
+        std_dev = max(total_sq / n_active - mean * mean, 0.0) ** 0.5
+        if std_dev > 2.5:
+            return (std_dev ** 3) * 100
+        return std_dev * 50
+
+    @property
+    def mean_load(self):
+        """Rata-rata beban SKS dosen aktif (0 jika belum ada yang mengajar)."""
+        return self._sum / self._n_active if self._n_active else 0.0
+
+    @property
+    def fairness_penalty(self):
+        return self._fairness_from_moments(self._n_active, self._sum, self._sum_sq)
+
+    @property
+    def penalty(self):
+        return self.hard_count * self.calc.WEIGHT_HARD + self.prio_penalty + self.fairness_penalty + self.extra_soft
+
+    @property
+    def fitness(self):
+        return 1.0 / (1.0 + self.penalty)
+
+    # ---------- QUERY ----------
+    def gene_hard(self, i):
+        """Jumlah pelanggaran hard yang melibatkan gen i."""
+        s, r, d = int(self.ind.slot_ids[i]), int(self.ind.room_ids[i]), int(self.ind.dosen_ids[i])
+        count = self._cap_violation(i, r) + int(self.room_load[r, s]) - 1
+        if self._known[d]:
+            count += int(self.dosen_load[d, s]) - 1
+        for c, state, *_ in self._extra:
+            if c.hard:
+                count += int(c.gene_counts(state, self.ind)[i])
+        return count
+
+    def hard_genes(self):
+        """Index semua gen yang terlibat pelanggaran hard (versi vektor gene_hard)."""
+        ind = self.ind
+        s, r, d = ind.slot_ids, ind.room_ids, ind.dosen_ids
+        count = (self.table.jumlah_mhs > self._capacity[r]).astype(np.int32)
+        count += self.room_load[r, s] - 1
+        count += np.where(self._known[d], self.dosen_load[d, s] - 1, 0)
+        for c, state, *_ in self._extra:
+            if c.hard:
+                count += c.gene_counts(state, ind)
+        return np.flatnonzero(count > 0)
+
+    def dosen_busy(self, d, s, exclude=None):
+        """True jika dosen d punya kelas lain yang beririsan dengan slot s."""
+        load = int(self.dosen_load[d, s])
+        if exclude is not None and int(self.ind.dosen_ids[exclude]) == d:
+            load -= int(self._overlap[int(self.ind.slot_ids[exclude]), s])
+        return load > 0
+
+    def free_rooms(self, rooms, s, exclude=None):
+        """Mask (per elemen array rooms) ruang tanpa kelas yang beririsan dengan slot s."""
+        load = self.room_load[rooms, s]
+        if exclude is not None:
+            own = int(self._overlap[int(self.ind.slot_ids[exclude]), s])
+            load = load - own * (rooms == int(self.ind.room_ids[exclude]))
+        return load == 0
+
+    def _workload_delta(self, i, d_old, d_new):
+        """Momen beban setelah gen i pindah dosen d_old -> d_new."""
+        n_active, total, total_sq = self._n_active, self._sum, self._sum_sq
+        if d_old == d_new: return n_active, total, total_sq
+        sks = int(self._sks[i])
+        if self._known[d_old]:
+            w = int(self.workload[d_old])
+            total_sq += (w - sks) ** 2 - w ** 2
+            total -= sks
+            if self.taught[d_old] == 1: n_active -= 1
+        if self._known[d_new]:
+            w = int(self.workload[d_new])
+            total_sq += (w + sks) ** 2 - w ** 2
+            total += sks
+            if self.taught[d_new] == 0: n_active += 1
+        return n_active, total, total_sq
+
+    def delta(self, i, slot=None, room=None, dosen=None):
+        """
+        Delta jika gen i dipindah (tanpa mengubah state).
+        Return: (delta_penalty, delta_hard)
+        """
+        self.n_deltas += 1
+        s, r, d = int(self.ind.slot_ids[i]), int(self.ind.room_ids[i]), int(self.ind.dosen_ids[i])
+        s2 = s if slot is None else int(slot)
+        r2 = r if room is None else int(room)
+        d2 = d if dosen is None else int(dosen)
+
+        # Kapasitas
+        d_hard = self._cap_violation(i, r2) - self._cap_violation(i, r)
+
+        # Tabrakan ruang: pasangan sebelum vs sesudah gen i dipindah
+        before = int(self.room_load[r, s]) - 1
+        after = int(self.room_load[r2, s2]) - (int(self._overlap[s, s2]) if r2 == r else 0)
+        d_hard += after - before
+
+        # Tabrakan dosen
+        if self._known[d]:
+            d_hard -= int(self.dosen_load[d, s]) - 1
+        if self._known[d2]:
+            d_hard += int(self.dosen_load[d2, s2]) - (int(self._overlap[s, s2]) if d2 == d else 0)
+
+        # Constraint tambahan: kernel dipanggil hanya jika gen yang dibaca berubah
+        d_soft = 0.0
+        for c, state, reads_slot, reads_room, reads_dosen in self._extra:
+            if (reads_slot and s2 != s) or (reads_room and r2 != r) or (reads_dosen and d2 != d):
+                change = c.delta(state, i, s, r, d, s2, r2, d2)
+                if c.hard:
+                    d_hard += change
+                else:
+                    d_soft += c.weight * change
+
+        # Prioritas & fairness
+        if d2 != d:
+            d_soft += self.prio_cost(i, d2) - self.prio_cost(i, d)
+            d_soft += self._fairness_from_moments(*self._workload_delta(i, d, d2)) - self.fairness_penalty
+
+        return d_hard * self.calc.WEIGHT_HARD + d_soft, d_hard
+
+    # ---------- COMMIT / ROLLBACK ----------
+    def commit(self, i, slot=None, room=None, dosen=None):
+        """Terapkan perpindahan gen i ke individu + state, catat di undo log."""
+        ind = self.ind
+        s, r, d = int(ind.slot_ids[i]), int(ind.room_ids[i]), int(ind.dosen_ids[i])
+        s2 = s if slot is None else int(slot)
+        r2 = r if room is None else int(room)
+        d2 = d if dosen is None else int(dosen)
+        if (s2, r2, d2) == (s, r, d): return
+
+        _, d_hard = self.delta(i, s2, r2, d2)
+        self._undo.append((i, s, r, d))
+        self._apply(i, s, r, d, s2, r2, d2)
+        self.hard_count += d_hard
+
+    def _apply(self, i, s, r, d, s2, r2, d2):
+        ind = self.ind
+        self.room_load[r] -= self._overlap[s]
+        self.room_load[r2] += self._overlap[s2]
+        if self._known[d]:
+            self.dosen_load[d] -= self._overlap[s]
+        if self._known[d2]:
+            self.dosen_load[d2] += self._overlap[s2]
+        for c, state, reads_slot, reads_room, reads_dosen in self._extra:
+            if (reads_slot and s2 != s) or (reads_room and r2 != r) or (reads_dosen and d2 != d):
+                if not c.hard:
+                    self.extra_soft += c.weight * c.delta(state, i, s, r, d, s2, r2, d2)
+                c.apply(state, i, s, r, d, s2, r2, d2)
+        if d2 != d:
+            self._n_active, self._sum, self._sum_sq = self._workload_delta(i, d, d2)
+            self.prio_penalty += self.prio_cost(i, d2) - self.prio_cost(i, d)
+            sks = int(self._sks[i])
+            if self._known[d]:
+                self.workload[d] -= sks
+                self.taught[d] -= 1
+            if self._known[d2]:
+                self.workload[d2] += sks
+                self.taught[d2] += 1
+        # Tulis hanya array yang berubah (copy-on-write per array)
+        if s2 != s: ind.writable('slot_ids')[i] = s2
+        if r2 != r: ind.writable('room_ids')[i] = r2
+        if d2 != d: ind.writable('dosen_ids')[i] = d2
+
+    def mark(self):
+        """Titik simpan untuk rollback."""
+        return len(self._undo)
+
+    def rollback(self, mark=0):
+        """Batalkan semua commit setelah titik mark (default: semuanya)."""
+        while len(self._undo) > mark:
+            i, s, r, d = self._undo.pop()
+            _, d_hard = self.delta(i, s, r, d)
+            ind = self.ind
+            self._apply(i, int(ind.slot_ids[i]), int(ind.room_ids[i]), int(ind.dosen_ids[i]), s, r, d)
+            self.hard_count += d_hard
+
+    def clear_log(self):
+        self._undo = []
+
+    def sync_individual(self):
+        """Tulis fitness & jumlah konflik hasil state ke individu."""
+        self.ind.fitness = self.fitness
+        self.ind.n_conflicts = self.hard_count
+        self.ind.conflicts = None
+        return self.ind
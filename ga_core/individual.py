@@ -1,45 +1,84 @@
 import random
-from ga_core.fitness import FitnessCalculator 
+import numpy as np
 
 class Individual:
-    def __init__(self, all_classes, all_slots, all_rooms):
-        self.all_classes = all_classes
-        self.all_slots = all_slots
-        self.all_rooms = all_rooms
-        
-        self.chromosome = []
+    """
+    Kromosom ringkas: 3 array integer sepanjang jumlah kelas.
+    - slot_ids[i]  : slot waktu kelas i
+    - room_ids[i]  : ruang kelas i
+    - dosen_ids[i] : index dosen (lihat ClassTable.dosen_names)
+    Data statis (nama MK, SKS, dll) ada di ClassTable yang dibagi bersama.
+
+    Copy-on-write: clone() membagi array yang sama dan menandainya read-only.
+    Siapa pun yang ingin menulis gen wajib memakai writable(attr), yang
+    menyalin array hanya jika masih dibagi.
+    """
+    GENE_ARRAYS = ('slot_ids', 'room_ids', 'dosen_ids')
+
+    def __init__(self, table):
+        self.table = table
+
+        self.slot_ids = None
+        self.room_ids = None
+        self.dosen_ids = None
         self.fitness = 0.0
-        self.conflicts = [] 
-
-    def initialize_random(self):
-        self.chromosome = []
-        for kelas in self.all_classes:
-            random_slot = random.choice(self.all_slots)
-            random_room = random.choice(self.all_rooms)
-            
-            gene = {
-                # --- ID UNTUK GA ---
-                "class_id": kelas["class_id"],
-                "slot_id": random_slot["slot_id"],
-                "room_id": random_room["room_id"],
-                
-                # --- DATA PENTING UNTUK FITNESS & EXPORT ---
-                "kode_mk": kelas["kode_mk"],        
-                "nama_mk": kelas["nama_mk"],
-                "sks": kelas["sks"],
-                "dosen": kelas["dosen"],
-                "jumlah_mhs": kelas["jumlah_mhs"],
-                "semester": kelas.get("semester", 0),
-                "parallel": kelas.get("parallel", "-"),
-                "dosen_priority": kelas.get("dosen_priority", 99)
-            }
-            self.chromosome.append(gene)
+        self.conflicts = []
+        self.n_conflicts = 0
+
+    def initialize_random(self, rng=random):
+        # Acak hanya di domain feasible tiap kelas (panjang slot & kapasitas ruang)
+        table = self.table
+        self.slot_ids = np.array([rng.choice(dom) for dom in table.slot_domain], dtype=np.int32)
+        self.room_ids = np.array([rng.choice(dom) for dom in table.room_domain], dtype=np.int32)
+        # Dosen awal dibagi dari ClassTable (read-only), disalin saat ditulis
+        self.dosen_ids = self.table.initial_dosen
+
+    def writable(self, attr):
+        """Array gen `attr` yang aman ditulis (disalin dulu jika masih dibagi)."""
+        arr = getattr(self, attr)
+        if not arr.flags.writeable:
+            arr = arr.copy()
+            setattr(self, attr, arr)
+        return arr
+
+    def clone(self):
+        """Salinan tanpa alokasi: array dibagi & dibekukan sampai ada yang menulis."""
+        clone = Individual(self.table)
+        for attr in self.GENE_ARRAYS:
+            arr = getattr(self, attr)
+            arr.setflags(write=False)
+            setattr(clone, attr, arr)
+        clone.fitness = self.fitness
+        clone.conflicts = self.conflicts  # record konflik immutable, aman dibagi
+        clone.n_conflicts = self.n_conflicts
+        return clone
+
+    def copy(self):
+        """Salinan penuh (array diduplikasi); untuk alur GA biasa pakai clone()."""
+        clone = Individual(self.table)
+        clone.slot_ids = self.slot_ids.copy()
+        clone.room_ids = self.room_ids.copy()
+        clone.dosen_ids = self.dosen_ids.copy()
+        clone.fitness = self.fitness
+        clone.conflicts = self.conflicts  # record konflik immutable, aman dibagi
+        clone.n_conflicts = self.n_conflicts
+        return clone
 
     def compute_fitness(self, fitness_calculator):
-        score, conflict_list = fitness_calculator.calculate(self.chromosome)
+        score, conflict_list = fitness_calculator.calculate(self)
         self.fitness = score
         self.conflicts = conflict_list
+        self.n_conflicts = len(conflict_list)
         return self.fitness
 
+    def set_batch_score(self, fitness, n_conflicts):
+        """Simpan hasil calculate_batch (daftar konflik belum dirinci)."""
+        self.fitness = float(fitness)
+        self.n_conflicts = int(n_conflicts)
+        self.conflicts = None
+
+    def __len__(self):
+        return self.table.n_classes
+
     def __str__(self):
-        return f"Individu | Fit: {self.fitness:.5f} | Konflik: {len(self.conflicts)}"
\ No newline at end of file
+        return f"Individu | Fit: {self.fitness:.5f} | Konflik: {self.n_conflicts}"
@@ -0,0 +1,219 @@
+import multiprocessing as mp
+import time
+import traceback
+from ga_core.class_table import ClassTable
+from ga_core.fitness import FitnessCalculator
+from ga_core.constraints import build_constraints, DEFAULT_CONSTRAINTS
+from ga_core.individual import Individual
+from ga_core.rng import seed_sequence, spawn_seeds
+
+# ===============================
+# ISLAND MODEL (MULTIPROCESSING)
+# ===============================
+# Setiap pulau = 1 proses dengan GeneticAlgorithm sendiri.
+# Data problem (hasil load_all_data) dikirim SEKALI saat proses dibuat;
+# setiap epoch yang lewat pipe hanya perintah + array migran.
+
+TOPOLOGY_RING = "ring"
+TOPOLOGY_FULL = "full"
+
+def _island_worker(island_id, data, params, conn):
+    """Loop perintah pulau; exception dikirim balik sebagai ("error", traceback)."""
+    try:
+        _island_loop(island_id, data, params, conn)
+    except Exception:
+        try:
+            conn.send(("error", traceback.format_exc()))
+        except OSError:
+            pass  # Proses utama sudah menutup pipe
+    finally:
+        conn.close()
+
+def _island_loop(island_id, data, params, conn):
+    from ga_core.ga_engine import GeneticAlgorithm
+
+    # Proses daemon tidak boleh membuat pool proses lagi
+    if params.get('backend') == "process":
+        params = dict(params, backend="serial")
+    # Telemetry, checkpoint & warm start bukan urusan pulau (sama seperti worker
+    # process di parallel.py): tidak ada tulis file paralel ke path yang sama
+    params = dict(params, telemetry_path=None, checkpoint_path=None, warm_start=None)
+
+    ga = GeneticAlgorithm(data, params)
+    ga.initialize_population()
+
+    while True:
+        try:
+            command, payload = conn.recv()
+        except EOFError:
+            command = "stop"  # Proses utama berhenti tanpa sempat mengirim stop
+        if command == "stop":
+            ga.executor.close()
+            break
+
+        # command == "evolve"
+        n_gen, migrants = payload
+        ga.import_migrants(migrants)
+        for _ in range(n_gen):
+            ga.evolve_generation()
+            if ga.population[0].fitness >= 0.9999: break
+
+        best = ga.best_individual
+        conn.send(("report", {
+            "island": island_id,
+            "fitness": best.fitness,
+            "n_conflicts": best.n_conflicts,
+            "best": (best.slot_ids, best.room_ids, best.dosen_ids),
+            "migrants": ga.export_migrants(params.get('migration_size', 2)),
+        }))
+
+
+class IslandModel:
+    """
+    N populasi GA berjalan paralel, bertukar elite setiap K generasi.
+    params tambahan:
+    - islands            : jumlah pulau/proses (default: jumlah CPU)
+    - migration_interval : K generasi antar migrasi (default 10)
+    - migration_size     : jumlah elite yang dikirim tiap pulau (default 2)
+    - topology           : "ring" (pulau i -> i+1) atau "full" (semua ke semua)
+    Kontrol stagnasi (stagnation_window) berjalan per pulau. checkpoint_path,
+    resume, warm_start & telemetry_path TIDAK dipakai di mode pulau.
+    stop_reason diisi seperti GeneticAlgorithm.run (termasuk "interrupted").
+    """
+    def __init__(self, data, params):
+        self.data = data
+        self.params = params
+        self.n_islands = params.get('islands') or mp.cpu_count()
+        self.interval = params.get('migration_interval', 10)
+        self.migration_size = params.get('migration_size', 2)
+        self.topology = params.get('topology', TOPOLOGY_RING)
+        if self.topology not in (TOPOLOGY_RING, TOPOLOGY_FULL):
+            raise ValueError(f"Topologi tidak dikenal: {self.topology}")
+
+        # Setiap pulau mendapat stream RNG turunan yang independen
+        self.seed_seq = seed_sequence(params.get('seed'))
+        self.island_seeds = spawn_seeds(self.seed_seq, self.n_islands)
+
+        self.table = ClassTable.from_data(data)
+        self.fitness_calc = FitnessCalculator(data['slots'], data['rooms'])
+        self.fitness_calc.constraints = build_constraints(
+            params.get('constraints', DEFAULT_CONSTRAINTS), self.table, self.fitness_calc
+        )
+        self.best_individual = None
+        self.stop_reason = None
+
+    def _route_migrants(self, reports):
+        """Tentukan migran yang diterima tiap pulau sesuai topologi."""
+        inbox = {r["island"]: [] for r in reports}
+        if self.topology == TOPOLOGY_RING:
+            for r in reports:
+                target = (r["island"] + 1) % self.n_islands
+                inbox[target].extend(r["migrants"])
+        else:
+            # Fully connected: setiap pulau menerima elite terbaik dari pulau lain
+            for island in inbox:
+                others = sorted(
+                    (r for r in reports if r["island"] != island),
+                    key=lambda r: r["fitness"], reverse=True
+                )
+                pool = [m for r in others for m in r["migrants"]]
+                inbox[island] = pool[:self.migration_size]
+        return inbox
+
+    @staticmethod
+    def _receive(island_id, conn, proc):
+        """Laporan satu pulau; error di worker di-raise ulang di proses utama."""
+        try:
+            kind, payload = conn.recv()
+        except EOFError:
+            raise RuntimeError(f"Pulau {island_id} berhenti tanpa laporan (exitcode {proc.exitcode})") from None
+        if kind == "error":
+            raise RuntimeError(f"Pulau {island_id} gagal:\n{payload}")
+        return payload
+
+    def _update_best(self, report):
+        if self.best_individual is None or report["fitness"] > self.best_individual.fitness:
+            ind = Individual(self.table)
+            ind.slot_ids, ind.room_ids, ind.dosen_ids = report["best"]
+            ind.compute_fitness(self.fitness_calc)
+            self.best_individual = ind
+
+    def run(self):
+        max_gen = self.params.get('max_generations')
+        budget = self.params.get('time_budget')
+        target = self.params.get('target_conflicts')
+        if max_gen is None and budget is None:
+            raise ValueError("Isi max_generations dan/atau time_budget")
+        deadline = None if budget is None else time.perf_counter() + budget
+        print(f"\n🏝️  Island Model: {self.n_islands} pulau | topologi {self.topology} | migrasi tiap {self.interval} gen | seed={self.seed_seq.entropy}")
+        print("-" * 60)
+        ignored = [key for key in ('checkpoint_path', 'warm_start', 'telemetry_path') if self.params.get(key)]
+        if ignored:
+            print(f"⚠️  Mode pulau mengabaikan: {', '.join(ignored)}")
+
+        ctx = mp.get_context()
+        pipes, workers = [], []
+        for island_id in range(self.n_islands):
+            parent_conn, child_conn = ctx.Pipe()
+            proc = ctx.Process(target=_island_worker, args=(island_id, self.data, dict(self.params, seed=self.island_seeds[island_id]), child_conn), daemon=True)
+            proc.start()
+            child_conn.close()  # Ujung anak hanya milik worker -> recv() dapat EOF jika worker mati
+            pipes.append(parent_conn)
+            workers.append(proc)
+
+        self.stop_reason = "max_generations"
+        try:
+            inbox = {i: [] for i in range(self.n_islands)}
+            generation = 0
+            last_epoch_time = 0.0
+            while max_gen is None or generation < max_gen:
+                # Epoch berikutnya (perkiraan = durasi epoch terakhir) tidak boleh melewati budget
+                if deadline is not None and time.perf_counter() + last_epoch_time > deadline:
+                    print("\n⏱️  Time budget habis.")
+                    self.stop_reason = "time_budget"
+                    break
+                epoch_start = time.perf_counter()
+                n_gen = self.interval if max_gen is None else min(self.interval, max_gen - generation)
+                for island_id, conn in enumerate(pipes):
+                    conn.send(("evolve", (n_gen, inbox[island_id])))
+                reports = [self._receive(i, conn, workers[i]) for i, conn in enumerate(pipes)]
+                generation += n_gen
+                last_epoch_time = time.perf_counter() - epoch_start
+
+                for report in reports:
+                    self._update_best(report)
+                inbox = self._route_migrants(reports)
+
+                best = self.best_individual
+                print(f"Gen {generation:3} | Konflik: {best.n_conflicts:3} | Fit: {best.fitness:.5f}")
+                if best.fitness >= 0.9999:
+                    print("\n🎉 SOLUSI OPTIMAL DITEMUKAN!")
+                    self.stop_reason = "optimal"
+                    break
+                if target is not None and best.n_conflicts <= target:
+                    self.stop_reason = "target_conflicts"
+                    break
+        except KeyboardInterrupt:
+            # Ctrl+C (mode anytime): hentikan pulau, kembalikan best global sejauh ini
+            for proc in workers:
+                proc.terminate()
+            self.stop_reason = "interrupted"
+            if self.best_individual is None:
+                raise
+        except BaseException:
+            # Pulau gagal: hentikan semua pulau tanpa menunggu epoch selesai
+            for proc in workers:
+                proc.terminate()
+            raise
+        finally:
+            for conn in pipes:
+                try:
+                    conn.send(("stop", None))
+                except OSError:
+                    pass  # Pipe sudah putus (worker mati)
+                conn.close()
+            for proc in workers:
+                proc.join()
+
+        print(f"Berhenti: {self.stop_reason}")
+        return self.best_individual
@@ -1,128 +1,197 @@
+import heapq
 import random
-import copy
+import numpy as np
+from ga_core.incremental import IncrementalEvaluator
+from ga_core.assignment import assign_lecturers
+from ga_core.group_moves import sibling_free_slot
 
 class LocalSearch:
-    def __init__(self, fitness_calculator, candidates, pref_info):
+    def __init__(self, fitness_calculator, candidates, pref_info, room_decoder=None):
         self.fitness_calc = fitness_calculator
         self.candidates = candidates
         self.pref_info = pref_info
+        self.room_decoder = room_decoder  # Mode decoder: pindah slot + ruang best-fit
+        self._overlap_rows = fitness_calculator.slot_overlap.tolist()
 
-    def is_dosen_busy(self, chromosome, dosen_name, slot_id):
-        """Cek apakah dosen sedang mengajar di slot waktu tertentu"""
-        for gene in chromosome:
-            if gene['dosen'] == dosen_name and gene['slot_id'] == slot_id:
-                return True
-        return False
+    def is_dosen_busy(self, individual, dosen_idx, slot_id):
+        """Cek apakah dosen sedang mengajar di slot yang BERIRISAN dengan slot_id"""
+        overlapping = self.fitness_calc.slot_overlap[individual.slot_ids, slot_id]
+        return bool(np.any((individual.dosen_ids == dosen_idx) & overlapping))
 
-    def resolve_conflicts(self, individual, all_slots, all_rooms):
+    def resolve_conflicts(self, individual, evaluator=None, rng=random):
         """
         FASE 1: FIHC (First Improvement Hill Climbing)
         Fokus: Menghilangkan [Tabrakan Ruang] dan [Tabrakan Dosen]
+        Setiap percobaan dinilai lewat delta IncrementalEvaluator (O(1)),
+        bukan rescore penuh kromosom.
         """
-        current_fitness, conflicts = self.fitness_calc.calculate(individual.chromosome)
-        if not conflicts: return individual # Sudah aman
-
-        # Identifikasi gen yang bermasalah
-        problematic_indices = []
-        for i, gene in enumerate(individual.chromosome):
-            mk_name = gene['nama_mk']
-            dosen_name = gene['dosen']
-            # Cek apakah gene ini disebut dalam list konflik
-            is_problem = False
-            for msg in conflicts:
-                if mk_name in msg or dosen_name in msg:
-                    is_problem = True
-                    break
-            if is_problem:
-                problematic_indices.append(i)
-        
-        # Jika tidak bisa parsing nama, ambil acak
+        table = individual.table
+        if evaluator is None:
+            evaluator = IncrementalEvaluator(self.fitness_calc, individual)
+        if evaluator.hard_count == 0: return individual # Sudah aman
+
+        # Identifikasi gen yang bermasalah langsung dari okupansi evaluator (tanpa rescore penuh)
+        problematic_indices = evaluator.hard_genes().tolist()
+
+        # Jika tidak ada gen yang tercatat, ambil acak
         if not problematic_indices:
-            problematic_indices = random.sample(range(len(individual.chromosome)), min(10, len(individual.chromosome)))
+            problematic_indices = rng.sample(range(len(individual)), min(10, len(individual)))
 
         # COBA PERBAIKI
         for idx in problematic_indices:
-            original_gene = copy.deepcopy(individual.chromosome[idx])
-            
-            # Coba pindah ke 10 slot/ruang acak
+            # Coba pindah ke 10 slot/ruang acak (dalam domain feasible)
             for _ in range(10):
                 # Mutasi kecil: Ganti Slot atau Ruang
-                if random.random() < 0.5:
-                    individual.chromosome[idx]['slot_id'] = random.choice(all_slots)['slot_id']
+                if self.room_decoder is not None:
+                    move = self.room_decoder.slot_move(evaluator, idx, sibling_free_slot(individual, idx, rng))
+                elif rng.random() < 0.5:
+                    move = {'slot': sibling_free_slot(individual, idx, rng)}
                 else:
-                    individual.chromosome[idx]['room_id'] = random.choice(all_rooms)['room_id']
-                
-                new_fitness, new_conflicts = self.fitness_calc.calculate(individual.chromosome)
-                
+                    move = {'room': rng.choice(table.room_domain[idx])}
+
+                _, d_hard = evaluator.delta(idx, **move)
+
                 # Jika konflik BERKURANG, simpan perubahan (Hill Climbing)
-                if len(new_conflicts) < len(conflicts):
-                    current_fitness = new_fitness
-                    conflicts = new_conflicts
+                if d_hard < 0:
+                    evaluator.commit(idx, **move)
                     break # Lanjut ke gen bermasalah berikutnya
-                else:
-                    # Revert (Balikin)
-                    individual.chromosome[idx] = copy.deepcopy(original_gene)
-        
-        individual.fitness = current_fitness
-        individual.conflicts = conflicts
-        return individual
-
-    def apply_load_balancing(self, individual):
+
+        evaluator.clear_log()
+        return evaluator.sync_individual()
+
+    def apply_load_balancing(self, individual, evaluator=None, rng=random, max_moves=None):
         """
         FASE 2: SAFE LOAD BALANCING
         Fokus: Ratakan beban TAPI cek dulu jadwalnya bentrok gak
+        - Heap max/min beban dosen (lazy: entry usang dilewati saat pop)
+        - Indeks gen per dosen (tidak perlu scan kromosom tiap iterasi)
+        - Kesibukan dosen dari okupansi overlap IncrementalEvaluator (O(1))
+        Tiap transfer wajib menurunkan jumlah kuadrat beban (beban target + SKS
+        < beban asal), jadi loop pasti konvergen tanpa batas percobaan.
         """
-        # 1. Hitung Beban
-        workload = {}
-        for gene in individual.chromosome:
-            d = gene['dosen']
-            if "Unknown" in d: continue
-            workload[d] = workload.get(d, 0) + gene['sks']
-
-        if not workload: return individual
-
-        # 2. Loop Balancing
-        for _ in range(20): # Coba 20 kali per individu
-            sorted_dosen = sorted(workload.items(), key=lambda x: x[1], reverse=True)
-            overloaded_dosen, max_load = sorted_dosen[0]
-            underloaded_dosen, min_load = sorted_dosen[-1]
-            
-            avg_load = sum(workload.values()) / len(workload)
-            if (max_load - avg_load) < 2: break 
+        if evaluator is None:
+            evaluator = IncrementalEvaluator(self.fitness_calc, individual)
+        self._balance_loads(individual, evaluator, rng, max_moves)
+        evaluator.clear_log()
+        return evaluator.sync_individual()
+
+    def _balance_loads(self, individual, evaluator, rng, max_moves=None):
+        """Inti apply_load_balancing: commit transfer tanpa menghapus undo log."""
+        table = individual.table
+
+        # 1. Beban (index dosen -> SKS), hanya dosen known yang mengajar
+        workload, taught = evaluator.workload, evaluator.taught
+        active = np.flatnonzero(taught > 0)
+        if len(active) == 0: return
+
+        genes_of = {}
+        known = table.dosen_known[individual.dosen_ids]
+        for i in np.flatnonzero(known):
+            genes_of.setdefault(int(individual.dosen_ids[i]), set()).add(int(i))
+
+        max_heap = [(-int(workload[d]), int(d)) for d in active]
+        min_heap = [(int(workload[d]), int(d)) for d in active]
+        heapq.heapify(max_heap)
+        heapq.heapify(min_heap)
+
+        def push(d):
+            if taught[d] > 0:
+                heapq.heappush(max_heap, (-int(workload[d]), d))
+                heapq.heappush(min_heap, (int(workload[d]), d))
+
+        def lightest():
+            while min_heap:
+                load, d = min_heap[0]
+                if taught[d] > 0 and load == workload[d]: return d
+                heapq.heappop(min_heap)
+            return None
+
+        # 2. Loop Balancing (sampai konvergen / max_moves)
+        moves = 0
+        while max_heap and (max_moves is None or moves < max_moves):
+            neg_load, overloaded_dosen = heapq.heappop(max_heap)
+            max_load = -neg_load
+            if taught[overloaded_dosen] == 0 or max_load != workload[overloaded_dosen]:
+                continue # Entry usang
+
+            avg_load = evaluator.mean_load
+            if (max_load - avg_load) < 2: break
+            underloaded_dosen = lightest()
 
             # Cari Matkul si Overload
-            genes_of_overloaded = [g for g in individual.chromosome if g['dosen'] == overloaded_dosen]
-            random.shuffle(genes_of_overloaded)
-            
-            for gene in genes_of_overloaded:
-                kode_mk = gene['kode_mk']
-                sks_mk = gene['sks']
-                slot_saat_ini = gene['slot_id']
-                
-                possible_candidates = self.candidates.get(kode_mk, [])
-                
+            genes_of_overloaded = list(genes_of.get(overloaded_dosen, ()))
+            rng.shuffle(genes_of_overloaded)
+
+            for i in genes_of_overloaded:
+                slot_saat_ini = int(individual.slot_ids[i])
+                sks = int(table.sks[i])
+
+                possible_candidates = [
+                    int(d) for d in table.candidates[i] if workload[d] + sks < max_load
+                ]
+
                 # Cari target
                 target_dosen = None
                 if underloaded_dosen in possible_candidates:
                     target_dosen = underloaded_dosen
                 else:
-                    valid_subs = [d for d in possible_candidates if workload.get(d, 0) < avg_load]
-                    if valid_subs: target_dosen = random.choice(valid_subs)
-                
-                if target_dosen:
+                    valid_subs = [d for d in possible_candidates if workload[d] < avg_load]
+                    if valid_subs: target_dosen = rng.choice(valid_subs)
+
+                if target_dosen is not None:
                     # --- SAFETY CHECK (KUNCI PERBAIKAN) ---
                     # Sebelum tukar, cek apakah Target Dosen SIBUK di jam itu?
-                    if self.is_dosen_busy(individual.chromosome, target_dosen, slot_saat_ini):
+                    if evaluator.dosen_busy(target_dosen, slot_saat_ini, exclude=i):
                         continue # Skip, cari matkul lain / target lain
-                    
-                    # Jika aman, EKSEKUSI
-                    old_dosen = gene['dosen']
-                    gene['dosen'] = target_dosen
-                    info = self.pref_info.get((target_dosen, kode_mk), {'prioritas': 99})
-                    gene['dosen_priority'] = info['prioritas']
-                    
-                    workload[old_dosen] -= sks_mk
-                    workload[target_dosen] = workload.get(target_dosen, 0) + sks_mk
-                    break 
-            
-        return individual
\ No newline at end of file
+                    # Constraint tambahan berbasis dosen (mis. dosen berhalangan)
+                    if evaluator.dosen_constraints and evaluator.delta(i, dosen=target_dosen)[1] > 0:
+                        continue
+
+                    # Jika aman, EKSEKUSI (prioritas dibaca dari ClassTable)
+                    evaluator.commit(i, dosen=target_dosen)
+                    genes_of[overloaded_dosen].discard(i)
+                    genes_of.setdefault(target_dosen, set()).add(i)
+                    push(overloaded_dosen)
+                    push(target_dosen)
+                    moves += 1
+                    break
+            # Tidak ada matkul yang bisa dipindah: dosen ini dilewati (tidak di-push lagi)
+
+    def optimal_assignment(self, individual, evaluator=None, rng=random, fair_weight=10.0, max_rounds=1):
+        """
+        FASE 3: ASSIGNMENT DOSEN (memetic, jadwal tetap)
+        Semua dosen dipilih ulang sekaligus lewat min-cost flow + pemolesan
+        (lihat ga_core.assignment): bebas bentrok, minim penalti prioritas &
+        kuadrat beban. fair_weight besar karena penalti fairness mendominasi
+        fitness. Hasil hanya dipakai jika penalty total tidak memburuk.
+        """
+        table = individual.table
+        if evaluator is None:
+            evaluator = IncrementalEvaluator(self.fitness_calc, individual)
+
+        # SD beban dihitung atas dosen yang aktif mengajar -> himpunan aktif
+        # dipertahankan (dosen baru ber-beban kecil justru menaikkan SD)
+        active = evaluator.taught > 0
+        genes = [i for i in range(len(individual)) if len(table.candidates[i])]
+        if not genes: return individual
+        chosen = assign_lecturers(
+            table.sks[genes].tolist(),
+            [[int(d) for d in table.candidates[i] if active[d]] for i in genes],
+            lambda g, d: evaluator.prio_cost(genes[g], d),
+            fair_weight=fair_weight,
+            slot_ids=individual.slot_ids[genes].tolist(),
+            overlap=self._overlap_rows,
+            max_rounds=max_rounds,
+            start=individual.dosen_ids[genes].tolist(),
+        )
+
+        mark, before = evaluator.mark(), evaluator.penalty
+        for i, d in zip(genes, chosen):
+            if d is not None:
+                evaluator.commit(i, dosen=d)
+        # Poles dengan delta eksak fitness (SD dosen aktif)
+        self._balance_loads(individual, evaluator, rng)
+        if evaluator.penalty > before:
+            evaluator.rollback(mark)
+        evaluator.clear_log()
+        return evaluator.sync_individual()
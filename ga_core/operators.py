@@ -1,66 +1,81 @@
 import random
-import copy
+import numpy as np
+from ga_core.individual import Individual
+from ga_core.group_moves import sibling_free_slot
 
 # ============================
 # 1. SELEKSI (TOURNAMENT)
 # ============================
-def tournament_selection(population, k=3):
-    candidates = random.sample(population, k)
+def tournament_selection(population, k=3, rng=random):
+    candidates = rng.sample(population, k)
     best = max(candidates, key=lambda ind: ind.fitness)
     return best
 
 # ============================
 # 2. CROSSOVER (KAWIN SILANG)
 # ============================
-def crossover(parent1, parent2, crossover_rate=0.8):
-    if random.random() > crossover_rate:
-        return copy.deepcopy(parent1), copy.deepcopy(parent2)
+def crossover(parent1, parent2, crossover_rate=0.8, rng=random):
+    if rng.random() > crossover_rate:
+        # Tanpa crossover: anak berbagi array orang tua (copy-on-write)
+        return parent1.clone(), parent2.clone()
 
-    child1 = copy.deepcopy(parent1)
-    child2 = copy.deepcopy(parent2)
+    child1 = Individual(parent1.table)
+    child2 = Individual(parent2.table)
     
-    num_genes = len(parent1.chromosome)
-    for i in range(num_genes):
-        if random.random() < 0.5:
-            child1.chromosome[i], child2.chromosome[i] = child2.chromosome[i], child1.chromosome[i]
+    # Uniform crossover per gen: array anak langsung dibentuk dari mask.
+    # Sesi-sesi satu MK-kelas diwariskan utuh dari orang tua yang sama
+    # (mask mengikuti wakil sesi) agar harinya tetap tidak bentrok.
+    num_genes = len(parent1)
+    mask = np.array([rng.random() < 0.5 for _ in range(num_genes)], dtype=bool)
+    mask = mask[parent1.table.section_leader]
+    for attr in Individual.GENE_ARRAYS:
+        a1, a2 = getattr(parent1, attr), getattr(parent2, attr)
+        setattr(child1, attr, np.where(mask, a2, a1))
+        setattr(child2, attr, np.where(mask, a1, a2))
             
     # Reset
     child1.fitness = 0.0
     child1.conflicts = []
+    child1.n_conflicts = 0
     child2.fitness = 0.0
     child2.conflicts = []
+    child2.n_conflicts = 0
     return child1, child2
 
 # ============================
 # 3. MUTATION (BACK TO BASIC + RANDOM SWAP)
 # ============================
-def mutation(individual, all_slots, all_rooms, candidates, pref_info, mutation_rate=0.1):
+def mutation(individual, mutation_rate=0.1, rng=random, mutate_rooms=True):
     """
     Mutasi Random untuk eksplorasi.
     Urusan Balancing dan Repair diserahkan ke Local Search (Memetic).
+    Slot & ruang baru hanya diambil dari domain feasible kelas (ClassTable).
+    Slot baru sesi MK yang dipecah dipilih di hari yang belum dipakai saudaranya.
+    mutate_rooms=False (mode decoder ruang): gen ruang akan ditimpa decoder,
+    jadi undian hanya dibagi antara slot (2/3) dan dosen (1/3).
     """
-    for gene in individual.chromosome:
-        if random.random() < mutation_rate:
+    table = individual.table
+    p_slot, p_room = (0.4, 0.4) if mutate_rooms else (2 / 3, 0.0)
+    for i in range(len(individual)):
+        if rng.random() < mutation_rate:
             
-            choice = random.random()
+            choice = rng.random()
             
-            if choice < 0.4:
+            if choice < p_slot:
                 # Ganti Slot
-                gene['slot_id'] = random.choice(all_slots)['slot_id']
-            elif choice < 0.8:
+                individual.writable('slot_ids')[i] = sibling_free_slot(individual, i, rng)
+            elif choice < p_slot + p_room:
                 # Ganti Ruang
-                gene['room_id'] = random.choice(all_rooms)['room_id']
+                individual.writable('room_ids')[i] = rng.choice(table.room_domain[i])
             else:
                 # Ganti Dosen (Random Swap saja, bukan Robin Hood)
                 # Biar LocalSearch yang urus balancing yang aman
-                kode_mk = gene['kode_mk']
-                possible = candidates.get(kode_mk, [])
+                # (Prioritas dosen dibaca dari ClassTable saat evaluasi)
+                possible = table.candidates[i]
                 if len(possible) > 1:
-                    new_dosen = random.choice(possible)
-                    gene['dosen'] = new_dosen
-                    info = pref_info.get((new_dosen, kode_mk), {'prioritas': 99})
-                    gene['dosen_priority'] = info['prioritas']
+                    individual.writable('dosen_ids')[i] = rng.choice(possible)
 
     # Reset fitness
     individual.fitness = 0.0
-    individual.conflicts = []
\ No newline at end of file
+    individual.conflicts = []
+    individual.n_conflicts = 0
@@ -0,0 +1,156 @@
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import ga_core.operators as ops
+from ga_core.individual import Individual
+from ga_core.incremental import IncrementalEvaluator
+from ga_core.telemetry import PhaseTimer, NULL_TIMER
+
+# ===============================
+# PRODUKSI ANAK PARALEL
+# ===============================
+# Setiap pasangan orang tua = 1 task independen dengan seed sendiri.
+# Seed diambil berurutan dari RNG engine, sehingga hasil serial, thread,
+# dan process identik untuk seed yang sama.
+
+BACKEND_SERIAL = "serial"
+BACKEND_THREAD = "thread"
+BACKEND_PROCESS = "process"
+
+def breed_pair(engine, parent1, parent2, seed, timer=NULL_TIMER):
+    """Crossover + mutasi + repair memetic untuk satu pasangan orang tua."""
+    rng = random.Random(seed)
+    params = engine.params
+    timer.start()
+
+    child1, child2 = ops.crossover(parent1, parent2, params['crossover_rate'], rng=rng)
+    timer.lap("crossover")
+
+    # Mutasi Random (laju bisa dinaikkan engine saat stagnasi)
+    mutate_rooms = engine.room_decoder is None
+    ops.mutation(child1, engine.mutation_rate, rng=rng, mutate_rooms=mutate_rooms)
+    ops.mutation(child2, engine.mutation_rate, rng=rng, mutate_rooms=mutate_rooms)
+    timer.lap("mutation")
+
+    # Mode decoder: ruang diturunkan dari slot (gen ruang hasil crossover/mutasi ditimpa)
+    if engine.room_decoder is not None:
+        engine.room_decoder.apply(child1)
+        engine.room_decoder.apply(child2)
+        timer.lap("room_decode")
+
+    # --- MEMETIC ALGORITHM UPGRADE ---
+    for child in (child1, child2):
+        # Evaluator inkremental dipakai bersama oleh kedua fase
+        evaluator = IncrementalEvaluator(engine.fitness_calc, child)
+        # LANGKAH 1: REPAIR KONFLIK (Hilangkan Tabrakan Ruang/Dosen)
+        engine.repair_engine.repair(child, evaluator, rng=rng)
+        timer.lap("repair")
+        # LANGKAH 2: LOAD BALANCING (Ratakan SKS dengan Aman)
+        engine.ls_engine.apply_load_balancing(child, evaluator, rng=rng)
+        timer.lap("balancing")
+        timer.count("delta_evaluations", evaluator.n_deltas)
+
+    return child1, child2
+
+# ---------- WORKER PROSES ----------
+_WORKER_ENGINE = None
+
+def _init_process_worker(data, params):
+    """Dipanggil sekali per proses: bangun engine lokal dari data problem."""
+    global _WORKER_ENGINE
+    from ga_core.ga_engine import GeneticAlgorithm
+    # Telemetry, checkpoint & warm start hanya urusan proses utama
+    _WORKER_ENGINE = GeneticAlgorithm(data, dict(
+        params, backend=BACKEND_SERIAL, telemetry_path=None, checkpoint_path=None, warm_start=None,
+    ))
+
+def _to_arrays(ind):
+    return ind.slot_ids, ind.room_ids, ind.dosen_ids
+
+def _from_arrays(table, arrays):
+    ind = Individual(table)
+    ind.slot_ids, ind.room_ids, ind.dosen_ids = arrays
+    return ind
+
+def _breed_chunk(chunk, timed=False, mutation_rate=None):
+    """Task proses: list (array ortu1, array ortu2, seed) -> (list array anak, waktu fase)."""
+    engine = _WORKER_ENGINE
+    if mutation_rate is not None:
+        engine.mutation_rate = mutation_rate
+    timer = PhaseTimer() if timed else NULL_TIMER
+    results = []
+    for arrays1, arrays2, seed in chunk:
+        child1, child2 = breed_pair(
+            engine, _from_arrays(engine.table, arrays1), _from_arrays(engine.table, arrays2), seed, timer
+        )
+        results.append((_to_arrays(child1), _to_arrays(child2)))
+    return results, (dict(timer.totals), dict(timer.counts))
+
+
+class OffspringExecutor:
+    """
+    Backend eksekusi produksi anak:
+    - "serial"  : loop biasa (referensi)
+    - "thread"  : ThreadPoolExecutor, objek engine dibagi langsung
+    - "process" : ProcessPoolExecutor, data problem dikirim sekali per worker,
+                  task dikirim per chunk berisi array orang tua + seed
+    """
+    def __init__(self, engine, backend=BACKEND_SERIAL, workers=None, chunk_size=None):
+        if backend not in (BACKEND_SERIAL, BACKEND_THREAD, BACKEND_PROCESS):
+            raise ValueError(f"Backend tidak dikenal: {backend}")
+        self.engine = engine
+        self.backend = backend
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            if self.backend == BACKEND_THREAD:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers)
+            else:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_process_worker,
+                    initargs=(self.engine.data, self.engine.params),
+                )
+        return self._pool
+
+    def breed(self, tasks, timer=NULL_TIMER):
+        """
+        tasks: list (parent1, parent2, seed). Return: list (child1, child2) sesuai urutan.
+        Waktu fase dijumlahkan ke timer (pada mode paralel = total waktu semua worker).
+        """
+        engine = self.engine
+        if self.backend == BACKEND_SERIAL or len(tasks) <= 1:
+            return [breed_pair(engine, p1, p2, seed, timer) for p1, p2, seed in tasks]
+
+        timed = timer is not NULL_TIMER
+        pool = self._get_pool()
+        if self.backend == BACKEND_THREAD:
+            def run_task(task):
+                local = PhaseTimer() if timed else NULL_TIMER
+                return breed_pair(engine, *task, timer=local), local
+            pairs = []
+            for pair, local in pool.map(run_task, tasks):
+                timer.merge(local.totals, local.counts)
+                pairs.append(pair)
+            return pairs
+
+        # Process: kirim array saja, dipotong per chunk
+        n_workers = self.workers or os.cpu_count() or 1
+        size = self.chunk_size or max(1, -(-len(tasks) // (n_workers * 2)))
+        payload = [(_to_arrays(p1), _to_arrays(p2), seed) for p1, p2, seed in tasks]
+        chunks = [payload[i:i + size] for i in range(0, len(payload), size)]
+        pairs = []
+        rates = [engine.mutation_rate] * len(chunks)
+        for chunk_result, (totals, counts) in pool.map(_breed_chunk, chunks, [timed] * len(chunks), rates):
+            timer.merge(totals, counts)
+            for arrays1, arrays2 in chunk_result:
+                pairs.append((_from_arrays(engine.table, arrays1), _from_arrays(engine.table, arrays2)))
+        return pairs
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
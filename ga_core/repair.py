@@ -0,0 +1,265 @@
+import abc
+import math
+import random
+import time
+import numpy as np
+from ga_core.incremental import IncrementalEvaluator
+from ga_core.group_moves import group_move, sibling_free_slot
+
+# ===============================
+# REPAIR ENGINE (PLUGGABLE)
+# ===============================
+# Semua engine punya antarmuka sama: repair(individual, evaluator, rng).
+# - "fihc"      : hill climbing acak lama (LocalSearch.resolve_conflicts)
+# - "tabu"      : tabu search, pilih langkah terbaik dari sampel tetangga
+# - "annealing" : simulated annealing, terima langkah memburuk dgn peluang exp(-d/T)
+# Tetangga: pindah slot/ruang, tukar slot 2 kelas, Kempe chain antar 2 slot, dan
+# langkah majemuk grup (geser hari semua sesi MK-kelas / tukar dengan kelas paralel;
+# bobot params['group_move_weight'], default 0 = mati). Pindah slot sesi MK yang
+# dipecah selalu memilih hari yang belum dipakai sesi saudaranya.
+# Semua langkah dinilai lewat IncrementalEvaluator (delta / commit + rollback).
+# Opsional `stability`: biaya tambahan per langkah (mis. penalti memindah kelas
+# yang tidak terdampak saat reschedule), lihat reschedule.StabilityPenalty.
+# Opsional `room_decoder`: pindah slot selalu disertai ruang best-fit yang
+# kosong (ruang bukan gen bebas), lihat room_decoder.RoomDecoder.
+
+ENGINE_FIHC = "fihc"
+ENGINE_TABU = "tabu"
+ENGINE_ANNEALING = "annealing"
+
+MOVE_SHIFT = "shift"
+MOVE_SWAP = "swap"
+MOVE_KEMPE = "kempe"
+MOVE_GROUP = "group"
+
+class RepairEngine(abc.ABC):
+    """Basis engine repair; subclass mengimplementasikan _search()."""
+    def __init__(self, fitness_calc, max_iters=200, time_limit=None,
+                 move_weights=(0.6, 0.25, 0.15, 0.0), kempe_limit=12, stability=None, room_decoder=None):
+        self.fitness_calc = fitness_calc
+        self.stability = stability
+        self.room_decoder = room_decoder
+        self.max_iters = max_iters
+        self.time_limit = time_limit
+        self.move_kinds = (MOVE_SHIFT, MOVE_SWAP, MOVE_KEMPE, MOVE_GROUP)
+        self.move_weights = move_weights
+        self.kempe_limit = kempe_limit
+
+    def repair(self, individual, evaluator=None, rng=random):
+        if evaluator is None:
+            evaluator = IncrementalEvaluator(self.fitness_calc, individual)
+        if evaluator.hard_count > 0:
+            deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+            self._search(evaluator, rng, deadline)
+        evaluator.clear_log()
+        return evaluator.sync_individual()
+
+    @abc.abstractmethod
+    def _search(self, evaluator, rng, deadline):
+        """Perbaiki individu evaluator di tempat (lewat commit) sampai bersih/deadline."""
+
+    @staticmethod
+    def _expired(deadline):
+        return deadline is not None and time.perf_counter() > deadline
+
+    # ---------- TETANGGA ----------
+    def random_move(self, evaluator, gene, rng):
+        """Satu langkah acak untuk gen: list (gen, kwargs commit). None jika tidak valid."""
+        kind = rng.choices(self.move_kinds, weights=self.move_weights)[0]
+        if kind == MOVE_SWAP:
+            move = self._swap_move(evaluator.ind, gene, rng)
+        elif kind == MOVE_KEMPE:
+            move = self._kempe_move(evaluator, gene, rng)
+        elif kind == MOVE_GROUP and evaluator.table.has_group[gene]:
+            move = group_move(evaluator.ind, gene, rng)
+        else:
+            move = None
+        return move or self._shift_move(evaluator, gene, rng)
+
+    def _shift_move(self, evaluator, gene, rng):
+        table = evaluator.ind.table
+        if self.room_decoder is not None:
+            return [(gene, self.room_decoder.slot_move(evaluator, gene, sibling_free_slot(evaluator.ind, gene, rng)))]
+        if rng.random() < 0.5:
+            return [(gene, {'slot': sibling_free_slot(evaluator.ind, gene, rng)})]
+        return [(gene, {'room': rng.choice(table.room_domain[gene])})]
+
+    @staticmethod
+    def _swap_move(ind, gene, rng):
+        """Tukar slot gen dengan kelas acak lain (keduanya harus tetap di domain)."""
+        j = rng.randrange(len(ind))
+        s_i, s_j = int(ind.slot_ids[gene]), int(ind.slot_ids[j])
+        mask = ind.table.slot_domain_mask
+        if j == gene or s_i == s_j or not (mask[gene, s_j] and mask[j, s_i]):
+            return None
+        return [(gene, {'slot': s_j}), (j, {'slot': s_i})]
+
+    def _kempe_move(self, evaluator, gene, rng):
+        """
+        Kempe chain: mulai dari gen di slot a menuju slot b, ikutkan semua kelas
+        di slot a/b yang berbagi ruang atau dosen (known) secara berantai, lalu
+        tukar slot a <-> b untuk seluruh rantai.
+        """
+        ind = evaluator.ind
+        table = ind.table
+        s_from = int(ind.slot_ids[gene])
+        s_to = int(rng.choice(table.slot_domain[gene]))
+        if s_to == s_from: return None
+
+        slot_ids, room_ids, dosen_ids = ind.slot_ids, ind.room_ids, ind.dosen_ids
+        members = np.flatnonzero((slot_ids == s_from) | (slot_ids == s_to))
+        known = table.dosen_known
+        chain, frontier = {gene}, [gene]
+        while frontier:
+            g = frontier.pop()
+            linked = (slot_ids[members] != slot_ids[g]) & (
+                (room_ids[members] == room_ids[g])
+                | ((dosen_ids[members] == dosen_ids[g]) & known[dosen_ids[g]])
+            )
+            for j in members[linked]:
+                j = int(j)
+                if j not in chain:
+                    chain.add(j)
+                    frontier.append(j)
+            if len(chain) > self.kempe_limit: return None
+
+        swap = {s_from: s_to, s_to: s_from}
+        move = [(j, {'slot': swap[int(slot_ids[j])]}) for j in sorted(chain)]
+        if not all(table.slot_domain_mask[j, kw['slot']] for j, kw in move):
+            return None
+        return move
+
+    # ---------- EVALUASI LANGKAH ----------
+    def objective(self, evaluator):
+        """Penalty yang diminimalkan: penalty evaluator (+ biaya stabilitas bila ada)."""
+        if self.stability is None:
+            return evaluator.penalty
+        return evaluator.penalty + self.stability.cost(evaluator.ind)
+
+    def move_delta(self, evaluator, move):
+        """Delta objective langkah tanpa mengubah state (majemuk: commit lalu rollback)."""
+        extra = 0.0 if self.stability is None else self.stability.move_delta(evaluator.ind, move)
+        if len(move) == 1:
+            gene, kwargs = move[0]
+            return evaluator.delta(gene, **kwargs)[0] + extra
+        mark, before = evaluator.mark(), evaluator.penalty
+        for gene, kwargs in move:
+            evaluator.commit(gene, **kwargs)
+        after = evaluator.penalty
+        evaluator.rollback(mark)
+        return after - before + extra
+
+    @staticmethod
+    def apply_move(evaluator, move):
+        for gene, kwargs in move:
+            evaluator.commit(gene, **kwargs)
+
+
+class FIHCRepair(RepairEngine):
+    """Adapter untuk repair acak lama di LocalSearch (perilaku default)."""
+    def __init__(self, fitness_calc, ls_engine, **kwargs):
+        super().__init__(fitness_calc, **kwargs)
+        self.ls_engine = ls_engine
+
+    def _search(self, evaluator, rng, deadline):
+        # Satu putaran FIHC atas gen bermasalah (tanpa batas waktu)
+        self.ls_engine.resolve_conflicts(evaluator.ind, evaluator, rng=rng)
+
+
+class TabuRepair(RepairEngine):
+    """
+    Tabu search: tiap iterasi sampel `sample_size` langkah dari gen bermasalah,
+    ambil yang terbaik walau memburuk (lolos plateau). Gen yang baru dipindah
+    jadi tabu selama `tenure` iterasi, kecuali langkahnya menghasilkan rekor baru.
+    """
+    def __init__(self, fitness_calc, tenure=7, sample_size=24, **kwargs):
+        super().__init__(fitness_calc, **kwargs)
+        self.tenure = tenure
+        self.sample_size = sample_size
+
+    def _search(self, evaluator, rng, deadline):
+        tabu_until = {}
+        best_penalty, best_mark = self.objective(evaluator), evaluator.mark()
+        for it in range(self.max_iters):
+            if evaluator.hard_count == 0 or self._expired(deadline): break
+            genes = evaluator.hard_genes()
+            if len(genes) == 0: break
+
+            current = self.objective(evaluator)
+            chosen, chosen_delta = None, math.inf
+            for _ in range(self.sample_size):
+                move = self.random_move(evaluator, int(rng.choice(genes)), rng)
+                d = self.move_delta(evaluator, move)
+                is_tabu = any(tabu_until.get(g, -1) >= it for g, _ in move)
+                if is_tabu and current + d >= best_penalty:
+                    continue  # tabu & tidak memenuhi aspirasi
+                if d < chosen_delta:
+                    chosen, chosen_delta = move, d
+            if chosen is None: continue
+
+            self.apply_move(evaluator, chosen)
+            for g, _ in chosen:
+                tabu_until[g] = it + self.tenure
+            if current + chosen_delta < best_penalty:
+                best_penalty, best_mark = current + chosen_delta, evaluator.mark()
+
+        # Kembali ke solusi terbaik yang pernah dilihat
+        evaluator.rollback(best_mark)
+
+
+class AnnealingRepair(RepairEngine):
+    """
+    Simulated annealing: langkah acak pada gen bermasalah (sesekali gen acak),
+    langkah memburuk diterima dengan peluang exp(-delta / T), T turun geometris.
+    """
+    def __init__(self, fitness_calc, initial_temp=None, cooling=0.99, focus=0.8, **kwargs):
+        super().__init__(fitness_calc, **kwargs)
+        # Default: +1 pelanggaran hard diterima dgn peluang ~e^-1 di awal
+        self.initial_temp = fitness_calc.WEIGHT_HARD if initial_temp is None else initial_temp
+        self.cooling = cooling
+        self.focus = focus
+
+    def _search(self, evaluator, rng, deadline):
+        n = len(evaluator.ind)
+        temp = self.initial_temp
+        current = self.objective(evaluator)
+        best_penalty, best_mark = current, evaluator.mark()
+        for _ in range(self.max_iters):
+            if evaluator.hard_count == 0 or self._expired(deadline): break
+            genes = evaluator.hard_genes()
+            if len(genes) and rng.random() < self.focus:
+                gene = int(rng.choice(genes))
+            else:
+                gene = rng.randrange(n)
+
+            move = self.random_move(evaluator, gene, rng)
+            d = self.move_delta(evaluator, move)
+            if d <= 0 or rng.random() < math.exp(-d / max(temp, 1e-9)):
+                self.apply_move(evaluator, move)
+                current += d
+                if current < best_penalty:
+                    best_penalty, best_mark = current, evaluator.mark()
+            temp *= self.cooling
+
+        evaluator.rollback(best_mark)
+
+
+def make_repair_engine(params, fitness_calc, ls_engine, room_decoder=None):
+    """
+    Pilih engine dari params (room_decoder diteruskan ke engine tabu/annealing):
+    - repair_engine : "fihc" (default), "tabu", atau "annealing"
+    - repair_iters  : batas iterasi per individu (default 200)
+    - repair_time   : batas waktu detik per individu (None = tanpa batas)
+    - group_move_weight : bobot langkah majemuk grup (tabu/annealing, default 0)
+    """
+    name = params.get('repair_engine', ENGINE_FIHC)
+    budget = {'max_iters': params.get('repair_iters', 200), 'time_limit': params.get('repair_time'),
+              'room_decoder': room_decoder}
+    move_weights = (0.6, 0.25, 0.15, params.get('group_move_weight', 0.0))
+    if name == ENGINE_FIHC:
+        return FIHCRepair(fitness_calc, ls_engine, **budget)
+    if name == ENGINE_TABU:
+        return TabuRepair(fitness_calc, move_weights=move_weights, **budget)
+    if name == ENGINE_ANNEALING:
+        return AnnealingRepair(fitness_calc, move_weights=move_weights, **budget)
+    raise ValueError(f"Repair engine tidak dikenal: {name}")
@@ -0,0 +1,74 @@
+import numpy as np
+from ga_core.fitness import describe_conflict
+
+# ===============================
+# LAPORAN HASIL (KONSOL)
+# ===============================
+def print_result_summary(individual, duration):
+    print("\n=== LAPORAN HASIL AKHIR ===")
+    print(f"Durasi Proses: {duration:.2f} detik")
+    print(f"Fitness Akhir: {individual.fitness:.5f}")
+    print(f"Total Konflik: {len(individual.conflicts)}")
+    
+    if individual.conflicts:
+        print("\n❌ SISA KONFLIK YANG BELUM TERSELESAIKAN:")
+        for record in individual.conflicts[:10]: # Tampilkan 10 saja biar ga penuh
+            print(f"  - {describe_conflict(record, individual.table)}")
+    else:
+        print("\n✅ JADWAL SEMPURNA! Tidak ada pelanggaran aturan.")
+
+def print_statistical_report(individual):
+    """
+    Menghitung dan menampilkan statistik beban kerja dosen (Fairness).
+    """
+    print("\n" + "="*40)
+    print("       LAPORAN STATISTIK BEBAN DOSEN")
+    print("="*40)
+    
+    # 1. Hitung Total SKS per Dosen
+    dosen_workload = {}
+    
+    table = individual.table
+    for i in range(table.n_classes):
+        dosen = table.dosen_names[individual.dosen_ids[i]]
+        sks = int(table.sks[i])
+        
+        # Skip jika dosennya "Unknown" atau placeholder
+        if "Unknown" in dosen or "Belum" in dosen:
+            continue
+            
+        dosen_workload[dosen] = dosen_workload.get(dosen, 0) + sks
+        
+    # 2. Tampilkan Rincian
+    print(f"{'NAMA DOSEN':<35} | {'SKS':<5}")
+    print("-" * 43)
+    
+    # Urutkan berdasarkan beban SKS (tertinggi ke terendah)
+    sorted_load = sorted(dosen_workload.items(), key=lambda x: x[1], reverse=True)
+    
+    for dosen, total_sks in sorted_load:
+        print(f"{dosen:<35} | {total_sks:<5}")
+        
+    # 3. Hitung Fairness (Standar Deviasi)
+    loads = list(dosen_workload.values())
+    if loads:
+        avg_load = np.mean(loads)
+        std_dev = np.std(loads)
+        min_load = np.min(loads)
+        max_load = np.max(loads)
+        
+        print("-" * 43)
+        print(f"Rata-rata Beban : {avg_load:.2f} SKS")
+        print(f"Tertinggi       : {max_load} SKS")
+        print(f"Terendah        : {min_load} SKS")
+        print(f"Standar Deviasi : {std_dev:.4f}  <-- INDIKATOR FAIRNESS")
+        print("="*40)
+        
+        if std_dev < 2.0:
+            print("✅ Status Fairness: SANGAT BAIK (Merata)")
+        elif std_dev < 4.0:
+            print("⚠️ Status Fairness: CUKUP (Ada ketimpangan)")
+        else:
+            print("❌ Status Fairness: BURUK (Sangat timpang)")
+    else:
+        print("Data beban dosen kosong.")
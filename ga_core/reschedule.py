@@ -0,0 +1,282 @@
+import csv
+import time
+import numpy as np
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.incremental import IncrementalEvaluator
+from ga_core.individual import Individual
+from ga_core.repair import TabuRepair
+from ga_core.data_loader import encode_instance
+from ga_core.parallel import BACKEND_SERIAL
+
+# ===============================
+# RESCHEDULE INKREMENTAL
+# ===============================
+# Mulai dari jadwal yang sudah ada (CSV hasil csv_export), terapkan perubahan
+# (ruang ditutup, slot diblokir, dosen berhalangan / diganti), lalu perbaiki
+# HANYA kelas terdampak & tetangganya. Memindah kelas yang tidak terdampak
+# dikenai penalti stabilitas agar jadwal mahasiswa berubah sesedikit mungkin.
+
+class ChangeSet:
+    """
+    Perubahan terhadap jadwal berjalan:
+    - removed_rooms     : nama ruang yang tidak bisa dipakai
+    - blocked_slots     : slot_id atau tuple (hari, jam_mulai, jam_selesai); semua
+                          slot yang beririsan dengan waktu tersebut ikut diblokir
+    - unavailable_dosen : nama dosen yang berhalangan
+    - reassign          : dict (kode_mk, mata_kuliah, kelas) -> nama dosen baru
+    """
+    def __init__(self, removed_rooms=(), blocked_slots=(), unavailable_dosen=(), reassign=None):
+        self.removed_rooms = set(removed_rooms)
+        self.blocked_slots = list(blocked_slots)
+        self.unavailable_dosen = set(unavailable_dosen)
+        self.reassign = {tuple(map(str, key)): name for key, name in (reassign or {}).items()}
+
+def _minutes(time_str):
+    h, m = map(int, str(time_str).split(':')[:2])
+    return h * 60 + m
+
+def _blocked_slot_ids(slots, blocked):
+    """Slot yang beririsan dengan salah satu waktu yang diblokir."""
+    by_id = {s['slot_id']: s for s in slots}
+    windows = []
+    for item in blocked:
+        if isinstance(item, (tuple, list)):
+            hari, mulai, selesai = item
+        else:
+            s = by_id[int(item)]
+            hari, mulai, selesai = s['Hari'], s['Mulai'], s['Selesai']
+        windows.append((str(hari).lower(), _minutes(mulai), _minutes(selesai)))
+    return {
+        s['slot_id'] for s in slots
+        for hari, start, end in windows
+        if str(s['Hari']).lower() == hari and _minutes(s['Mulai']) < end and start < _minutes(s['Selesai'])
+    }
+
+def apply_changes(data, changes):
+    """
+    Data problem baru sesuai ChangeSet (data asli tidak diubah).
+    slot_id & room_id dipertahankan sehingga jadwal lama tetap bisa dipetakan.
+    """
+    blocked = _blocked_slot_ids(data['slots'], changes.blocked_slots)
+    slots = [s for s in data['slots'] if s['slot_id'] not in blocked]
+    rooms = [r for r in data['rooms'] if r['Ruang'] not in changes.removed_rooms]
+
+    gone = changes.unavailable_dosen
+    candidates = {kode: [d for d in dosen_list if d not in gone] for kode, dosen_list in data['candidates'].items()}
+    pref_info = {key: info for key, info in data['pref_info'].items() if key[0] not in gone}
+
+    classes = []
+    for c in data['classes']:
+        c = dict(c)
+        if c['dosen'] in gone:
+            # Ganti dosen awal dengan kandidat prioritas terbaik yang tersisa
+            options = sorted(candidates.get(c['kode_mk'], []),
+                             key=lambda d: pref_info.get((d, c['kode_mk']), {'prioritas': 99})['prioritas'])
+            c['dosen'] = options[0] if options else "Unknown Dosen"
+            c['dosen_priority'] = pref_info.get((c['dosen'], c['kode_mk']), {'prioritas': 99})['prioritas']
+        classes.append(c)
+    # Dosen pengganti eksplisit harus ada di indeks dosen ClassTable
+    for (kode, _, _), name in changes.reassign.items():
+        if name not in candidates.setdefault(kode, []):
+            candidates[kode].append(name)
+
+    return dict(data, slots=slots, rooms=rooms, classes=classes, candidates=candidates, pref_info=pref_info,
+                encoded=encode_instance(classes, candidates, pref_info))
+
+def load_schedule_csv(path, table, data):
+    """
+    Baca jadwal hasil export_schedule_to_csv ke Individual milik `table`.
+    Kelas dicocokkan lewat (Kode MK, Mata Kuliah, Kelas); slot lewat (Hari, Jam Mulai,
+    Jam Selesai) dan ruang lewat nama, memakai `data` ASLI (sebelum apply_changes).
+    Return: (individu, mask bool kelas yang tidak bisa dipetakan / tidak valid lagi).
+    """
+    slot_lookup = {(str(s['Hari']).lower(), str(s['Mulai']), str(s['Selesai'])): s['slot_id'] for s in data['slots']}
+    room_lookup = {r['Ruang']: r['room_id'] for r in data['rooms']}
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = {(row['Kode MK'], row['Mata Kuliah'], row['Kelas']): row for row in csv.DictReader(f)}
+
+    n = table.n_classes
+    slot_ids = np.zeros(n, dtype=np.int32)
+    room_ids = np.zeros(n, dtype=np.int32)
+    dosen_ids = np.array(table.initial_dosen, dtype=np.int32)
+    invalid = np.zeros(n, dtype=bool)
+    valid_rooms = set(table.room_ids.tolist())
+    for i, (kode, nama, parallel) in enumerate(table.class_keys):
+        row = rows.get((kode, nama, str(parallel)))
+        if row is None:
+            invalid[i] = True
+            continue
+        slot = slot_lookup.get((row['Hari'].lower(), row['Jam Mulai'], row['Jam Selesai']))
+        room = room_lookup.get(row['Ruangan'])
+        dosen = table.dosen_index.get(row['Dosen'])
+        slot_ok = slot is not None and slot < table.slot_domain_mask.shape[1] and table.slot_domain_mask[i, slot]
+        room_ok = room in valid_rooms
+        if slot_ok: slot_ids[i] = slot
+        if room_ok: room_ids[i] = room
+        if dosen is not None: dosen_ids[i] = dosen
+        invalid[i] = not (slot_ok and room_ok and dosen is not None)
+
+    ind = Individual(table)
+    ind.slot_ids, ind.room_ids, ind.dosen_ids = slot_ids, room_ids, dosen_ids
+    return ind, invalid
+
+class StabilityPenalty:
+    """
+    Penalti churn: `weight` per kelas tidak terdampak yang slot/ruang/dosennya
+    berbeda dari jadwal awal. Kelas terdampak (exempt) bebas dipindah.
+    """
+    def __init__(self, baseline, exempt, weight):
+        self.slot_ids = baseline.slot_ids.copy()
+        self.room_ids = baseline.room_ids.copy()
+        self.dosen_ids = baseline.dosen_ids.copy()
+        self.exempt = exempt
+        self.weight = weight
+
+    def moved(self, ind):
+        """Mask kelas yang berbeda dari jadwal awal."""
+        return (ind.slot_ids != self.slot_ids) | (ind.room_ids != self.room_ids) | (ind.dosen_ids != self.dosen_ids)
+
+    def cost(self, ind):
+        return self.weight * int((self.moved(ind) & ~self.exempt).sum())
+
+    def _gene_cost(self, i, slot, room, dosen):
+        if self.exempt[i]: return 0.0
+        same = slot == self.slot_ids[i] and room == self.room_ids[i] and dosen == self.dosen_ids[i]
+        return 0.0 if same else self.weight
+
+    def move_delta(self, ind, move):
+        delta = 0.0
+        for i, kwargs in move:
+            s, r, d = int(ind.slot_ids[i]), int(ind.room_ids[i]), int(ind.dosen_ids[i])
+            delta += self._gene_cost(i, kwargs.get('slot', s), kwargs.get('room', r), kwargs.get('dosen', d))
+            delta -= self._gene_cost(i, s, r, d)
+        return delta
+
+class Rescheduler:
+    """
+    Alur reschedule:
+    1. apply_changes -> data baru, jadwal lama dipetakan (load_schedule_csv)
+    2. Kelas terdampak (slot/ruang/dosen tidak valid, dosen diganti) ditempatkan
+       ulang secara greedy: kombinasi dosen/slot/ruang dengan delta terkecil
+    3. Tabu search dengan StabilityPenalty memperbaiki sisa konflik
+    4. Jika masih ada konflik: GA dengan populasi awal dari jadwal hasil langkah 3
+    params memakai kunci GA biasa + 'stability_weight' (default 500) dan
+    'time_budget' untuk fase GA (default 30 detik).
+    """
+    def __init__(self, data, changes, params):
+        self.original = data
+        self.changes = changes
+        # Fallback GA memakai populasi sendiri: tanpa pulau, seeding konstruktif,
+        # maupun decoder ruang (keduanya menempatkan ulang semua kelas). Backend
+        # serial: worker process membangun ulang tabel dari data (tanpa domain terkunci).
+        self.params = dict(params, islands=1, seed_ratio=0.0, room_decoder=False, backend=BACKEND_SERIAL)
+        if self.params.get('time_budget') is None:
+            self.params['time_budget'] = 30
+        self.data = apply_changes(data, changes)
+        self.engine = GeneticAlgorithm(self.data, self.params)
+        self.table = self.engine.table
+        self.rng = self.engine.rng
+
+    def affected_mask(self, baseline, invalid):
+        """Kelas yang harus dipindah karena perubahan."""
+        affected = invalid.copy()
+        table = self.table
+        for i, key in enumerate(table.class_keys):
+            name = self.changes.reassign.get(tuple(map(str, key)))
+            if name is not None:
+                baseline.writable('dosen_ids')[i] = table.dosen_index[name]
+                affected[i] = True
+        return affected
+
+    def _place(self, evaluator, i):
+        """Taruh gen i di kombinasi (dosen, slot, ruang) dengan delta terkecil."""
+        table = self.table
+        ind = evaluator.ind
+        dosen_options = [int(ind.dosen_ids[i])]
+        if table.dosen_names[dosen_options[0]] in self.changes.unavailable_dosen or not table.dosen_known[dosen_options[0]]:
+            dosen_options = [int(d) for d in table.candidates[i]] or dosen_options
+        best, best_delta = None, None
+        for d in dosen_options:
+            for s in table.slot_domain[i]:
+                for r in table.room_domain[i]:
+                    delta, _ = evaluator.delta(i, slot=s, room=r, dosen=d)
+                    if best_delta is None or delta < best_delta:
+                        best, best_delta = (s, r, d), delta
+        s, r, d = best
+        evaluator.commit(i, slot=s, room=r, dosen=d)
+
+    def run(self, schedule_csv):
+        """Return (individu hasil, ringkasan dict)."""
+        start = time.perf_counter()
+        table = self.table
+        baseline, invalid = load_schedule_csv(schedule_csv, table, self.original)
+        affected = self.affected_mask(baseline, invalid)
+
+        # Isi sementara gen tidak valid agar evaluator bisa dibangun
+        current = baseline.copy()
+        for i in np.flatnonzero(invalid):
+            current.slot_ids[i] = self.rng.choice(table.slot_domain[i])
+            current.room_ids[i] = self.rng.choice(table.room_domain[i])
+
+        evaluator = IncrementalEvaluator(self.engine.fitness_calc, current)
+        for i in np.flatnonzero(affected):
+            self._place(evaluator, int(i))
+        evaluator.clear_log()
+
+        # Repair konflik sisa; kelas tidak terdampak boleh pindah tapi berbayar
+        stability = StabilityPenalty(baseline, affected, self.params.get('stability_weight', 500))
+        repair = TabuRepair(
+            self.engine.fitness_calc, stability=stability,
+            max_iters=self.params.get('repair_iters', 2000), time_limit=self.params.get('repair_time'),
+        )
+        result = repair.repair(current, evaluator, rng=self.rng)
+
+        if result.n_conflicts > 0:
+            result = self._evolve(result, affected)
+
+        result.compute_fitness(self.engine.fitness_calc)
+        moved = stability.moved(result)
+        summary = {
+            "affected": int(affected.sum()),
+            "moved_affected": int((moved & affected).sum()),
+            "moved_unaffected": int((moved & ~affected).sum()),
+            "conflicts": result.n_conflicts,
+            "fitness": result.fitness,
+            "seconds": time.perf_counter() - start,
+        }
+        return result, summary
+
+    def _evolve(self, start_ind, affected):
+        """
+        Fallback GA hanya pada lingkungan terdampak: kelas terdampak + kelas yang
+        masih berkonflik. Domain kelas lain dikunci ke nilainya (ClassTable.pinned),
+        sehingga crossover, mutasi, repair & load balancing tidak bisa memindahnya.
+        """
+        engine = self.engine
+        rng = self.rng
+        free = affected.copy()
+        free[IncrementalEvaluator(engine.fitness_calc, start_ind).hard_genes()] = True
+        table = self.table.pinned(start_ind, free)
+        engine.table = table
+
+        genes = np.flatnonzero(free)
+        population = []
+        while len(population) < self.params['pop_size']:
+            ind = start_ind.clone()
+            ind.table = table
+            if population:
+                for i in genes:
+                    if rng.random() < 0.5:
+                        ind.writable('slot_ids')[i] = rng.choice(table.slot_domain[i])
+                        ind.writable('room_ids')[i] = rng.choice(table.room_domain[i])
+            population.append(ind)
+        engine.evaluate_population(population)
+        population.sort(key=lambda x: x.fitness, reverse=True)
+        population[0].compute_fitness(engine.fitness_calc)
+        engine.population = population
+        engine.best_individual = population[0].clone()
+        return engine.run()
+
+def reschedule(data, schedule_csv, changes, params):
+    """Pintasan: Rescheduler(data, changes, params).run(schedule_csv)."""
+    return Rescheduler(data, changes, params).run(schedule_csv)
@@ -0,0 +1,35 @@
+import random
+import numpy as np
+
+# ===============================
+# RNG TERPUSAT (REPRODUCIBLE)
+# ===============================
+# Semua komponen menerima instance RNG eksplisit, tidak memakai state global
+# modul `random`. Akar seluruh stream adalah SeedSequence dari ga_params['seed'];
+# worker paralel mendapat stream turunan (spawn) yang saling independen.
+
+def seed_sequence(seed=None):
+    """SeedSequence akar. seed=None -> entropi OS (lihat .entropy untuk mengulang run)."""
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+def resolve_seed(seed=None):
+    """seed=None -> seed acak 32-bit baru, dicetak agar run bisa diulang (--seed)."""
+    if seed is None:
+        seed = int(np.random.SeedSequence().generate_state(1)[0])
+        print(f">>> Seed acak: {seed} (pakai seed ini untuk mengulang run)")
+    return seed
+
+def to_int_seed(seq):
+    """Seed integer 64-bit dari SeedSequence (untuk random.Random atau antar proses)."""
+    return int(seq.generate_state(1, np.uint64)[0])
+
+def spawn_seeds(seq, n):
+    """n seed integer independen dari seq (deterministik sesuai urutan pemanggilan)."""
+    return [to_int_seed(child) for child in seq.spawn(n)]
+
+def make_rngs(seq):
+    """Pasangan (random.Random, numpy Generator) dari stream independen."""
+    py_seq, np_seq = seq.spawn(2)
+    return random.Random(to_int_seed(py_seq)), np.random.default_rng(np_seq)
@@ -0,0 +1,95 @@
+import numpy as np
+
+# ===============================
+# DECODER RUANG (MODE params['room_decoder'])
+# ===============================
+# Dalam mode decoder, ruang bukan gen bebas: kromosom cukup membawa slot &
+# dosen, lalu ruang dihitung deterministik dari slot. Per hari, kelas diurutkan
+# menurut jam mulai (kelas besar dulu jika mulai bersamaan) lalu diberi ruang
+# dengan interval-graph coloring: ruang best-fit (kapasitas terkecil yang
+# cukup) yang sudah kosong pada jam mulai kelas. Kapasitas ruang terurut
+# sehingga posisi best-fit tiap kelas cukup dicari sekali (bisect).
+# Jika tidak ada ruang cukup yang kosong, dipilih ruang dengan tambahan
+# konflik hard paling sedikit (bentrok ruang vs kelebihan kapasitas).
+# Repair memakai slot_move(): pindah slot selalu disertai ruang kosong best-fit,
+# sehingga ruang tetap mengikuti slot selama perbaikan lokal.
+
+class RoomDecoder:
+    def __init__(self, table, fitness_calc):
+        self.table = table
+        n_slots = fitness_calc.n_slots
+        day_pos = {hari: k for k, hari in enumerate(fitness_calc.day_names)}
+        self.slot_day = np.full(n_slots, -1, dtype=np.int32)
+        self.slot_start = np.zeros(n_slots, dtype=np.int32)
+        self.slot_end = np.zeros(n_slots, dtype=np.int32)
+        for s_id, d in fitness_calc.slot_details.items():
+            self.slot_day[s_id] = day_pos[d['hari']]
+            self.slot_start[s_id] = d['start']
+            self.slot_end[s_id] = d['end']
+
+        # Ruang terurut kapasitas (best-fit: kecil dulu)
+        capacity = fitness_calc.room_capacity[table.room_ids]
+        order = np.argsort(capacity, kind="stable")
+        self._room_order = table.room_ids[order]
+        self.room_order = self._room_order.tolist()
+        self.n_rooms = len(self.room_order)
+        self._neg_need = -table.jumlah_mhs
+        # Posisi ruang pertama yang cukup untuk tiap kelas
+        self.first_fit = np.searchsorted(capacity[order], table.jumlah_mhs, side='left').tolist()
+
+    def decode(self, slot_ids):
+        """Array ruang (int32) untuk jadwal slot_ids."""
+        slot_ids = np.asarray(slot_ids)
+        days = self.slot_day[slot_ids]
+        starts = self.slot_start[slot_ids]
+        order = np.lexsort((self._neg_need, starts, days)).tolist()
+        days, starts, ends = days.tolist(), starts.tolist(), self.slot_end[slot_ids].tolist()
+        first_fit, room_order, n_rooms = self.first_fit, self.room_order, self.n_rooms
+
+        rooms = np.empty(len(slot_ids), dtype=np.int32)
+        current_day = None
+        for i in order:
+            if days[i] != current_day:
+                current_day = days[i]
+                free_at = [0] * n_rooms               # menit selesai terakhir per ruang
+                ends_in = [[] for _ in range(n_rooms)] # jam selesai kelas per ruang (fallback)
+            start, lo = starts[i], first_fit[i]
+
+            pos = lo
+            while pos < n_rooms and free_at[pos] > start:
+                pos += 1
+            if pos == n_rooms:
+                pos = self._least_conflict(start, lo, ends_in)
+
+            if ends[i] > free_at[pos]: free_at[pos] = ends[i]
+            ends_in[pos].append(ends[i])
+            rooms[i] = room_order[pos]
+        return rooms
+
+    def _least_conflict(self, start, lo, ends_in):
+        """Ruang dengan tambahan konflik minimum; seri -> ruang cukup, best-fit."""
+        best_key, best_pos = None, 0
+        for pos in range(self.n_rooms):
+            clashes = sum(1 for end in ends_in[pos] if end > start)
+            too_small = pos < lo
+            key = (clashes + too_small, too_small, -pos if too_small else pos)
+            if best_key is None or key < best_key:
+                best_key, best_pos = key, pos
+        return best_pos
+
+    def slot_move(self, evaluator, i, slot):
+        """
+        Langkah repair 'pindah slot' versi decoder: kelas ikut pindah ke ruang
+        best-fit yang kosong di slot baru (ruang lama dipertahankan jika tidak ada).
+        """
+        rooms = self._room_order[self.first_fit[i]:]
+        # Okupansi kelas i sendiri (jika tetap di ruangnya) tidak dihitung
+        free = evaluator.free_rooms(rooms, slot, exclude=i)
+        if free.any():
+            return {'slot': slot, 'room': int(rooms[free.argmax()])}
+        return {'slot': slot}
+
+    def apply(self, individual):
+        """Timpa gen ruang individu dengan hasil decode (array baru, aman COW)."""
+        individual.room_ids = self.decode(individual.slot_ids)
+        return individual
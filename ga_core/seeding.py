@@ -0,0 +1,162 @@
+import random
+import numpy as np
+from ga_core.individual import Individual
+
+# ===============================
+# SEEDING KONSTRUKTIF POPULASI AWAL
+# ===============================
+# Daripada menaruh kelas di slot & ruang acak, sebagian populasi dibangun
+# dengan heuristik graph coloring: "warna" = slot waktu, tetangga = kelas
+# dengan dosen (known) yang sama. Bentrok ruang bukan sisi graph: ruang dipilih
+# best-fit (kapasitas terkecil yang cukup) di antara ruang yang masih kosong
+# pada slot tersebut, dan slot tanpa ruang kosong dianggap tidak feasible.
+
+METHOD_DSATUR = "dsatur"
+METHOD_GREEDY = "greedy"
+METHOD_MIXED = "mixed"
+
+class ConstructiveSeeder:
+    def __init__(self, table, fitness_calc):
+        self.table = table
+        self.overlap = fitness_calc.slot_overlap.astype(np.int32)
+        n_slots, n_rooms = fitness_calc.n_slots, fitness_calc.n_rooms
+
+        # Kapasitas ruang & kecocokan panjang slot (SKS) per kelas
+        self.capacity = fitness_calc.room_capacity
+        self.room_order = np.argsort(self.capacity, kind="stable")  # best-fit: kecil dulu
+        # Domain slot feasible per kelas (indeks SKS dari ClassTable) sebagai mask
+        self.slot_domain = np.zeros((table.n_classes, n_slots), dtype=bool)
+        self.slot_domain[:, :table.slot_domain_mask.shape[1]] = table.slot_domain_mask
+
+        # Graph konflik dosen: tetangga = kelas lain dengan dosen (known) yang sama,
+        # disimpan sebagai daftar anggota per dosen (bukan matriks kelas x kelas)
+        dosen = table.initial_dosen
+        known = table.dosen_known[dosen]
+        self.members = [[] for _ in range(table.n_dosen)]
+        for i in np.flatnonzero(known):
+            self.members[dosen[i]].append(int(i))
+        size = np.array([len(m) for m in self.members], dtype=np.int64)
+        self.degree = np.where(known, size[dosen] - 1, 0)
+
+        self.n_slots, self.n_rooms = n_slots, n_rooms
+        self.needs = np.unique(table.jumlah_mhs)
+
+    # ---------- STATE PENEMPATAN ----------
+    def _new_state(self, dosen_ids):
+        return {
+            "room_busy": np.zeros((self.n_rooms, self.n_slots), dtype=np.int32),
+            "dosen_busy": np.zeros((self.table.n_dosen, self.n_slots), dtype=np.int32),
+            "dosen_ids": dosen_ids,
+        }
+
+    def _room_available(self, state):
+        """dict kebutuhan kursi -> array bool [slot]: masih ada ruang kosong yang cukup."""
+        free = state["room_busy"] == 0
+        return {need: (free & (self.capacity >= need)[:, None]).any(axis=0) for need in self.needs}
+
+    def _feasible_slots(self, i, state, room_avail):
+        d = state["dosen_ids"][i]
+        feasible = self.slot_domain[i] & room_avail[self.table.jumlah_mhs[i]]
+        if self.table.dosen_known[d]:
+            feasible &= state["dosen_busy"][d] == 0
+        return feasible
+
+    def _place(self, i, s, state, slot_ids, room_ids, rng):
+        """Taruh kelas i di slot s + ruang best-fit yang kosong (atau paling sedikit bentrok)."""
+        need = self.table.jumlah_mhs[i]
+        busy = state["room_busy"][:, s]
+        candidates = [r for r in self.room_order if self.capacity[r] >= need and busy[r] == 0]
+        if candidates:
+            best_cap = self.capacity[candidates[0]]
+            ties = [r for r in candidates if self.capacity[r] == best_cap]
+            r = rng.choice(ties)
+        else:
+            r = int(np.argmin(busy))
+        slot_ids[i], room_ids[i] = s, r
+        state["room_busy"][r] += self.overlap[s]
+        d = state["dosen_ids"][i]
+        if self.table.dosen_known[d]:
+            state["dosen_busy"][d] += self.overlap[s]
+
+    def _pick_slot(self, i, feasible, rng):
+        options = np.flatnonzero(feasible)
+        if len(options) == 0:
+            # Tidak ada slot bebas: biarkan repair (LocalSearch) yang menyelesaikan
+            options = np.flatnonzero(self.slot_domain[i])
+        return int(rng.choice(options))
+
+    # ---------- HEURISTIK ----------
+    def dsatur(self, rng=random):
+        """
+        DSatur (Brelaz): tiap langkah tempatkan kelas dengan saturasi tertinggi,
+        yaitu jumlah slot berbeda yang sudah dipakai tetangganya. Seri -> derajat
+        ke tetangga yang belum ditempatkan, lalu kelas dengan slot feasible paling
+        sedikit, lalu acak (diversitas antar individu).
+        """
+        table = self.table
+        n = table.n_classes
+        dosen_ids = table.initial_dosen
+        state = self._new_state(dosen_ids)
+        slot_ids = np.zeros(n, dtype=np.int32)
+        room_ids = np.zeros(n, dtype=np.int32)
+
+        known = table.dosen_known[dosen_ids]
+        neighbour_slots = np.zeros((n, self.n_slots), dtype=bool)
+        saturation = np.zeros(n, dtype=np.int64)
+        free_degree = self.degree.copy()
+        domain_size = self.slot_domain.sum(axis=1)
+        jitter = np.array([rng.random() for _ in range(n)])
+        unplaced = np.arange(n)
+        while len(unplaced):
+            order = np.lexsort((jitter[unplaced], domain_size[unplaced], -free_degree[unplaced], -saturation[unplaced]))
+            pick = order[0]
+            best = int(unplaced[pick])
+            unplaced = np.delete(unplaced, pick)
+
+            feasible = self._feasible_slots(best, state, self._room_available(state))
+            s = self._pick_slot(best, feasible, rng)
+            self._place(best, s, state, slot_ids, room_ids, rng)
+
+            # Update saturasi & derajat bebas tetangga (dosen yang sama)
+            if known[best]:
+                for j in self.members[dosen_ids[best]]:
+                    if j == best: continue
+                    free_degree[j] -= 1
+                    if not neighbour_slots[j, s]:
+                        neighbour_slots[j, s] = True
+                        saturation[j] += 1
+
+        return self._to_individual(slot_ids, room_ids, dosen_ids)
+
+    def greedy(self, rng=random):
+        """Largest-degree-first: urut derajat (diacak sedikit), taruh di slot feasible acak."""
+        n = self.table.n_classes
+        dosen_ids = self.table.initial_dosen
+        state = self._new_state(dosen_ids)
+        slot_ids = np.zeros(n, dtype=np.int32)
+        room_ids = np.zeros(n, dtype=np.int32)
+
+        order = sorted(range(n), key=lambda i: (-self.degree[i] - rng.random() * 2, -self.table.sks[i]))
+        for i in order:
+            room_avail = self._room_available(state)
+            feasible = self._feasible_slots(i, state, room_avail)
+            self._place(i, self._pick_slot(i, feasible, rng), state, slot_ids, room_ids, rng)
+
+        return self._to_individual(slot_ids, room_ids, dosen_ids)
+
+    def _to_individual(self, slot_ids, room_ids, dosen_ids):
+        ind = Individual(self.table)
+        ind.slot_ids, ind.room_ids, ind.dosen_ids = slot_ids, room_ids, dosen_ids
+        return ind
+
+    def build(self, method, rng=random):
+        if method == METHOD_DSATUR:
+            return self.dsatur(rng)
+        if method == METHOD_GREEDY:
+            return self.greedy(rng)
+        raise ValueError(f"Metode seeding tidak dikenal: {method}")
+
+def seeded_individuals(seeder, count, method=METHOD_MIXED, rng=random):
+    """Bangun `count` individu; mode mixed bergantian DSatur & greedy."""
+    methods = [METHOD_DSATUR, METHOD_GREEDY] if method == METHOD_MIXED else [method]
+    return [seeder.build(methods[k % len(methods)], rng) for k in range(count)]
@@ -0,0 +1,133 @@
+import csv
+import json
+import time
+from collections import Counter
+
+import numpy as np
+
+# ===============================
+# TIMER PER FASE
+# ===============================
+PHASES = (
+    "selection", "crossover", "mutation", "room_decode", "repair", "balancing",
+    "assignment", "fitness", "elitism",
+)
+
+class PhaseTimer:
+    """Akumulasi waktu per fase dengan lap(); panggil start() sebelum fase pertama."""
+    def __init__(self):
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self.counts = Counter()
+        self._last = time.perf_counter()
+
+    def start(self):
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        now = time.perf_counter()
+        self.totals[phase] = self.totals.get(phase, 0.0) + (now - self._last)
+        self._last = now
+
+    def count(self, name, n=1):
+        self.counts[name] += n
+
+    def merge(self, totals, counts):
+        for phase, value in totals.items():
+            self.totals[phase] = self.totals.get(phase, 0.0) + value
+        self.counts.update(counts)
+
+class _NullTimer:
+    """Timer kosong: dipakai saat telemetry mati (biaya ~ satu pemanggilan method)."""
+    totals = {}
+    counts = {}
+
+    def start(self): pass
+    def lap(self, phase): pass
+    def count(self, name, n=1): pass
+    def merge(self, totals, counts): pass
+
+NULL_TIMER = _NullTimer()
+
+# ===============================
+# OBSERVER
+# ===============================
+class GenerationObserver:
+    """Basis observer: override method yang dibutuhkan saja."""
+    def on_run_start(self, engine): pass
+    def on_generation(self, record): pass
+    def on_run_end(self, engine): pass
+    def close(self): pass
+
+class JsonLinesRecorder(GenerationObserver):
+    """Tulis satu baris JSON per generasi (di-flush agar bisa di-tail saat run)."""
+    def __init__(self, path):
+        self._file = open(path, "w")
+
+    def on_generation(self, record):
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+class CsvRecorder(GenerationObserver):
+    """Tulis satu baris CSV per generasi; header diambil dari record pertama."""
+    def __init__(self, path):
+        self._file = open(path, "w", newline="")
+        self._writer = None
+
+    def on_generation(self, record):
+        flat = {k: (json.dumps(v) if isinstance(v, dict) else v) for k, v in record.items()}
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(flat))
+            self._writer.writeheader()
+        self._writer.writerow(flat)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+def recorder_for_path(path):
+    """Pilih recorder dari ekstensi file (.csv -> CSV, selain itu JSON-lines)."""
+    if path.lower().endswith(".csv"):
+        return CsvRecorder(path)
+    return JsonLinesRecorder(path)
+
+# ===============================
+# STATISTIK GENERASI
+# ===============================
+def population_diversity(population):
+    """Rata-rata fraksi gen (slot/ruang/dosen) yang berbeda dari individu terbaik."""
+    best = population[0]
+    if len(population) < 2: return 0.0
+    diffs = [
+        np.mean((ind.slot_ids != best.slot_ids) | (ind.room_ids != best.room_ids) | (ind.dosen_ids != best.dosen_ids))
+        for ind in population[1:]
+    ]
+    return float(np.mean(diffs))
+
+def generation_record(generation, population, timer, wall_time):
+    """Ringkasan satu generasi untuk observer & history."""
+    fitness = np.array([ind.fitness for ind in population])
+    conflicts = np.array([ind.n_conflicts for ind in population])
+    best = population[0]
+    by_kind = Counter(record.kind for record in best.conflicts) if best.conflicts is not None else {}
+
+    evaluations = int(timer.counts.get("evaluations", 0))
+    deltas = int(timer.counts.get("delta_evaluations", 0))
+    record = {
+        "generation": generation,
+        "wall_time_s": wall_time,
+        **{f"t_{phase}_s": timer.totals.get(phase, 0.0) for phase in PHASES},
+        "evaluations": evaluations,
+        "delta_evaluations": deltas,
+        "evals_per_s": (evaluations + deltas) / wall_time if wall_time > 0 else 0.0,
+        "best_fitness": float(fitness.max()),
+        "mean_fitness": float(fitness.mean()),
+        "worst_fitness": float(fitness.min()),
+        "diversity": population_diversity(population),
+        "best_conflicts": int(best.n_conflicts),
+        "mean_conflicts": float(conflicts.mean()),
+        "best_conflicts_by_kind": dict(by_kind),
+    }
+    return record
@@ -0,0 +1,19 @@
+import pytest
+from ga_core.config import load_config
+from ga_core.data_loader import load_all_data
+
+# ===============================
+# FIXTURE BERSAMA
+# ===============================
+# Data dimuat tanpa cache agar test tidak menulis ke data/.cache.
+SEED = 2025
+EXTRA_CONSTRAINTS = ['cohort_clash', 'split_session_day']
+
+@pytest.fixture(scope="session")
+def data():
+    return load_all_data(seed=SEED, use_cache=False)
+
+def small_params(**overrides):
+    """Params GA kecil (cepat) untuk test; overrides menimpa default."""
+    params, _ = load_config(None, dict(dict(seed=SEED, pop_size=10, max_generations=4), **overrides))
+    return params
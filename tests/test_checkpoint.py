@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from ga_core import checkpoint
+from ga_core.ga_engine import GeneticAlgorithm
+from tests.conftest import small_params, SEED
+
+# ===============================
+# RESUME CHECKPOINT
+# ===============================
+# Run yang dihentikan lalu dilanjutkan dari checkpoint harus identik bit per
+# bit dengan run yang berjalan tanpa henti (populasi, best, history, RNG).
+
+@pytest.mark.parametrize("stagnation_action", ["mutation", "restart"])
+def test_resume_is_bit_identical(data, tmp_path, stagnation_action):
+    params = small_params(max_generations=6, stagnation_window=1, stagnation_action=stagnation_action)
+    straight = GeneticAlgorithm(data, params)
+    ref_best = straight.run()
+
+    path = str(tmp_path / "ga_checkpoint.npz")
+    first = GeneticAlgorithm(data, dict(params, max_generations=3, checkpoint_path=path))
+    first.run()
+    resumed = GeneticAlgorithm.resume(path, data=data, params=dict(max_generations=6, checkpoint_path=None))
+    best = resumed.run()
+
+    assert resumed.generation == straight.generation
+    for attr in best.GENE_ARRAYS:
+        assert np.array_equal(getattr(best, attr), getattr(ref_best, attr))
+    assert best.fitness == ref_best.fitness
+    for ind, ref in zip(resumed.population, straight.population):
+        for attr in ind.GENE_ARRAYS:
+            assert np.array_equal(getattr(ind, attr), getattr(ref, attr))
+    assert resumed.history == straight.history
+    assert resumed.rng.getstate() == straight.rng.getstate()
+    assert resumed.np_rng.bit_generator.state == straight.np_rng.bit_generator.state
+
+
+def test_checkpoint_stores_loader_settings(data, tmp_path):
+    path = str(tmp_path / "ga_checkpoint.npz")
+    ga = GeneticAlgorithm(data, small_params(max_generations=1))
+    ga.run()
+    ga.save_checkpoint(path)
+    meta, _ = checkpoint.read_checkpoint(path)
+    settings = checkpoint.loader_settings(meta)
+    assert settings == {key: data['loader'][key] for key in ('seed', 'semester', 'data_dir', 'assignment')}
+    assert settings['seed'] == SEED
@@ -0,0 +1,41 @@
+import random
+import numpy as np
+import ga_core.operators as ops
+from ga_core.class_table import ClassTable
+from ga_core.individual import Individual
+
+# ===============================
+# DOMAIN FEASIBLE PER KELAS
+# ===============================
+# Domain slot = slot dengan panjang (SKS) sama, domain ruang = ruang dengan
+# kapasitas cukup; jatuh ke semua slot/ruang hanya jika tidak ada yang cocok.
+
+def test_domains_contain_only_feasible_values(data):
+    table = ClassTable.from_data(data)
+    slot_sks = {s['slot_id']: s['sks_val'] for s in data['slots']}
+    capacity = {r['room_id']: r['Kapasitas'] for r in data['rooms']}
+    for i, c in enumerate(data['classes']):
+        slots, rooms = table.slot_domain[i], table.room_domain[i]
+        assert len(slots) and len(rooms)
+        if c['sks'] in slot_sks.values():
+            assert all(slot_sks[int(s)] == c['sks'] for s in slots)
+            assert len(slots) == sum(v == c['sks'] for v in slot_sks.values())
+        if max(capacity.values()) >= c['jumlah_mhs']:
+            assert all(capacity[int(r)] >= c['jumlah_mhs'] for r in rooms)
+            assert len(rooms) == sum(v >= c['jumlah_mhs'] for v in capacity.values())
+        # Mask [kelas x slot] identik dengan list domain
+        assert np.array_equal(np.flatnonzero(table.slot_domain_mask[i]), np.sort(slots))
+
+
+def test_random_and_mutation_stay_in_domain(data):
+    table = ClassTable.from_data(data)
+    rng = random.Random(3)
+    for _ in range(5):
+        ind = Individual(table)
+        ind.initialize_random(rng)
+        for _ in range(3):
+            ops.mutation(ind, mutation_rate=0.5, rng=rng)
+            for i in range(len(ind)):
+                assert table.slot_domain_mask[i, ind.slot_ids[i]]
+                assert ind.room_ids[i] in table.room_domain[i]
+                assert ind.dosen_ids[i] in table.candidates[i]
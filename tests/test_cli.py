@@ -0,0 +1,59 @@
+import csv
+import json
+from ga_core import cli
+from ga_core.config import DATA_KEYS, DEFAULT_PARAMS, load_config
+
+# ===============================
+# CONFIG & CLI
+# ===============================
+
+def test_load_config_defaults():
+    params, data_settings = load_config()
+    assert set(data_settings) == set(DATA_KEYS)
+    assert not set(DATA_KEYS) & set(params)
+    assert params == {k: v for k, v in DEFAULT_PARAMS.items() if k not in DATA_KEYS}
+
+
+def test_load_config_file_and_overrides(tmp_path):
+    path = tmp_path / "run.json"
+    path.write_text(json.dumps({'pop_size': 12, 'semester': 'Genap', 'backend': 'thread'}), encoding="utf-8")
+    params, data_settings = load_config(str(path), {'pop_size': 7, 'max_generations': None})
+    assert params['pop_size'] == 7                                    # override > file
+    assert params['backend'] == 'thread'                              # file > default
+    assert params['max_generations'] == DEFAULT_PARAMS['max_generations']  # None diabaikan
+    assert data_settings['semester'] == 'Genap'
+
+
+def test_parse_solve_args():
+    args = cli.build_parser().parse_args([
+        "--seed", "7", "--semester", "Ganjil", "solve", "--pop-size", "6",
+        "--loader-backend", "csv", "--seed-ratio", "0.2", "--out", "x.csv",
+    ])
+    assert args.func is cli.cmd_solve
+    assert (args.seed, args.pop_size, args.seed_ratio) == (7, 6, 0.2)
+    # Backend loader tidak bertabrakan dengan params['backend']
+    assert args.loader_backend == "csv" and not hasattr(args, "backend")
+    params, settings = cli._config(args, pop_size=args.pop_size)
+    assert params['seed'] == 7 and params['pop_size'] == 6
+    assert params['backend'] == DEFAULT_PARAMS['backend']
+    assert settings['semester'] == "Ganjil" and settings['use_cache']
+
+
+def test_parse_reschedule_args():
+    args = cli.build_parser().parse_args([
+        "reschedule", "--schedule", "j.csv", "--block-slot", "Senin,07:00,08:40",
+        "--block-slot", "3", "--reassign", "IF101,Algoritma, Struktur Data,A=Budi",
+    ])
+    assert args.block_slot == [("Senin", "07:00", "08:40"), 3]
+    assert args.reassign == [(("IF101", "Algoritma, Struktur Data", "A"), "Budi")]
+
+
+def test_solve_smoke(tmp_path):
+    out = tmp_path / "jadwal.csv"
+    code = cli.main([
+        "solve", "--pop-size", "4", "--max-generations", "2",
+        "--loader-backend", "csv", "--out", str(out),
+    ])
+    assert code in (0, 1)
+    with open(out, encoding="utf-8") as f:
+        assert len(list(csv.reader(f))) > 1
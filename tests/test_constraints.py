@@ -0,0 +1,93 @@
+import random
+import numpy as np
+import pytest
+from ga_core.constraints import build_constraints
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.incremental import IncrementalEvaluator
+from ga_core.individual import Individual
+from tests.conftest import small_params
+
+# ===============================
+# KERNEL CONSTRAINT TAMBAHAN
+# ===============================
+# delta/apply/count/gene_counts tiap constraint harus sama dengan hitung
+# ulang penuh (batch & records) setelah setiap langkah.
+
+def _unavailable_spec(table, data):
+    """Blok beberapa dosen di slot awalnya sendiri + satu jendela hari agar ada pelanggaran."""
+    names = list(dict.fromkeys(c['dosen'] for c in data['classes'] if "Unknown" not in c['dosen']))[:4]
+    slot = data['slots'][0]
+    slots = {name: [int(data['slots'][k]['slot_id'])] for k, name in enumerate(names)}
+    slots[names[0]].append(f"{slot['Hari']},{slot['Mulai']},{slot['Selesai']}")
+    return {'name': 'dosen_unavailable', 'slots': slots}
+
+SPECS = {
+    "cohort_clash": lambda table, data: 'cohort_clash',
+    "cohort_clash_soft": lambda table, data: {'name': 'cohort_clash', 'weight': 3.0},
+    "split_session_day": lambda table, data: 'split_session_day',
+    "dosen_unavailable": _unavailable_spec,
+    "dosen_unavailable_soft": lambda table, data: dict(_unavailable_spec(table, data), weight=2.0),
+}
+
+@pytest.fixture(params=sorted(SPECS))
+def setup(request, data):
+    ga = GeneticAlgorithm(data, small_params())
+    spec = SPECS[request.param](ga.table, data)
+    (constraint,) = build_constraints([spec], ga.table, ga.fitness_calc)
+    return ga, constraint
+
+
+def _full_count(constraint, ind):
+    return int(constraint.batch(ind.slot_ids[None, :], ind.room_ids[None, :], ind.dosen_ids[None, :])[0])
+
+
+def _check_state(constraint, state, ind):
+    count = _full_count(constraint, ind)
+    records = constraint.records(ind.slot_ids, ind.room_ids, ind.dosen_ids)
+    assert constraint.count(state, ind) == count == len(records)
+    per_gene = np.zeros(len(ind), dtype=np.int64)
+    for record in records:
+        for i in record.genes:
+            per_gene[i] += 1
+    assert np.array_equal(constraint.gene_counts(state, ind), per_gene)
+
+
+def test_kernels_match_full_recount(setup):
+    ga, constraint = setup
+    table = ga.table
+    rng = random.Random(3)
+    ind = Individual(table)
+    ind.initialize_random(rng)
+    ind.dosen_ids = ind.dosen_ids.copy()
+    state = constraint.init_state(ind)
+    _check_state(constraint, state, ind)
+    violations = 0
+    for _ in range(300):
+        i = rng.randrange(len(ind))
+        s, r, d = int(ind.slot_ids[i]), int(ind.room_ids[i]), int(ind.dosen_ids[i])
+        s2 = int(rng.choice(table.slot_domain[i]))
+        d2 = int(rng.choice(table.candidates[i])) if rng.random() < 0.5 else d
+        before = _full_count(constraint, ind)
+        change = constraint.delta(state, i, s, r, d, s2, r, d2)
+        constraint.apply(state, i, s, r, d, s2, r, d2)
+        ind.slot_ids[i], ind.dosen_ids[i] = s2, d2
+        assert _full_count(constraint, ind) - before == change
+        _check_state(constraint, state, ind)
+        violations += before
+    assert violations > 0
+
+
+def test_evaluator_with_constraint_matches_rescore(setup):
+    ga, constraint = setup
+    ga.fitness_calc.constraints = (constraint,)
+    table = ga.table
+    rng = random.Random(9)
+    ind = Individual(table)
+    ind.initialize_random(rng)
+    evaluator = IncrementalEvaluator(ga.fitness_calc, ind)
+    for _ in range(100):
+        i = rng.randrange(len(ind))
+        evaluator.commit(i, slot=rng.choice(table.slot_domain[i]), dosen=rng.choice(table.candidates[i]))
+        score, conflicts = ga.fitness_calc.calculate(ind)
+        assert evaluator.fitness == pytest.approx(score, rel=1e-12)
+        assert evaluator.hard_count == len(conflicts)
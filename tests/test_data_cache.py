@@ -0,0 +1,52 @@
+import os
+import shutil
+from ga_core.data_loader import load_all_data, DATA_FILES, BACKEND_CSV
+from tests.test_data_loader import _same_encoded
+
+# ===============================
+# CACHE DATA PROBLEM
+# ===============================
+# Salinan folder data di tmp_path, sehingga data/.cache tidak tersentuh.
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+
+def _load(data_dir, **kwargs):
+    return load_all_data(seed=11, data_dir=str(data_dir), backend=BACKEND_CSV, **kwargs)
+
+def _cache_files(data_dir):
+    cache_dir = data_dir / ".cache"
+    return sorted(os.listdir(cache_dir)) if cache_dir.exists() else []
+
+
+def test_cache_hit_equals_fresh_load(tmp_path, capsys):
+    data_dir = tmp_path / "data"
+    shutil.copytree(DATA_DIR, data_dir, ignore=shutil.ignore_patterns(".cache"))
+    fresh = _load(data_dir, use_cache=False)
+    assert _cache_files(data_dir) == []
+    _load(data_dir)                         # miss -> tulis cache
+    assert len(_cache_files(data_dir)) == 1
+    capsys.readouterr()
+    cached = _load(data_dir)                # hit
+    assert "(cache " in capsys.readouterr().out
+    _same_encoded(fresh.pop('encoded'), cached.pop('encoded'))
+    assert fresh == cached
+
+
+def test_cache_invalidated_when_csv_changes(tmp_path, capsys):
+    data_dir = tmp_path / "data"
+    shutil.copytree(DATA_DIR, data_dir, ignore=shutil.ignore_patterns(".cache"))
+    before = _load(data_dir)
+    rooms_csv = data_dir / DATA_FILES["rooms"]
+    with open(rooms_csv, "a", encoding="utf-8") as f:
+        f.write("Z9.9,120\n")
+    capsys.readouterr()
+    after = _load(data_dir)
+    assert "(cache " not in capsys.readouterr().out
+    assert len(_cache_files(data_dir)) == 2
+    assert len(after['rooms']) == len(before['rooms']) + 1
+    assert after['rooms'][-1]['Ruang'] == "Z9.9"
+    # Entry baru dipakai pada load berikutnya, tetap sama dengan load segar
+    cached = _load(data_dir)
+    fresh = _load(data_dir, use_cache=False)
+    _same_encoded(fresh.pop('encoded'), cached.pop('encoded'))
+    assert fresh == cached
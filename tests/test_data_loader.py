@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from ga_core.class_table import ClassTable
+from ga_core.data_loader import (
+    load_all_data, encode_instance, BACKEND_CSV, BACKEND_PANDAS, ASSIGN_GREEDY, ASSIGN_FLOW,
+)
+
+# ===============================
+# PARITAS BACKEND LOADER
+# ===============================
+# Backend csv (stdlib) harus menghasilkan data problem yang sama persis
+# dengan backend pandas, termasuk instance ber-kode integer.
+
+def _same_encoded(a, b):
+    assert a.keys() == b.keys()
+    for key in a:
+        if key == 'candidates':
+            assert len(a[key]) == len(b[key])
+            assert all(np.array_equal(x, y) for x, y in zip(a[key], b[key]))
+        else:
+            assert np.array_equal(np.asarray(a[key]), np.asarray(b[key])), key
+
+
+@pytest.mark.parametrize("semester", ["Ganjil", "Genap"])
+@pytest.mark.parametrize("assignment", [ASSIGN_GREEDY, ASSIGN_FLOW])
+def test_csv_matches_pandas(semester, assignment):
+    pytest.importorskip("pandas")
+    kwargs = dict(seed=3, use_cache=False, semester=semester, assignment=assignment)
+    a = load_all_data(backend=BACKEND_PANDAS, **kwargs)
+    b = load_all_data(backend=BACKEND_CSV, **kwargs)
+    _same_encoded(a.pop('encoded'), b.pop('encoded'))
+    assert a == b
+
+
+def test_encoded_instance_matches_rebuild(data):
+    """Array ber-kode dari loader = hasil encode ulang dari data mentah."""
+    fresh = encode_instance(data['classes'], data['candidates'], data['pref_info'])
+    _same_encoded(data['encoded'], fresh)
+    table = ClassTable.from_data(data)
+    for i, c in enumerate(data['classes']):
+        assert table.dosen_names[table.initial_dosen[i]] == c['dosen']
@@ -0,0 +1,106 @@
+import random
+import numpy as np
+import pytest
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.incremental import IncrementalEvaluator
+from tests.conftest import small_params, EXTRA_CONSTRAINTS
+
+# ===============================
+# SKALAR = BATCH = INKREMENTAL
+# ===============================
+# Ketiga jalur evaluasi fitness harus memberi angka yang sama persis
+# (hingga pembulatan float) untuk individu yang sama.
+
+@pytest.fixture(params=[[], EXTRA_CONSTRAINTS], ids=["default", "constraints"])
+def engine(request, data):
+    ga = GeneticAlgorithm(data, small_params(pop_size=12, constraints=request.param))
+    ga.initialize_population()
+    return ga
+
+
+def test_batch_matches_scalar(engine):
+    population = engine.population
+    fitness, penalty, hard = engine.fitness_calc.calculate_batch(population)
+    for ind, fit, n_hard in zip(population, fitness, hard):
+        score, conflicts = engine.fitness_calc.calculate(ind)
+        assert fit == pytest.approx(score, rel=1e-12)
+        assert n_hard == len(conflicts)
+
+
+def test_incremental_matches_scalar(engine):
+    for ind in engine.population:
+        evaluator = IncrementalEvaluator(engine.fitness_calc, ind)
+        score, conflicts = engine.fitness_calc.calculate(ind)
+        assert evaluator.fitness == pytest.approx(score, rel=1e-12)
+        assert evaluator.hard_count == len(conflicts)
+
+
+def test_incremental_moves_match_rescore(engine):
+    rng = random.Random(7)
+    table = engine.table
+    ind = engine.population[-1].copy()
+    evaluator = IncrementalEvaluator(engine.fitness_calc, ind)
+    for _ in range(200):
+        i = rng.randrange(len(ind))
+        move = rng.choice([
+            {'slot': rng.choice(table.slot_domain[i])},
+            {'room': rng.choice(table.room_domain[i])},
+            {'dosen': rng.choice(table.candidates[i])},
+        ])
+        before = evaluator.penalty
+        d_penalty, d_hard = evaluator.delta(i, **move)
+        evaluator.commit(i, **move)
+        assert evaluator.penalty - before == pytest.approx(d_penalty, abs=1e-9)
+        score, conflicts = engine.fitness_calc.calculate(ind)
+        assert evaluator.fitness == pytest.approx(score, rel=1e-12)
+        assert evaluator.hard_count == len(conflicts)
+
+
+def test_rollback_restores_state(engine):
+    rng = random.Random(11)
+    ind = engine.population[0].copy()
+    original = [getattr(ind, attr).copy() for attr in ind.GENE_ARRAYS]
+    evaluator = IncrementalEvaluator(engine.fitness_calc, ind)
+    penalty, hard = evaluator.penalty, evaluator.hard_count
+    mark = evaluator.mark()
+    for _ in range(50):
+        i = rng.randrange(len(ind))
+        evaluator.commit(i, slot=rng.choice(engine.table.slot_domain[i]))
+    evaluator.rollback(mark)
+    assert evaluator.penalty == pytest.approx(penalty, abs=1e-9)
+    assert evaluator.hard_count == hard
+    for attr, arr in zip(ind.GENE_ARRAYS, original):
+        assert np.array_equal(getattr(ind, attr), arr)
+
+
+def _assert_same_state(evaluator, fresh):
+    """State inkremental identik dengan evaluator yang dibangun ulang dari nol."""
+    for attr in ('room_load', 'dosen_load', 'workload', 'taught'):
+        assert np.array_equal(getattr(evaluator, attr), getattr(fresh, attr)), attr
+    assert evaluator.hard_count == fresh.hard_count
+    assert evaluator.mean_load == pytest.approx(fresh.mean_load, abs=1e-9)
+    for attr in ('prio_penalty', 'extra_soft', 'fairness_penalty', 'penalty'):
+        assert getattr(evaluator, attr) == pytest.approx(getattr(fresh, attr), abs=1e-9), attr
+    for (_, state, *_), (_, fresh_state, *_) in zip(evaluator._extra, fresh._extra):
+        assert state is None and fresh_state is None or np.array_equal(state, fresh_state)
+
+
+def test_commit_and_rollback_match_fresh_evaluator(engine):
+    rng = random.Random(13)
+    table = engine.table
+    ind = engine.population[1].copy()
+    evaluator = IncrementalEvaluator(engine.fitness_calc, ind)
+    for step in range(120):
+        if step == 60:
+            mark = evaluator.mark()
+            _assert_same_state(evaluator, IncrementalEvaluator(engine.fitness_calc, ind.copy()))
+        i = rng.randrange(len(ind))
+        evaluator.commit(
+            i, slot=rng.choice(table.slot_domain[i]), room=rng.choice(table.room_domain[i]),
+            dosen=rng.choice(table.candidates[i]),
+        )
+    _assert_same_state(evaluator, IncrementalEvaluator(engine.fitness_calc, ind.copy()))
+    evaluator.rollback(mark)
+    _assert_same_state(evaluator, IncrementalEvaluator(engine.fitness_calc, ind.copy()))
+    evaluator.rollback()
+    _assert_same_state(evaluator, IncrementalEvaluator(engine.fitness_calc, engine.population[1].copy()))
@@ -0,0 +1,78 @@
+import pytest
+from ga_core.ga_engine import GeneticAlgorithm, STAGNATION_MUTATION, STAGNATION_RESTART
+from ga_core.config import load_config
+from tests.conftest import small_params, SEED
+
+# ===============================
+# KRITERIA BERHENTI & STAGNASI
+# ===============================
+
+def _run(data, **overrides):
+    ga = GeneticAlgorithm(data, small_params(**overrides))
+    best = ga.run()
+    return ga, best
+
+
+def test_stop_max_generations(data):
+    ga, _ = _run(data, max_generations=3)
+    assert ga.stop_reason == "max_generations"
+    assert ga.generation == 3
+    assert len(ga.history) == 3
+
+
+def test_stop_target_conflicts(data):
+    ga, best = _run(data, max_generations=50, target_conflicts=10_000)
+    assert ga.stop_reason == "target_conflicts"
+    assert ga.generation == 0
+    assert best.n_conflicts <= 10_000
+
+
+def test_stop_time_budget(data):
+    ga = GeneticAlgorithm(data, dict(small_params(), max_generations=None, time_budget=0.3))
+    ga.run()
+    assert ga.stop_reason == "time_budget"
+    assert ga.generation >= 1
+
+
+def test_stop_requested(data):
+    ga = GeneticAlgorithm(data, small_params(max_generations=50))
+    ga.request_stop()
+    ga.run()
+    assert ga.stop_reason == "stop_requested"
+    assert ga.generation == 0
+
+
+def test_run_needs_a_limit(data):
+    ga = GeneticAlgorithm(data, dict(small_params(), max_generations=None, time_budget=None))
+    with pytest.raises(ValueError):
+        ga.run()
+
+
+def test_unknown_stagnation_action(data):
+    with pytest.raises(ValueError):
+        GeneticAlgorithm(data, small_params(stagnation_action="panic"))
+
+
+def test_stagnation_raises_mutation_rate(data):
+    ga, _ = _run(data, max_generations=8, stagnation_window=1, stagnation_action=STAGNATION_MUTATION)
+    rates = [h['mutation_rate'] for h in ga.history]
+    assert ga.base_mutation_rate < max(rates) <= ga.params.get('max_mutation_rate', 0.5)
+    assert ga.restarts == 0
+
+
+def test_stagnation_restart(data):
+    ga, _ = _run(data, max_generations=8, stagnation_window=1, stagnation_action=STAGNATION_RESTART)
+    assert ga.restarts > 0
+    assert len(ga.population) == ga.params['pop_size']
+    # Elite tidak pernah hilang: best tidak pernah turun antar generasi
+    fitness = [h['best_fitness'] for h in ga.history]
+    assert fitness == sorted(fitness)
+
+
+def test_no_stagnation_by_default(data):
+    params, _ = load_config(None, dict(pop_size=10, max_generations=8, seed=SEED))
+    ga = GeneticAlgorithm(data, params)
+    ga.run()
+    assert ga.stagnation_window is None
+    assert ga.restarts == 0
+    assert {h['mutation_rate'] for h in ga.history} == {ga.base_mutation_rate}
@@ -0,0 +1,83 @@
+import random
+import numpy as np
+import pytest
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.group_moves import day_shift_move, group_move, parallel_swap_move, sibling_free_slot
+from ga_core.incremental import IncrementalEvaluator
+from ga_core.repair import ENGINE_TABU
+from tests.conftest import small_params, EXTRA_CONSTRAINTS
+
+# ===============================
+# LANGKAH MAJEMUK (GRUP / SWAP / KEMPE)
+# ===============================
+# Langkah multi-gen dinilai dengan commit + rollback: delta harus sama dengan
+# perubahan sebenarnya, dan state evaluator tetap sama dengan rescore penuh.
+
+@pytest.fixture(params=[[], EXTRA_CONSTRAINTS], ids=["default", "constraints"])
+def engine(request, data):
+    ga = GeneticAlgorithm(data, small_params(
+        repair_engine=ENGINE_TABU, group_move_weight=0.3, constraints=request.param,
+    ))
+    ga.initialize_population()
+    return ga
+
+
+def _assert_consistent(ga, evaluator):
+    score, conflicts = ga.fitness_calc.calculate(evaluator.ind)
+    assert evaluator.hard_count == len(conflicts)
+    assert evaluator.fitness == pytest.approx(score, rel=1e-12)
+
+
+def test_group_moves_stay_in_domain(engine):
+    table = engine.table
+    rng = random.Random(1)
+    ind = engine.population[0]
+    grouped = np.flatnonzero(table.has_group)
+    assert len(grouped)
+    for gene in grouped.tolist():
+        for build in (day_shift_move, parallel_swap_move, group_move):
+            move = build(ind, gene, rng)
+            if move is None: continue
+            assert len({j for j, _ in move}) == len(move)
+            assert all(table.slot_domain_mask[j, kw['slot']] for j, kw in move)
+        s = sibling_free_slot(ind, gene, rng)
+        assert table.slot_domain_mask[gene, s]
+
+
+def test_day_shift_keeps_sessions_on_distinct_days(engine):
+    table = engine.table
+    rng = random.Random(2)
+    ind = engine.population[0].copy()
+    for gene in np.flatnonzero(table.session_group_of >= 0).tolist():
+        members = table.section(gene)
+        before = [int(table.slot_day[ind.slot_ids[j]]) for j in members]
+        move = day_shift_move(ind, gene, rng)
+        if move is None or len(set(before)) < len(before): continue
+        after = dict((j, kw['slot']) for j, kw in move)
+        days = [int(table.slot_day[after.get(int(j), ind.slot_ids[j])]) for j in members]
+        assert len(set(days)) == len(days)
+
+
+def test_compound_moves_keep_evaluator_consistent(engine):
+    repair = engine.repair_engine
+    rng = random.Random(3)
+    ind = engine.population[-1].copy()
+    evaluator = IncrementalEvaluator(engine.fitness_calc, ind)
+    grouped = np.flatnonzero(engine.table.has_group).tolist()
+    n_compound = 0
+    for step in range(300):
+        gene = rng.choice(grouped) if step % 2 else rng.randrange(len(ind))
+        move = repair.random_move(evaluator, gene, rng)
+        n_compound += len(move) > 1
+        penalty, hard = evaluator.penalty, evaluator.hard_count
+        genes = [getattr(ind, attr).copy() for attr in ind.GENE_ARRAYS]
+        delta = repair.move_delta(evaluator, move)
+        # Penilaian tidak mengubah state
+        assert evaluator.penalty == pytest.approx(penalty, abs=1e-9) and evaluator.hard_count == hard
+        assert all(np.array_equal(getattr(ind, attr), arr) for attr, arr in zip(ind.GENE_ARRAYS, genes))
+        repair.apply_move(evaluator, move)
+        assert evaluator.penalty - penalty == pytest.approx(delta, abs=1e-9)
+        if step % 25 == 0:
+            _assert_consistent(engine, evaluator)
+    _assert_consistent(engine, evaluator)
+    assert n_compound > 0
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.island import IslandModel, TOPOLOGY_RING, TOPOLOGY_FULL
+from tests.conftest import small_params
+
+# ===============================
+# ISLAND MODEL
+# ===============================
+
+def _params(**overrides):
+    return small_params(**dict(dict(islands=2, max_generations=4, migration_interval=2, pop_size=8), **overrides))
+
+
+def test_island_run_is_deterministic(data):
+    first = IslandModel(data, _params()).run()
+    second = IslandModel(data, _params()).run()
+    for attr in first.GENE_ARRAYS:
+        assert np.array_equal(getattr(first, attr), getattr(second, attr))
+    assert first.fitness == second.fitness
+
+
+@pytest.mark.parametrize("topology", [TOPOLOGY_RING, TOPOLOGY_FULL])
+def test_route_migrants(data, topology):
+    model = IslandModel(data, _params(islands=3, topology=topology, migration_size=1))
+    reports = [{"island": i, "fitness": f, "migrants": [f"m{i}"]} for i, f in enumerate((0.1, 0.3, 0.2))]
+    inbox = model._route_migrants(reports)
+    if topology == TOPOLOGY_RING:
+        assert inbox == {0: ["m2"], 1: ["m0"], 2: ["m1"]}
+    else:
+        # Tiap pulau menerima elite terbaik dari pulau lain
+        assert inbox == {0: ["m1"], 1: ["m2"], 2: ["m1"]}
+
+
+def test_import_migrants_replaces_worst(data):
+    source = GeneticAlgorithm(data, small_params(pop_size=8, seed=1))
+    source.initialize_population()
+    target = GeneticAlgorithm(data, small_params(pop_size=8, seed=2))
+    target.initialize_population()
+    migrants = source.export_migrants(2)
+    target.import_migrants(migrants)
+    assert len(target.population) == 8
+    for slot_ids, _, _ in migrants:
+        assert any(np.array_equal(ind.slot_ids, slot_ids) for ind in target.population)
+    assert target.best_individual.fitness >= source.population[0].fitness
+
+
+def test_island_stop_reason(data):
+    ga = GeneticAlgorithm(data, _params(max_generations=20, target_conflicts=10_000))
+    ga.run()
+    assert ga.stop_reason == "target_conflicts"
+
+
+def test_island_interrupt_returns_best(data, monkeypatch):
+    model = IslandModel(data, _params(max_generations=10))
+    receive = IslandModel._receive
+    calls = []
+
+    def interrupted(island_id, conn, proc):
+        calls.append(island_id)
+        if len(calls) > model.n_islands:
+            raise KeyboardInterrupt
+        return receive(island_id, conn, proc)
+
+    monkeypatch.setattr(IslandModel, "_receive", staticmethod(interrupted))
+    best = model.run()
+    assert model.stop_reason == "interrupted"
+    assert best is model.best_individual is not None
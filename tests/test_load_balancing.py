@@ -0,0 +1,54 @@
+import random
+import numpy as np
+import pytest
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.incremental import IncrementalEvaluator
+from ga_core.individual import Individual
+from tests.conftest import small_params, EXTRA_CONSTRAINTS
+
+# ===============================
+# LOAD BALANCING DOSEN
+# ===============================
+# Invarian: total SKS tetap, jumlah kuadrat beban tidak naik, konflik hard
+# tidak bertambah, dosen baru selalu kandidat MK, state evaluator = rescore.
+
+@pytest.fixture(params=[[], EXTRA_CONSTRAINTS], ids=["default", "constraints"])
+def engine(request, data):
+    return GeneticAlgorithm(data, small_params(constraints=request.param))
+
+
+def _loads(evaluator):
+    return evaluator.workload.copy()
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_balancing_invariants(engine, seed):
+    table = engine.table
+    rng = random.Random(seed)
+    ind = Individual(table)
+    ind.initialize_random(rng)
+    before_dosen = ind.dosen_ids.copy()
+    evaluator = IncrementalEvaluator(engine.fitness_calc, ind)
+    loads, hard = _loads(evaluator), evaluator.hard_count
+    assert evaluator.mean_load == pytest.approx(loads[loads > 0].mean())
+
+    engine.ls_engine.apply_load_balancing(ind, evaluator, rng=rng)
+
+    after = _loads(evaluator)
+    assert after.sum() == loads.sum()
+    assert (after.astype(float) ** 2).sum() <= (loads.astype(float) ** 2).sum()
+    assert evaluator.hard_count <= hard
+    changed = np.flatnonzero(ind.dosen_ids != before_dosen)
+    assert all(ind.dosen_ids[i] in table.candidates[i] for i in changed)
+    score, conflicts = engine.fitness_calc.calculate(ind)
+    assert ind.fitness == pytest.approx(score, rel=1e-12)
+    assert evaluator.hard_count == len(conflicts)
+
+
+def test_balancing_respects_max_moves(engine):
+    rng = random.Random(8)
+    ind = Individual(engine.table)
+    ind.initialize_random(rng)
+    before = ind.dosen_ids.copy()
+    engine.ls_engine.apply_load_balancing(ind, rng=rng, max_moves=1)
+    assert int((ind.dosen_ids != before).sum()) <= 1
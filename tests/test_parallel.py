@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.parallel import BACKEND_SERIAL, BACKEND_THREAD, BACKEND_PROCESS
+from tests.conftest import small_params
+
+# ===============================
+# BACKEND PRODUKSI ANAK
+# ===============================
+# Tiap pasangan orang tua membawa seed sendiri, jadi serial / thread / process
+# harus menghasilkan run yang identik untuk seed yang sama.
+
+def _run(data, backend):
+    ga = GeneticAlgorithm(data, small_params(backend=backend, workers=2))
+    best = ga.run()
+    return ga, best
+
+
+@pytest.fixture(scope="module")
+def serial_run(data):
+    return _run(data, BACKEND_SERIAL)
+
+
+@pytest.mark.parametrize("backend", [BACKEND_THREAD, BACKEND_PROCESS])
+def test_backend_matches_serial(data, serial_run, backend):
+    ref_ga, ref_best = serial_run
+    ga, best = _run(data, backend)
+    for attr in best.GENE_ARRAYS:
+        assert np.array_equal(getattr(best, attr), getattr(ref_best, attr))
+    assert best.fitness == ref_best.fitness
+    for ind, ref in zip(ga.population, ref_ga.population):
+        for attr in ind.GENE_ARRAYS:
+            assert np.array_equal(getattr(ind, attr), getattr(ref, attr))
+    assert [h['best_fitness'] for h in ga.history] == [h['best_fitness'] for h in ref_ga.history]
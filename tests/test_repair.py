@@ -0,0 +1,29 @@
+import random
+import pytest
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.incremental import IncrementalEvaluator
+from ga_core.individual import Individual
+from ga_core.repair import ENGINE_FIHC, ENGINE_TABU, ENGINE_ANNEALING
+from tests.conftest import small_params
+
+# ===============================
+# ENGINE REPAIR
+# ===============================
+# Repair tidak boleh menambah konflik hard dibanding input, dan state
+# evaluator sesudahnya harus sama dengan rescore penuh.
+
+@pytest.mark.parametrize("group_move_weight", [0.0, 0.2])
+@pytest.mark.parametrize("name", [ENGINE_FIHC, ENGINE_TABU, ENGINE_ANNEALING])
+def test_repair_never_adds_hard_conflicts(data, name, group_move_weight):
+    ga = GeneticAlgorithm(data, small_params(repair_engine=name, repair_iters=100, group_move_weight=group_move_weight))
+    rng = random.Random(5)
+    for _ in range(4):
+        ind = Individual(ga.table)
+        ind.initialize_random(rng)
+        before = ga.fitness_calc.calculate(ind)[1]
+        evaluator = IncrementalEvaluator(ga.fitness_calc, ind)
+        result = ga.repair_engine.repair(ind, evaluator, rng=rng)
+        score, conflicts = ga.fitness_calc.calculate(result)
+        assert len(conflicts) <= len(before)
+        assert result.n_conflicts == evaluator.hard_count == len(conflicts)
+        assert result.fitness == pytest.approx(score, rel=1e-12)
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+from ga_core.csv_export import export_schedule_to_csv
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.incremental import IncrementalEvaluator
+from ga_core.parallel import BACKEND_SERIAL, BACKEND_THREAD, BACKEND_PROCESS
+from ga_core.reschedule import ChangeSet, StabilityPenalty, Rescheduler, apply_changes, load_schedule_csv
+from tests.conftest import small_params
+
+# ===============================
+# RESCHEDULE INKREMENTAL
+# ===============================
+# Jadwal awal bebas konflik dari GA singkat, di-export ke CSV lalu diubah
+# (ruang ditutup, dosen berhalangan).
+
+@pytest.fixture(scope="module")
+def schedule(data, tmp_path_factory):
+    ga = GeneticAlgorithm(data, small_params(pop_size=16, max_generations=30, target_conflicts=0, seed_ratio=0.5))
+    best = ga.run()
+    assert best.n_conflicts == 0
+    path = str(tmp_path_factory.mktemp("reschedule") / "jadwal.csv")
+    export_schedule_to_csv(best, data, filename=path)
+    return best, path
+
+
+def _room_name(data, room_id):
+    return next(r['Ruang'] for r in data['rooms'] if r['room_id'] == room_id)
+
+
+def test_apply_changes(data):
+    room = data['rooms'][0]['Ruang']
+    slot = data['slots'][0]
+    dosen = data['classes'][0]['dosen']
+    changes = ChangeSet(removed_rooms=[room], blocked_slots=[(slot['Hari'], slot['Mulai'], slot['Selesai'])],
+                        unavailable_dosen=[dosen])
+    changed = apply_changes(data, changes)
+    assert room not in {r['Ruang'] for r in changed['rooms']}
+    assert slot['slot_id'] not in {s['slot_id'] for s in changed['slots']}
+    assert all(c['dosen'] != dosen for c in changed['classes'])
+    assert all(dosen not in names for names in changed['candidates'].values())
+    # Data asli tidak diubah
+    assert room in {r['Ruang'] for r in data['rooms']}
+
+
+def test_load_schedule_roundtrip(data, schedule):
+    best, path = schedule
+    ind, invalid = load_schedule_csv(path, best.table, data)
+    assert not invalid.any()
+    for attr in ind.GENE_ARRAYS:
+        assert np.array_equal(getattr(ind, attr), getattr(best, attr))
+
+
+def test_stability_penalty(schedule):
+    best, _ = schedule
+    exempt = np.zeros(len(best), dtype=bool)
+    exempt[:5] = True
+    penalty = StabilityPenalty(best, exempt, weight=10.0)
+    ind = best.copy()
+    assert penalty.cost(ind) == 0
+    move = [(0, {'slot': int(best.table.slot_domain[0][-1])}), (7, {'dosen': -1})]
+    delta = penalty.move_delta(ind, move)
+    for i, kwargs in move:
+        for key, value in kwargs.items():
+            getattr(ind, f"{key}_ids")[i] = value
+    assert penalty.cost(ind) == delta == 10.0
+
+
+def test_reschedule_removed_room(data, schedule):
+    best, path = schedule
+    room_id = int(best.room_ids[0])
+    changes = ChangeSet(removed_rooms=[_room_name(data, room_id)])
+    result, summary = Rescheduler(data, changes, small_params()).run(path)
+    assert summary["affected"] == int((best.room_ids == room_id).sum())
+    assert room_id not in set(result.room_ids.tolist())
+    assert summary["conflicts"] == result.n_conflicts == 0
+
+
+@pytest.mark.parametrize("backend", [BACKEND_SERIAL, BACKEND_THREAD, BACKEND_PROCESS])
+def test_fallback_keeps_unaffected_classes(data, schedule, backend):
+    best, path = schedule
+    room_id = int(best.room_ids[0])
+    changes = ChangeSet(removed_rooms=[_room_name(data, room_id)])
+    params = small_params(backend=backend, workers=2, pop_size=8, max_generations=3)
+    rescheduler = Rescheduler(data, changes, params)
+    baseline, invalid = load_schedule_csv(path, rescheduler.table, data)
+    affected = rescheduler.affected_mask(baseline, invalid)
+    start = baseline.copy()
+    for i in np.flatnonzero(invalid):
+        start.room_ids[i] = rescheduler.table.room_domain[i][0]
+    free = affected.copy()
+    free[IncrementalEvaluator(rescheduler.engine.fitness_calc, start).hard_genes()] = True
+    assert not free.all()
+
+    result = rescheduler._evolve(start, affected)
+    moved = (result.slot_ids != start.slot_ids) | (result.room_ids != start.room_ids) | (result.dosen_ids != start.dosen_ids)
+    assert not (moved & ~free).any()
+
+
+def test_reschedule_reassign(data, schedule):
+    best, path = schedule
+    table = best.table
+    i = next(i for i in range(len(best)) if len(table.candidates[i]) > 1)
+    current = table.dosen_names[best.dosen_ids[i]]
+    name = next(table.dosen_names[d] for d in table.candidates[i] if table.dosen_names[d] != current)
+    changes = ChangeSet(reassign={table.class_keys[i]: name})
+    result, summary = Rescheduler(data, changes, small_params()).run(path)
+    assert result.table.dosen_names[result.dosen_ids[i]] == name
+    assert summary["affected"] == 1
+
+
+def test_parse_reassign_keeps_commas_in_course_name():
+    import argparse
+    from ga_core.cli import _parse_reassign
+    assert _parse_reassign("IF101,Algoritma, Struktur Data,A=Budi") == (("IF101", "Algoritma, Struktur Data", "A"), "Budi")
+    with pytest.raises(argparse.ArgumentTypeError):
+        _parse_reassign("IF101,A=Budi")
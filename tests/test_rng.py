@@ -0,0 +1,31 @@
+import numpy as np
+from ga_core.config import DEFAULT_PARAMS
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.rng import resolve_seed, seed_sequence, spawn_seeds
+from tests.conftest import small_params
+
+# ===============================
+# SEED & RNG
+# ===============================
+
+def test_default_seed_is_random():
+    assert DEFAULT_PARAMS['seed'] is None
+
+
+def test_resolve_seed(capsys):
+    assert resolve_seed(123) == 123
+    assert capsys.readouterr().out == ""
+    drawn = resolve_seed(None)
+    assert isinstance(drawn, int) and 0 <= drawn < 2 ** 32
+    assert str(drawn) in capsys.readouterr().out
+
+
+def test_spawn_seeds_are_reproducible():
+    assert spawn_seeds(seed_sequence(5), 4) == spawn_seeds(seed_sequence(5), 4)
+    assert len(set(spawn_seeds(seed_sequence(5), 4))) == 4
+
+
+def test_same_seed_same_run(data):
+    runs = [GeneticAlgorithm(data, small_params(seed=99)).run() for _ in range(2)]
+    for attr in runs[0].GENE_ARRAYS:
+        assert np.array_equal(getattr(runs[0], attr), getattr(runs[1], attr))
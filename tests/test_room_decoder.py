@@ -0,0 +1,74 @@
+import random
+import numpy as np
+import pytest
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.incremental import IncrementalEvaluator
+from ga_core.individual import Individual
+from ga_core.telemetry import GenerationObserver
+from tests.conftest import small_params
+
+# ===============================
+# DECODER RUANG
+# ===============================
+# Kelas hanya boleh mendapat ruang terlalu kecil / bentrok jika SEMUA ruang
+# yang cukup sudah terisi kelas lain yang beririsan waktu dengannya.
+
+@pytest.fixture(scope="module")
+def engine(data):
+    return GeneticAlgorithm(data, small_params(room_decoder=True))
+
+
+def _check_feasibility(engine, slot_ids, rooms):
+    table, calc = engine.table, engine.fitness_calc
+    overlap = calc.slot_overlap
+    capacity = calc.room_capacity
+    assert set(rooms.tolist()) <= set(table.room_ids.tolist())
+    for i in range(table.n_classes):
+        others = np.flatnonzero(overlap[slot_ids[i], slot_ids])
+        others = others[others != i]
+        clash = (rooms[others] == rooms[i]).any()
+        too_small = table.jumlah_mhs[i] > capacity[rooms[i]]
+        if clash or too_small:
+            fitting = [r for r in table.room_ids if capacity[r] >= table.jumlah_mhs[i]]
+            assert all((rooms[others] == r).any() for r in fitting)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3, 4])
+def test_decoded_rooms_are_locally_feasible(engine, seed):
+    ind = Individual(engine.table)
+    ind.initialize_random(random.Random(seed))
+    rooms = engine.room_decoder.decode(ind.slot_ids)
+    assert rooms.dtype == np.int32 and len(rooms) == len(ind)
+    _check_feasibility(engine, ind.slot_ids, rooms)
+
+
+def test_slot_move_picks_free_fitting_room(engine):
+    rng = random.Random(12)
+    ind = Individual(engine.table)
+    ind.initialize_random(rng)
+    engine.room_decoder.apply(ind)
+    evaluator = IncrementalEvaluator(engine.fitness_calc, ind)
+    table, capacity = engine.table, engine.fitness_calc.room_capacity
+    for _ in range(100):
+        i = rng.randrange(len(ind))
+        move = engine.room_decoder.slot_move(evaluator, i, int(rng.choice(table.slot_domain[i])))
+        if 'room' in move:
+            assert capacity[move['room']] >= table.jumlah_mhs[i]
+            evaluator.commit(i, **move)
+            # Ruang baru kosong: kelas i tidak bentrok ruang di posisi barunya
+            assert evaluator.free_rooms(np.array([move['room']]), move['slot'], exclude=i)[0]
+            assert evaluator.room_load[move['room'], move['slot']] == 1
+        score, conflicts = engine.fitness_calc.calculate(ind)
+        assert evaluator.hard_count == len(conflicts)
+
+
+def test_room_decode_phase_in_telemetry(data):
+    records = []
+
+    class Observer(GenerationObserver):
+        def on_generation(self, record):
+            records.append(record)
+
+    ga = GeneticAlgorithm(data, small_params(room_decoder=True, max_generations=2), observers=[Observer()])
+    ga.run()
+    assert all(record["t_room_decode_s"] > 0 for record in records)
@@ -0,0 +1,52 @@
+import random
+import numpy as np
+import pytest
+from ga_core.config import DEFAULT_PARAMS
+from ga_core.fitness import KIND_DOSEN
+from ga_core.ga_engine import GeneticAlgorithm
+from ga_core.seeding import ConstructiveSeeder, seeded_individuals, METHOD_DSATUR, METHOD_GREEDY, METHOD_MIXED
+from tests.conftest import small_params
+
+# ===============================
+# SEEDING KONSTRUKTIF
+# ===============================
+
+@pytest.fixture(scope="module")
+def seeder(data):
+    ga = GeneticAlgorithm(data, small_params())
+    return ConstructiveSeeder(ga.table, ga.fitness_calc), ga
+
+
+@pytest.mark.parametrize("method", [METHOD_DSATUR, METHOD_GREEDY])
+def test_seeded_individual_is_feasible(seeder, method):
+    seeder, ga = seeder
+    table = ga.table
+    ind = seeder.build(method, random.Random(4))
+    assert all(table.slot_domain_mask[i, s] for i, s in enumerate(ind.slot_ids))
+    assert all(r in table.room_domain[i] for i, r in enumerate(ind.room_ids))
+    assert np.array_equal(ind.dosen_ids, table.initial_dosen)
+    ind.compute_fitness(ga.fitness_calc)
+    assert not [c for c in ind.conflicts if c.kind == KIND_DOSEN]
+
+
+def test_degree_counts_same_lecturer_classes(seeder):
+    seeder, ga = seeder
+    table = ga.table
+    dosen = table.initial_dosen
+    for i in range(table.n_classes):
+        expected = int(((dosen == dosen[i]).sum() - 1)) if table.dosen_known[dosen[i]] else 0
+        assert seeder.degree[i] == expected
+
+
+def test_mixed_alternates_methods(seeder):
+    seeder, _ = seeder
+    a = seeded_individuals(seeder, 2, METHOD_MIXED, random.Random(1))
+    b = [seeder.build(METHOD_DSATUR, random.Random(1))]
+    assert np.array_equal(a[0].slot_ids, b[0].slot_ids)
+    assert len(a) == 2
+
+
+def test_no_seeding_by_default(data):
+    assert DEFAULT_PARAMS['seed_ratio'] == 0.0
+    ga = GeneticAlgorithm(data, small_params())
+    assert ga._new_individuals(6)[1] == 0